@@ -1,14 +1,8 @@
-from rich.console import Console
-
-console = Console()
+from multiprocessing import freeze_support
 
 # ! Start
 if __name__ == "__main__":
-    try:
-        from seaplayer.seaplayer import SeaPlayer
-        
-        app = SeaPlayer()
-        app.run()
-        app.started = False
-    except:
-        console.print_exception(word_wrap=True, show_locals=True)
\ No newline at end of file
+    # * The image render processes are started from the same executable in the build
+    freeze_support()
+    from seaplayer.__main__ import run
+    run()
@@ -0,0 +1,74 @@
+"""Render time of the cover art at common terminal sizes for every `image.image_update_method`.
+
+Usage: python benchmarks/image_render.py [--repeat N] [--resample NAME]
+"""
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+# > Image Works
+from PIL import Image
+from PIL.Image import Resampling
+from ripix import Pixels, AsyncPixels
+# > Typing
+from typing import Callable, Tuple, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from seaplayer.modules.halfblock import HalfBlockPixels
+from seaplayer.types.ImagePool import ImageProcessPool
+
+# ! Vars
+SIZES: List[Tuple[int, int]] = [(40, 20), (80, 24), (120, 40), (200, 60), (300, 80)]
+"""The sizes of the image widget in cells (width, height)."""
+
+# ! Functions
+def gradient_cover(size: int=1000) -> Image.Image:
+    """A gradient with a flat stripe: almost every cell has its own colors, the worst case for merging the cells."""
+    image = Image.radial_gradient("L").resize((size, size))
+    image = Image.merge("RGB", (image, image.rotate(90), image.rotate(180)))
+    image.paste((16, 16, 16), (0, 0, size, size // 10))
+    return image
+
+def flat_cover(size: int=1000) -> Image.Image:
+    """Large areas of a few flat colors, like a typical minimalistic cover art."""
+    image = Image.new("RGB", (size, size), (24, 24, 32))
+    for index, color in enumerate([(200, 40, 40), (240, 200, 60), (40, 120, 200)]):
+        offset = size // 8 * (index + 1)
+        image.paste(color, (offset, offset, size - offset, size - offset * 2 // 3))
+    return image
+
+def measure(render: Callable[[], object], repeat: int) -> float:
+    render()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--resample", default="NEAREST", choices=[r.name for r in Resampling])
+    args = parser.parse_args()
+    resample = Resampling[args.resample]
+    pool = ImageProcessPool()
+    methods = {
+        "sync": lambda image, size: Pixels.from_image(image, size, resample),
+        "async": lambda image, size: asyncio.run(AsyncPixels.from_image(image, size, resample)),
+        "process": lambda image, size: asyncio.run(pool.aio_render(image, size, resample)),
+        "vector": lambda image, size: HalfBlockPixels.from_image(image, size, resample),
+    }
+    for cover in (gradient_cover, flat_cover):
+        image = cover()
+        print(f"{cover.__name__} ({args.resample}, best of {args.repeat}):")
+        print(f"{'size':>9} " + " ".join(f"{name+' ms':>10}" for name in methods) + f" {'speedup':>8}")
+        for size in SIZES:
+            results = [measure(lambda: render(image, size), args.repeat) for render in methods.values()]
+            print(f"{size[0]:>4}x{size[1]:<4} " + " ".join(f"{ms:>10.2f}" for ms in results) + f" {results[0]/results[-1]:>7.1f}x")
+        print()
+    pool.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""Throughput of adding sounds to the playlist: the whole pipeline from the glob to the mounted playlist rows, on synthetic corpora.
+
+The corpora are generated on the disk (WAV, OGG, FLAC, MP3, MIDI in turn, every file is unique), then every size
+is added to a headless SeaPlayer in a fresh process with an empty library, so the peak RSS belongs to this size only.
+
+Usage:
+    python benchmarks/ingest.py [--sizes 100 1000 10000] [--formats wav ogg flac mp3 mid] [--corpus-dir DIR] [--output FILE]
+"""
+import os
+import sys
+import json
+import math
+import time
+import struct
+import asyncio
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+# > Typing
+from typing import Callable, Optional, Dict, List, Any
+
+ROOT = Path(__file__).parent.parent
+FORMATS = ["wav", "ogg", "flac", "mp3", "mid"]
+STAGES = ["glob", "sniff", "codec_init", "hash", "widget_mount"]
+SAMPLERATE = 22050
+DURATION = 0.5
+
+# ! Corpus Generation
+def id3_tag(title: str) -> bytes:
+    """A minimal ID3v2.3 tag with the title (the MP3 codec is recognized by it)."""
+    text = b"\x00" + title.encode("latin-1")
+    frame = b"TIT2" + struct.pack(">I", len(text)) + b"\x00\x00" + text
+    size = len(frame)
+    synchsafe = bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+    return b"ID3\x03\x00\x00" + synchsafe + frame
+
+def midi_file(index: int) -> bytes:
+    """A format 0 MIDI file with one note and the index in a text event."""
+    text = f"seaplayer-bench-{index}".encode("ascii")
+    note = 36 + index % 60
+    events = (
+        b"\x00\xFF\x01" + bytes([len(text)]) + text +
+        b"\x00\xFF\x51\x03\x07\xA1\x20" +
+        b"\x00\x90" + bytes([note, 100]) +
+        b"\x83\x60\x80" + bytes([note, 0]) +
+        b"\x00\xFF\x2F\x00"
+    )
+    return b"MThd" + struct.pack(">IHHH", 6, 0, 1, 480) + b"MTrk" + struct.pack(">I", len(events)) + events
+
+def write_sound(path: Path, fmt: str, index: int) -> None:
+    if fmt == "mid":
+        path.write_bytes(midi_file(index))
+        return
+    import numpy as np
+    import soundfile
+    # * Every file has its own frequency, so the hashes differ
+    frequency = 110.0 + index * 0.5
+    t = np.arange(int(SAMPLERATE * DURATION)) / SAMPLERATE
+    data = (0.3 * np.sin(2 * math.pi * frequency * t)).astype(np.float32)
+    if fmt == "mp3":
+        with open(path, "wb") as file:
+            file.write(id3_tag(f"seaplayer-bench-{index}"))
+            soundfile.write(file, data, SAMPLERATE, format="MP3")
+    else:
+        soundfile.write(str(path), data, SAMPLERATE, format={"wav": "WAV", "ogg": "OGG", "flac": "FLAC"}[fmt])
+
+def generate_corpus(dirpath: Path, size: int, formats: List[str]) -> Path:
+    """Generating the corpus (or reusing the one generated with the same parameters)."""
+    corpus = dirpath / f"corpus-{size}-{'-'.join(formats)}"
+    manifest = corpus / "manifest.json"
+    if manifest.exists() and (json.loads(manifest.read_text()) == {"size": size, "formats": formats}):
+        return corpus
+    corpus.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    for index in range(size):
+        fmt = formats[index % len(formats)]
+        write_sound(corpus / f"sound-{index:05d}.{fmt}", fmt, index)
+    manifest.write_text(json.dumps({"size": size, "formats": formats}))
+    print(f"Generated {size} files in {time.perf_counter() - start:.1f} s: {corpus}")
+    return corpus
+
+# ! Measurement (runs in the child process)
+def peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # * Kilobytes on Linux, bytes on macOS
+    return peak / (1048576 if (sys.platform == "darwin") else 1024)
+
+def measure_ingest(corpus: Path) -> Dict[str, Any]:
+    import glob
+    import seaplayer.codecs as codecs
+    import seaplayer.seaplayer as module
+    module.ENABLE_PLUGIN_SYSTEM = False
+    stages: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+
+    def timed(stage: str, func: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stages[stage].append(time.perf_counter() - start)
+        return wrapper
+
+    def atimed(stage: str, func: Callable) -> Callable:
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                stages[stage].append(time.perf_counter() - start)
+        return wrapper
+
+    def timed_codec(codec: type) -> type:
+        attrs: Dict[str, Any] = {}
+        for name in ("is_this_codec", "aio_is_this_codec"):
+            if name in dir(codec):
+                func = getattr(codec, name)
+                attrs[name] = staticmethod(atimed("sniff", func) if asyncio.iscoroutinefunction(func) else timed("sniff", func))
+        if hasattr(codec, "__aio_init__"):
+            attrs["__aio_init__"] = staticmethod(atimed("codec_init", codec.__aio_init__))
+        else:
+            def __init__(self, *args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    codec.__init__(self, *args, **kwargs)
+                finally:
+                    stages["codec_init"].append(time.perf_counter() - start)
+            attrs["__init__"] = __init__
+        return type(codec.__name__, (codec,), attrs)
+
+    glob.glob = timed("glob", glob.glob)
+    # * The app imports the codecs when it needs them, so the function is replaced in their package
+    codecs.read_header = timed("sniff", codecs.read_header)
+    app = module.SeaPlayer()
+    app.env["seaplayer"]["codecs"] = [timed_codec(codec) for codec in app.env["seaplayer"]["codecs"]]
+    app.library.sha1 = timed("hash", app.library.sha1)
+
+    async def run() -> Dict[str, Any]:
+        async with app.run_test(size=(120, 40)) as pilot:
+            app.playlist_view.aio_add_sounds = atimed("widget_mount", app.playlist_view.aio_add_sounds)
+            start = time.perf_counter()
+            await app.adding_sounds_handler(os.path.join(str(corpus), "sound-*"))
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            elapsed = time.perf_counter() - start
+            return {"elapsed": elapsed, "added": len(app.playlist_view.sounds)}
+
+    result = asyncio.run(run())
+    result["stages"] = {
+        stage: {
+            "calls": len(times),
+            "total": sum(times),
+            "mean": statistics.mean(times) if times else 0.0,
+            "p95": sorted(times)[int(len(times) * 0.95)] if times else 0.0,
+        }
+        for stage, times in stages.items()
+    }
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+# ! Runner
+def run_size(corpus: Path, config_dirpath: str) -> Dict[str, Any]:
+    env = os.environ.copy()
+    env.update({
+        "PYTHONPATH": os.pathsep.join([str(ROOT), env.get("PYTHONPATH", "")]),
+        "XDG_CONFIG_HOME": config_dirpath,
+        "APPDATA": config_dirpath,
+        "LOCALAPPDATA": config_dirpath,
+    })
+    result = subprocess.run(
+        [sys.executable, __file__, "--measure", str(corpus)],
+        capture_output=True, text=True, env=env, cwd=str(ROOT)
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"The ingestion of {corpus} has failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def print_result(size: int, result: Dict[str, Any]) -> None:
+    rss = result["peak_rss_mb"]
+    print(
+        f"\n{size} files: added {result['added']} in {result['elapsed']:.2f} s "
+        f"({result['added'] / result['elapsed']:.1f} files/s), peak RSS {'-' if rss is None else f'{rss:.0f} MB'}"
+    )
+    print(f"{'stage':>14} {'calls':>7} {'total, s':>9} {'mean, ms':>9} {'p95, ms':>9}")
+    for stage, stats in result["stages"].items():
+        print(f"{stage:>14} {stats['calls']:>7} {stats['total']:>9.2f} {stats['mean']*1000:>9.2f} {stats['p95']*1000:>9.2f}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--measure", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=FORMATS)
+    parser.add_argument("--corpus-dir", type=Path, default=None, help="Where the corpora are kept between runs. Defaults to a temporary directory.")
+    parser.add_argument("--output", type=Path, default=None, help="The JSON file of the results.")
+    args = parser.parse_args()
+    if args.measure is not None:
+        print(json.dumps(measure_ingest(args.measure)))
+        return
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as temp_dirpath:
+        corpus_dirpath = args.corpus_dir or Path(temp_dirpath)
+        for size in args.sizes:
+            corpus = generate_corpus(corpus_dirpath, size, args.formats)
+            # * Every size starts with an empty library
+            with tempfile.TemporaryDirectory() as config_dirpath:
+                results[str(size)] = run_size(corpus, config_dirpath)
+            print_result(size, results[str(size)])
+    if args.output is not None:
+        report = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "formats": args.formats,
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nSaved to {args.output}")
+
+if __name__ == "__main__":
+    main()
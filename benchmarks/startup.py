@@ -0,0 +1,170 @@
+"""Start time of the SeaPlayer: the import, the construction of the app, the languages, and the first frame in the headless mode.
+
+Every measurement runs in a fresh process (the imports are cold), with the configuration directory in a temporary place.
+
+Usage:
+    python benchmarks/startup.py [--repeat N] [--output FILE] [--compare FILE] [--threshold PERCENT]
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+# > Typing
+from typing import Callable, Optional, Dict, List, Any
+
+ROOT = Path(__file__).parent.parent
+RESULTS_DIRPATH = Path(__file__).parent / "results"
+
+# ! Measurements (run in the child process)
+def measure_import() -> float:
+    start = time.perf_counter()
+    import seaplayer.seaplayer
+    return time.perf_counter() - start
+
+def construct_app(plugins: bool) -> float:
+    import seaplayer.seaplayer as module
+    module.ENABLE_PLUGIN_SYSTEM = plugins
+    start = time.perf_counter()
+    module.SeaPlayer()
+    return time.perf_counter() - start
+
+def measure_language_loader() -> float:
+    from seaplayer.languages import LanguageLoader
+    from seaplayer.units import LANGUAGES_DIRPATH
+    start = time.perf_counter()
+    LanguageLoader(LANGUAGES_DIRPATH, "en-eng")
+    return time.perf_counter() - start
+
+def measure_language_loader_cached() -> float:
+    """The languages with the compiled tables (the first run of the suite compiles them)."""
+    from seaplayer.languages import LanguageLoader
+    from seaplayer.units import LANGUAGES_DIRPATH, CACHE_DIRPATH
+    start = time.perf_counter()
+    LanguageLoader(LANGUAGES_DIRPATH, "en-eng", cache_dirpath=os.path.join(CACHE_DIRPATH, "langs"))
+    return time.perf_counter() - start
+
+def measure_first_compose() -> float:
+    """From the construction of the app to the moment when the headless app is ready (composed and refreshed)."""
+    import seaplayer.seaplayer as module
+    module.ENABLE_PLUGIN_SYSTEM = False
+    async def run() -> float:
+        start = time.perf_counter()
+        app = module.SeaPlayer()
+        async with app.run_test(size=(120, 40)):
+            elapsed = time.perf_counter() - start
+        return elapsed
+    return asyncio.run(run())
+
+def measure_cold_start() -> float:
+    """From the first import to the moment when the headless app is ready."""
+    start = time.perf_counter()
+    import seaplayer.seaplayer as module
+    module.ENABLE_PLUGIN_SYSTEM = False
+    async def run() -> None:
+        async with module.SeaPlayer().run_test(size=(120, 40)):
+            pass
+    asyncio.run(run())
+    return time.perf_counter() - start
+
+MEASUREMENTS: Dict[str, Callable[[], float]] = {
+    "import": measure_import,
+    "construct_with_plugins": lambda: construct_app(True),
+    "construct_without_plugins": lambda: construct_app(False),
+    "language_loader": measure_language_loader,
+    "language_loader_cached": measure_language_loader_cached,
+    "first_compose": measure_first_compose,
+    "cold_start": measure_cold_start,
+}
+
+# ! Runner
+def run_measurement(name: str, config_dirpath: str) -> float:
+    env = os.environ.copy()
+    env.update({
+        "PYTHONPATH": os.pathsep.join([str(ROOT), env.get("PYTHONPATH", "")]),
+        "XDG_CONFIG_HOME": config_dirpath,
+        "APPDATA": config_dirpath,
+        "LOCALAPPDATA": config_dirpath,
+    })
+    result = subprocess.run(
+        [sys.executable, __file__, "--measure", name],
+        capture_output=True, text=True, env=env, cwd=str(ROOT)
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"The measurement {repr(name)} has failed:\n{result.stderr}")
+    return float(result.stdout.strip().splitlines()[-1])
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=str(ROOT), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(names: List[str], repeat: int) -> Dict[str, Any]:
+    results = {}
+    with tempfile.TemporaryDirectory() as config_dirpath:
+        for name in names:
+            # * The first run creates the configuration and the caches, it is not counted
+            run_measurement(name, config_dirpath)
+            runs = [run_measurement(name, config_dirpath) for _ in range(repeat)]
+            results[name] = {
+                "min": min(runs),
+                "median": statistics.median(runs),
+                "runs": runs,
+            }
+            print(f"{name:>26}: median {results[name]['median']*1000:8.1f} ms, min {results[name]['min']*1000:8.1f} ms")
+    return {
+        "commit": git_commit(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any], threshold: float) -> bool:
+    """Printing the difference of the medians, returns `False` if any of them has grown more than by `threshold` percent."""
+    passed = True
+    print(f"\nCompared with {previous.get('commit')} ({previous.get('time')}):")
+    for name, result in current["results"].items():
+        if (old:=previous["results"].get(name)) is None:
+            continue
+        change = (result["median"] - old["median"]) / old["median"] * 100
+        regression = change > threshold
+        passed = passed and not regression
+        print(f"{name:>26}: {old['median']*1000:8.1f} -> {result['median']*1000:8.1f} ms ({change:+.1f}%){' REGRESSION' if regression else ''}")
+    return passed
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--measure", choices=list(MEASUREMENTS), help=argparse.SUPPRESS)
+    parser.add_argument("--only", nargs="+", choices=list(MEASUREMENTS), default=list(MEASUREMENTS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=None, help="Defaults to benchmarks/results/startup-<commit>.json.")
+    parser.add_argument("--compare", type=Path, default=None, help="The results of another run to compare with.")
+    parser.add_argument("--threshold", type=float, default=10.0, help="The allowed growth of a median in percent.")
+    args = parser.parse_args()
+    if args.measure is not None:
+        print(MEASUREMENTS[args.measure]())
+        return
+    report = run_suite(args.only, args.repeat)
+    output = args.output or RESULTS_DIRPATH / f"startup-{report['commit'] or 'unknown'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nSaved to {output}")
+    if args.compare is not None:
+        previous = json.loads(args.compare.read_text(encoding="utf-8"))
+        if not compare(report, previous, args.threshold):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
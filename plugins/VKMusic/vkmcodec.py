@@ -1,4 +1,3 @@
-import asyncio
 from vkpymusic import Service, Song
 from seaplayer.codecs.URLS import URLSoundCodec
 from seaplayer.codecs.AnySound import AnySound
@@ -64,11 +63,24 @@ class VKMCodec(URLSoundCodec):
         vkm_service: Optional[Service]=None,
         **kwargs
     ):
-        self = VKMCodec(url, vkm_service=vkm_service, sound_device_id=sound_device_id, aio_init=True)
-        self._sound = await asyncio.to_thread(AnySound.from_url, self.song.url, device_id=sound_device_id, **kwargs)
+        self = VKMCodec(url, vkm_service=vkm_service, sound_device_id=sound_device_id, aio_init=True, **kwargs)
+        await self.aio_prepare()
         return self
     
+    # ! Sound Loading
+    def load_sound(self) -> AnySound:
+        return AnySound.from_url(self.song.url, key=self.cache_key, device_id=self.sound_device_id, **self.sound_kwargs)
+    
     # ! Properys
+    @property
+    def cache_key(self) -> str:
+        """The key of the song in the files cache (the song URLs are temporary, so the song is identified by its ID)."""
+        return f"vkm://{self.song.owner_id}_{self.song.track_id}"
+    
+    @property
+    def identity_key(self) -> str:
+        return self.cache_key
+    
     @property
     def title(self) -> str:
         return self._title
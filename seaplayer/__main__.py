@@ -1,17 +1,33 @@
-from .seaplayer import SeaPlayer
+import click
 from rich.console import Console
+# > Local Imports
+from .modules.startup import startup
 
 console = Console()
 
 # ! Run Functions
-def run() -> None:
+@click.command(help="Starting the SeaPlayer.")
+@click.option(
+    "--profile-startup", "profile_startup",
+    help="Printing the timeline of the imports and the initialization until the first frame (after the exit).",
+    is_flag=True, default=False
+)
+def run(profile_startup: bool) -> None:
+    if profile_startup:
+        startup.enable()
     try:
-        app = SeaPlayer()
+        from .seaplayer import SeaPlayer
+        with startup.span("SeaPlayer.__init__"):
+            app = SeaPlayer()
         app.run()
         app.started = False
     except:
         console.print_exception(word_wrap=True, show_locals=True)
+    finally:
+        if profile_startup:
+            startup.disable()
+            startup.print(console)
 
 # ! Start
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()
@@ -1,22 +1,78 @@
 import os
+import asyncio
 import hashlib
 import aiofiles
 # > Sound Works
 from .AnySound import AnySound
+from .Sniffer import probe_info
 # > Typing
-from typing import Optional
+from typing import Optional, Dict, Any, Callable
 # > Local Imports
 from ..codeсbase import CodecBase
+from ..types import LivePool, SoundRecord, PlaybackWatcher
 
+# ! Vars
+live_sounds = LivePool(4)
+"""The pool of the codecs whose sounds are opened. The sounds of the least recently used codecs are released."""
 
+# ! Main Class
 class AnyCodec(CodecBase):
     codec_name: str = "Any"
     codec_priority: float=1024
+    sound_releasable: bool=True
+    """If `True`, the sound can be released and opened again on demand, while the codec remains in the playlist as a lightweight descriptor."""
+    sound_probed: bool=True
+    """If `True`, the info of the added file is read from its headers (`AnyCodec.from_probe`), and the sound is opened only when it is needed."""
     
     # ! Initialized
-    def __init__(self, path: str, sound_device_id: Optional[int]=None, **kwargs) -> None:
+    def __init__(self, path: str, sound_device_id: Optional[int]=None, lazy: bool=False, **kwargs) -> None:
         self.name = os.path.abspath(path)
-        self._sound = AnySound(self.name, device_id=sound_device_id)
+        self._init_state(sound_device_id, kwargs)
+        if not lazy:
+            self.prepare()
+    
+    def _init_state(self, sound_device_id: Optional[int], sound_kwargs: Dict[str, Any]) -> None:
+        """Initialization of everything that does not depend on the path (the codecs with their own `name` call it instead of `AnyCodec.__init__`)."""
+        self.sound_device_id = sound_device_id
+        self.sound_kwargs: Dict[str, Any] = sound_kwargs
+        self._sound: Optional[AnySound] = None
+        self._info: Dict[str, Any] = {}
+        self._volume: Optional[float] = None
+        self.watcher = PlaybackWatcher(self.get_remaining, lambda: self.playing)
+    
+    @classmethod
+    def from_record(cls, record: SoundRecord, sound_device_id: Optional[int]=None, **kwargs):
+        """Creating a codec from the library record without opening the sound.
+        
+        Args:
+            record (SoundRecord): The record of the sound from the library index.
+            sound_device_id (Optional[int], optional): ID of the audio output device. Defaults to None.
+        
+        Returns:
+            AnyCodec: The codec whose sound will be opened on demand.
+        """
+        self = cls.__new__(cls)
+        AnyCodec.__init__(self, record.path, sound_device_id, lazy=True, **kwargs)
+        self._info = record.model_dump(include={"duration", "channels", "samplerate", "bitrate", "title", "artist", "album"})
+        return self
+    
+    @classmethod
+    def from_probe(cls, path: str, sound_device_id: Optional[int]=None, **kwargs):
+        """Creating a codec from the info read from the headers of the file without decoding the sound.
+        
+        Args:
+            path (str): File path.
+            sound_device_id (Optional[int], optional): ID of the audio output device. Defaults to None.
+        
+        Returns:
+            Optional[AnyCodec]: The codec whose sound will be opened on demand, or `None` if the headers could not be read.
+        """
+        if (info:=probe_info(path)) is None:
+            return None
+        self = cls.__new__(cls)
+        AnyCodec.__init__(self, path, sound_device_id, lazy=True, **kwargs)
+        self._info = info
+        return self
     
     def __sha1__(self, buffer_size: int) -> str:
         sha1 = hashlib.sha1()
@@ -36,38 +92,133 @@ class AnyCodec(CodecBase):
                 sha1.update(data)
         return sha1.hexdigest()
     
+    # ! Sound Loading
+    def load_sound(self) -> AnySound:
+        """Opening the sound (overridden by codecs whose sound is created differently)."""
+        return AnySound(self.name, device_id=self.sound_device_id)
+    
+    async def aio_load_sound(self) -> AnySound:
+        return await asyncio.to_thread(self.load_sound)
+    
+    def set_sound(self, sound: AnySound) -> None:
+        if self._volume is not None:
+            sound.set_volume(self._volume)
+        self._sound = sound
+        self._info = {
+            "duration": sound.duration,
+            "channels": sound.channels,
+            "samplerate": sound.samplerate,
+            "bitrate": sound.bitrate,
+            "title": sound.title,
+            "artist": sound.artist,
+            "album": sound.album
+        }
+        if self.sound_releasable:
+            live_sounds.touch(self)
+    
+    @property
+    def sound(self) -> AnySound:
+        """The opened sound (it is opened if it has been released)."""
+        if self._sound is None:
+            self.set_sound(self.load_sound())
+        return self._sound
+    
+    @property
+    def prepared(self) -> bool:
+        return self._sound is not None
+    
+    def prepare(self) -> None:
+        if self._sound is None:
+            self.set_sound(self.load_sound())
+        elif self.sound_releasable:
+            live_sounds.touch(self)
+    
+    async def aio_prepare(self) -> None:
+        if self._sound is None:
+            self.set_sound(await self.aio_load_sound())
+        elif self.sound_releasable:
+            live_sounds.touch(self)
+    
+    def release(self) -> bool:
+        if (self._sound is None) or (not self.sound_releasable) or self._sound.playing:
+            return False
+        self.watcher.stop()
+        self._sound = None
+        live_sounds.discard(self)
+        return True
+    
+    def get_info(self, key: str) -> Any:
+        if self._sound is None:
+            if key in self._info:
+                return self._info[key]
+            self.prepare()
+        return self._info[key]
+    
     # ! Info
     @property
-    def duration(self) -> float: return self._sound.duration
+    def duration(self) -> float: return self.get_info("duration")
     @property
-    def channels(self) -> int: return self._sound.channels
+    def channels(self) -> int: return self.get_info("channels")
     @property
-    def samplerate(self) -> int: return self._sound.samplerate
+    def samplerate(self) -> int: return self.get_info("samplerate")
     @property
-    def bitrate(self) -> int: return self._sound.bitrate
+    def bitrate(self) -> int: return self.get_info("bitrate")
     
     # ! Playback Info
     @property
-    def playing(self) -> bool: return self._sound.playing
+    def playing(self) -> bool: return (self._sound is not None) and self._sound.playing
     @property
-    def paused(self) -> bool: return self._sound.paused
+    def paused(self) -> bool: return (self._sound is not None) and self._sound.paused
     
     # ! Sound Info
     @property
-    def title(self) -> Optional[str]: return self._sound.title
+    def title(self) -> Optional[str]: return self.get_info("title")
     @property
-    def artist(self) -> Optional[str]: return self._sound.artist
+    def artist(self) -> Optional[str]: return self.get_info("artist")
     @property
-    def album(self) -> Optional[str]: return self._sound.album
+    def album(self) -> Optional[str]: return self.get_info("album")
     @property
-    def icon_data(self) -> Optional[bytes]: return self._sound.icon_data
+    def icon_data(self) -> Optional[bytes]: return self.sound.icon_data
+    
+    # ! Callbacks
+    def add_finish_callback(self, callback: Callable[[], None], before: float=0.0) -> bool:
+        self.watcher.add_callback(callback, before)
+        return True
+    
+    def remove_finish_callback(self, callback: Callable[[], None]) -> None:
+        self.watcher.remove_callback(callback)
+    
+    def get_remaining(self) -> float:
+        if self._sound is None:
+            return 0.0
+        return max(0.0, self._sound.duration - self._sound.get_position())
     
     # ! Functions
-    def play(self) -> None: self._sound.play()
-    def stop(self) -> None: self._sound.stop()
-    def pause(self) -> None: self._sound.pause()
-    def unpause(self) -> None: self._sound.unpause()
-    def get_volume(self) -> float: return self._sound.get_volume()
-    def set_volume(self, value: float) -> None: self._sound.set_volume(value)
-    def get_pos(self) -> float: return self._sound.get_position()
-    def set_pos(self, value: float) -> None: self._sound.set_position(value)
\ No newline at end of file
+    def play(self) -> None:
+        self.prepare()
+        self._sound.play()
+        self.watcher.start()
+    def stop(self) -> None:
+        self.watcher.stop()
+        if self._sound is not None: self._sound.stop()
+    def pause(self) -> None:
+        self.watcher.stop()
+        if self._sound is not None: self._sound.pause()
+    def unpause(self) -> None:
+        if self._sound is not None:
+            self._sound.unpause()
+            self.watcher.start()
+    def get_volume(self) -> float:
+        if self._sound is not None: return self._sound.get_volume()
+        return self._volume if (self._volume is not None) else 1.0
+    def set_volume(self, value: float) -> None:
+        self._volume = value
+        if self._sound is not None: self._sound.set_volume(value)
+    def get_pos(self) -> float:
+        if self._sound is not None: return self._sound.get_position()
+        return 0.0
+    def set_pos(self, value: float) -> None:
+        if self._sound is not None:
+            self._sound.set_position(value)
+            if self._sound.playing and not self._sound.paused:
+                self.watcher.start()
\ No newline at end of file
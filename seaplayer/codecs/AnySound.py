@@ -1,23 +1,97 @@
 import os
 import asyncio
-import aiofiles
 import subprocess
 from tempfile import mkstemp
-# > IO's
-from urlopen2 import URLFile, AsyncURLFile
 # > Sound Works
 from playsoundsimple import Sound
 from playsoundsimple.sound import FPType, getfp
 from playsoundsimple.units import DEFAULT_SOUND_FONTS_PATH
 from playsoundsimple.exceptions import FileTypeError
 # > Typing
-from typing import Optional
+from typing import Optional, Union
+# > Local Imports
+from ..types import ProgressiveDownload, FilesCache, CacheEntry, SynthStream, RenderScheduler
 
 # ! Vars
 FLUID_SYNTH_PATH = 'fluidsynth'
+FLUID_SYNTH_ARGS = ("-q",)
+"""The additional arguments of the synthesizer (they are a part of the key of the rendered MIDI in the cache)."""
+render_scheduler = RenderScheduler()
+"""The scheduler of the synthesizer processes shared by all MIDI sounds."""
+
+# ! Functions
+def remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
 # ! Main Class
 class AnySound(Sound):
+    url_prebuffer_size: Optional[int]=None
+    """If set (and not `0`), the sounds from URLs start playing once that many bytes are downloaded, the rest is downloaded in the background (otherwise the whole file is downloaded first)."""
+    files_cache: Optional[FilesCache]=None
+    """If set, the downloaded sounds are saved to this cache, and the sounds from URLs are taken from it while they have not changed."""
+    midi_cache: Optional[FilesCache]=None
+    """If set, the MIDI rendered by the synthesizer is saved to this cache, and the same MIDI with the same sound font is not rendered again."""
+    midi_streaming: bool=False
+    """If `True`, the MIDI starts playing while the synthesizer renders it, otherwise the whole MIDI is rendered first."""
+    
+    @staticmethod
+    def open_url(url: str, key: Optional[str]=None) -> Union[CacheEntry, ProgressiveDownload]:
+        """Opening the URL through the files cache.
+        
+        Args:
+            url (str): The URL of the sound.
+            key (Optional[str], optional): The key of the sound in the cache. Defaults to None (the URL).
+        
+        Returns:
+            Union[CacheEntry, ProgressiveDownload]: The cache entry, if the sound has not changed, otherwise the download (it is saved to the cache when finished).
+        """
+        cache, key = AnySound.files_cache, key or url
+        if cache is None:
+            return ProgressiveDownload(url)
+        headers = {}
+        if (entry:=cache.get(key)) is not None:
+            if cache.is_fresh(entry):
+                return entry
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+        try:
+            stream = ProgressiveDownload(url, headers=headers)
+        except OSError:
+            if entry is None:
+                raise
+            # * The server is unavailable, the cached sound is better than nothing
+            return entry
+        if stream.not_modified and (entry is not None):
+            stream.close()
+            cache.checked(key)
+            return entry
+        stream.add_finish_callback(lambda s: cache.put(key, s.path, s.etag, s.last_modified))
+        return stream
+    
+    @staticmethod
+    def midi_cache_key(path: str, sound_fonts_path: str) -> str:
+        """The key of the rendered MIDI in the cache: the hash of the MIDI, the sound font with its modification time and the synthesizer arguments."""
+        try:
+            sound_fonts_mtime = os.stat(sound_fonts_path).st_mtime_ns
+        except OSError:
+            sound_fonts_mtime = None
+        return f"midi:{FilesCache.file_sha1(path)}:{os.path.abspath(sound_fonts_path)}:{sound_fonts_mtime}:{' '.join(FLUID_SYNTH_ARGS)}"
+    
+    @staticmethod
+    def stream_midi(path: str, sound_fonts_path: str, key: Optional[str]=None, is_temp: bool=False, **kwargs):
+        stream = SynthStream(path, sound_fonts_path, FLUID_SYNTH_PATH, FLUID_SYNTH_ARGS, is_temp=is_temp, scheduler=render_scheduler)
+        if key is not None:
+            stream.add_finish_callback(lambda s: AnySound.midi_cache.put(key, s.path))
+        sound = AnySound(stream, **kwargs)
+        # * The temporary file lives as long as the sound
+        sound.synth = stream
+        return sound
+    
     @staticmethod
     async def aio_from_midi(
         fp: FPType,
@@ -28,18 +102,39 @@ class AnySound(Sound):
         sound_fonts_path = sound_fonts_path or DEFAULT_SOUND_FONTS_PATH
         if path is None:
             raise FileTypeError(fp)
-        npath = mkstemp(suffix=".wav")[1]
-        
-        process = await asyncio.create_subprocess_exec(
-            FLUID_SYNTH_PATH, "-ni", sound_fonts_path, path, "-F", npath, "-q",
-            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        )
-        await process.wait()
-        if is_temp:
-            try:
-                os.remove(path)
-            except:
-                pass
+        cache, key = AnySound.midi_cache, None
+        if cache is not None:
+            key = await asyncio.to_thread(AnySound.midi_cache_key, path, sound_fonts_path)
+            if (entry:=await cache.aio_get(key)) is not None:
+                if is_temp:
+                    try:
+                        os.remove(path)
+                    except:
+                        pass
+                return AnySound(entry.path, **kwargs)
+        if AnySound.midi_streaming:
+            return await asyncio.to_thread(AnySound.stream_midi, path, sound_fonts_path, key, is_temp, **kwargs)
+        fd, npath = mkstemp(suffix=".wav")
+        os.close(fd)
+        try:
+            async with render_scheduler.aio_slot(path) as ticket:
+                process = await asyncio.create_subprocess_exec(
+                    FLUID_SYNTH_PATH, "-ni", sound_fonts_path, path, "-F", npath, *FLUID_SYNTH_ARGS,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+                ticket.add_stop_callback(process.kill)
+                await process.wait()
+            if process.returncode != 0:
+                raise OSError(f"The synthesizer has failed or has been stopped (code {process.returncode}): {repr(path)}")
+        except BaseException:
+            # * The WAV of the stopped render is incomplete
+            remove_file(npath)
+            raise
+        finally:
+            if is_temp:
+                remove_file(path)
+        if cache is not None:
+            await cache.aio_put(key, npath)
         return AnySound(npath, **{"is_temp": True, **kwargs})
     
     @staticmethod
@@ -52,30 +147,58 @@ class AnySound(Sound):
         sound_fonts_path = sound_fonts_path or DEFAULT_SOUND_FONTS_PATH
         if path is None:
             raise FileTypeError(fp)
-        npath = mkstemp(suffix=".wav")[1]
-        subprocess.call(
-            [FLUID_SYNTH_PATH, "-ni", sound_fonts_path, path, "-F", npath, "-q"],
-            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        )
-        if is_temp:
-            try:
-                os.remove(path)
-            except:
-                pass
+        cache, key = AnySound.midi_cache, None
+        if cache is not None:
+            key = AnySound.midi_cache_key(path, sound_fonts_path)
+            if (entry:=cache.get(key)) is not None:
+                if is_temp:
+                    try:
+                        os.remove(path)
+                    except:
+                        pass
+                return AnySound(entry.path, **kwargs)
+        if AnySound.midi_streaming:
+            return AnySound.stream_midi(path, sound_fonts_path, key, is_temp, **kwargs)
+        fd, npath = mkstemp(suffix=".wav")
+        os.close(fd)
+        try:
+            with render_scheduler.slot(path) as ticket:
+                process = subprocess.Popen(
+                    [FLUID_SYNTH_PATH, "-ni", sound_fonts_path, path, "-F", npath, *FLUID_SYNTH_ARGS],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+                ticket.add_stop_callback(process.kill)
+                returncode = process.wait()
+            if returncode != 0:
+                raise OSError(f"The synthesizer has failed or has been stopped (code {returncode}): {repr(path)}")
+        except BaseException:
+            # * The WAV of the stopped render is incomplete
+            remove_file(npath)
+            raise
+        finally:
+            if is_temp:
+                remove_file(path)
+        if cache is not None:
+            cache.put(key, npath)
         return AnySound(npath, **{"is_temp": True, **kwargs})
     
     @staticmethod
-    def from_url(url: str, **kwargs):
-        path = mkstemp(suffix=".bin")[1]
-        with open(path, "wb") as tempfile:
-            with URLFile(url, tempfile) as urlfile:
-                urlfile.fulling()
-        return AnySound(path, is_temp=True, **kwargs)
+    def from_url(url: str, stream: Optional[ProgressiveDownload]=None, key: Optional[str]=None, **kwargs):
+        stream = stream or AnySound.open_url(url, key)
+        if isinstance(stream, CacheEntry):
+            sound = AnySound(stream.path, **kwargs)
+            sound.download, sound.cache_entry = None, stream
+            return sound
+        prebuffer_size = AnySound.url_prebuffer_size or None
+        stream.wait(prebuffer_size)
+        if prebuffer_size is not None:
+            sound = AnySound(stream, **kwargs)
+        else:
+            sound = AnySound(stream.path, **kwargs)
+        # * The temporary file lives as long as the sound
+        sound.download, sound.cache_entry = stream, None
+        return sound
     
     @staticmethod
-    async def aio_from_url(url: str, **kwargs):
-        path = mkstemp(suffix=".bin")[1]
-        async with aiofiles.open(path, "wb") as tempfile:
-            async with AsyncURLFile(url, tempfile) as urlfile:
-                await urlfile.fulling()
-        return AnySound(path, is_temp=True, **kwargs)
+    async def aio_from_url(url: str, stream: Optional[ProgressiveDownload]=None, key: Optional[str]=None, **kwargs):
+        return await asyncio.to_thread(AnySound.from_url, url, stream, key, **kwargs)
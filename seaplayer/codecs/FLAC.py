@@ -1,19 +1,18 @@
-import aiofiles
 # > Local Imports
 from .Any import AnyCodec
+from .Sniffer import read_header, aio_read_header
 
 
 class FLACCodec(AnyCodec):
     codec_name: str = "FLAC"
     codec_priority: float=4.0
+    codec_signatures = (b'fLaC',)
     
     # ! Testing
     @staticmethod
     def is_this_codec(path: str) -> bool:
-        with open(path, "rb") as file:
-            return file.read(4) == b'fLaC'
+        return FLACCodec.is_this_header(read_header(path))
     
     @staticmethod
     async def aio_is_this_codec(path: str) -> bool:
-        async with aiofiles.open(path, "rb") as file:
-            return await file.read(4) == b'fLaC'
+        return FLACCodec.is_this_header(await aio_read_header(path))
@@ -1,35 +1,48 @@
-import os
-import aiofiles
 # > Typing Import
 from typing import Optional
 # > Local Imports
 from .Any import AnyCodec
-from .AnySound import AnySound
+from .Sniffer import read_header, aio_read_header
+from .AnySound import AnySound, render_scheduler
 
 # ! Codec
 class MIDICodec(AnyCodec):
     codec_name: str = "MIDI"
     codec_priority: float=5.0
+    codec_signatures = (b"MThd",)
+    sound_probed: bool=False
+    """The duration of the MIDI is known only after it is rendered."""
+    
+    @property
+    def sound_releasable(self) -> bool:
+        """The sound is rendered into a temporary file, so it is released only if the rendered MIDI is cached or streamed (waiting for the whole rendering again is expensive)."""
+        return (AnySound.midi_cache is not None) or AnySound.midi_streaming
     
     # ! Testing
     @staticmethod
     def is_this_codec(path: str) -> bool:
-        with open(path, 'rb') as file:
-            return file.read(4) == b"MThd"
+        return MIDICodec.is_this_header(read_header(path))
     
     @staticmethod
     async def aio_is_this_codec(path: str) -> bool:
-        async with aiofiles.open(path, 'rb') as file:
-            return await file.read(4) == b"MThd"
+        return MIDICodec.is_this_header(await aio_read_header(path))
     
     # ! Initialized
     def __init__(self, path: str, aio_init: bool=False, sound_device_id: Optional[int]=None, **kwargs) -> None:
-        self.name = os.path.abspath(path)
-        if not aio_init:
-            self._sound = AnySound.from_midi(self.name, device_id=sound_device_id, **kwargs)
+        super().__init__(path, sound_device_id, lazy=aio_init, **kwargs)
     
     @staticmethod
     async def __aio_init__(path: str, sound_device_id: Optional[int]=None, **kwargs):
-        self = MIDICodec(path, aio_init=True)
-        self._sound = await AnySound.aio_from_midi(self.name, device_id=sound_device_id, **kwargs)
+        self = MIDICodec(path, aio_init=True, sound_device_id=sound_device_id, **kwargs)
+        await self.aio_prepare()
         return self
+    
+    def discard(self) -> None:
+        render_scheduler.cancel(self.name)
+    
+    # ! Sound Loading
+    def load_sound(self) -> AnySound:
+        return AnySound.from_midi(self.name, device_id=self.sound_device_id, **self.sound_kwargs)
+    
+    async def aio_load_sound(self) -> AnySound:
+        return await AnySound.aio_from_midi(self.name, device_id=self.sound_device_id, **self.sound_kwargs)
@@ -1,19 +1,18 @@
-import aiofiles
 # > Local Imports
 from .Any import AnyCodec
+from .Sniffer import read_header, aio_read_header
 
 # ! Main Class
 class MP3Codec(AnyCodec):
     codec_name: str = "MP3"
     codec_priority: float=1.0
+    codec_signatures = (b'ID3',)
     
     # ! Testing
     @staticmethod
     def is_this_codec(path: str) -> bool:
-        with open(path, "rb") as file:
-            return file.read(3) == b'ID3'
+        return MP3Codec.is_this_header(read_header(path))
     
     @staticmethod
     async def aio_is_this_codec(path: str) -> bool:
-        async with aiofiles.open(path, "rb") as file:
-            return await file.read(3) == b'ID3'
+        return MP3Codec.is_this_header(await aio_read_header(path))
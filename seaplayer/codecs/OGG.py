@@ -1,19 +1,18 @@
-import aiofiles
 # > Local Imports
 from .Any import AnyCodec
+from .Sniffer import read_header, aio_read_header
 
 
 class OGGCodec(AnyCodec):
     codec_name: str = "OGG"
     codec_priority: float=3.0
+    codec_signatures = (b'OggS',)
     
     # ! Testing
     @staticmethod
     def is_this_codec(path: str) -> bool:
-        with open(path, "rb") as file:
-            return file.read(4) == b'OggS'
+        return OGGCodec.is_this_header(read_header(path))
     
     @staticmethod
     async def aio_is_this_codec(path: str) -> bool:
-        async with aiofiles.open(path, "rb") as file:
-            return await file.read(4) == b'OggS'
+        return OGGCodec.is_this_header(await aio_read_header(path))
@@ -0,0 +1,123 @@
+import aiofiles
+import mutagen
+# > Typing
+from typing import Optional, Iterable, Dict, List, Set, Tuple, Type, Any
+# > Local Imports
+from ..codeсbase import CodecBase
+
+# ! Vars
+HEADER_SIZE = 64
+"""The number of bytes read from the beginning of the file for sniffing."""
+
+# ! Functions
+def read_header(path: str, size: int=HEADER_SIZE) -> bytes:
+    """Reading the beginning of the file.
+    
+    Args:
+        path (str): File path.
+        size (int, optional): The number of bytes to read. Defaults to HEADER_SIZE.
+    
+    Returns:
+        bytes: The beginning of the file.
+    """
+    with open(path, "rb") as file:
+        return file.read(size)
+
+async def aio_read_header(path: str, size: int=HEADER_SIZE) -> bytes:
+    """Reading the beginning of the file.
+    
+    Args:
+        path (str): File path.
+        size (int, optional): The number of bytes to read. Defaults to HEADER_SIZE.
+    
+    Returns:
+        bytes: The beginning of the file.
+    """
+    async with aiofiles.open(path, "rb") as file:
+        return await file.read(size)
+
+def probe_info(path: str) -> Optional[Dict[str, Any]]:
+    """Reading the info of the sound from the headers and tags of the file, the sound is not decoded.
+    
+    Args:
+        path (str): File path.
+    
+    Returns:
+        Optional[Dict[str, Any]]: The info in the form of `AnyCodec._info`, or `None` if the headers could not be read.
+    """
+    try:
+        file = mutagen.File(path, easy=True)
+    except Exception:
+        return None
+    if (file is None) or (file.info is None):
+        return None
+    duration = getattr(file.info, "length", None)
+    channels = getattr(file.info, "channels", None)
+    samplerate = getattr(file.info, "sample_rate", None)
+    if not (duration and channels and samplerate):
+        return None
+    tags = file.tags or {}
+    def tag(name: str) -> Optional[str]:
+        try:
+            values = tags.get(name)
+        except Exception:
+            return None
+        return str(values[0]) if isinstance(values, list) and (len(values) > 0) else None
+    return {
+        "duration": float(duration),
+        "channels": int(channels),
+        "samplerate": int(samplerate),
+        "bitrate": int(getattr(file.info, "bitrate", 0) or 0),
+        "title": tag("title"),
+        "artist": tag("artist"),
+        "album": tag("album")
+    }
+
+# ! Main Class
+class SignatureTable:
+    """A table of codec signatures indexed by the first byte of the signature."""
+    def __init__(self, codecs: Iterable[Type[CodecBase]]=()) -> None:
+        """A table of codec signatures indexed by the first byte of the signature.
+        
+        Args:
+            codecs (Iterable[Type[CodecBase]], optional): Codecs whose signatures will be registered. Defaults to ().
+        """
+        self.table: Dict[int, List[Tuple[bytes, Type[CodecBase]]]] = {}
+        self.codecs: Set[Type[CodecBase]] = set()
+        for codec in codecs:
+            self.register(codec)
+    
+    def register(self, codec: Type[CodecBase]) -> None:
+        """Registering the `codec_signatures` of the codec.
+        
+        Args:
+            codec (Type[CodecBase]): The codec class.
+        """
+        for signature in getattr(codec, "codec_signatures", ()):
+            if len(signature) > 0:
+                self.table.setdefault(signature[0], []).append((signature, codec))
+                self.codecs.add(codec)
+    
+    def is_signed(self, codec: Type[CodecBase]) -> bool:
+        """Checking whether the codec is identified by signatures.
+        
+        Args:
+            codec (Type[CodecBase]): The codec class.
+        
+        Returns:
+            bool: True if the codec has registered signatures.
+        """
+        return codec in self.codecs
+    
+    def match(self, header: Optional[bytes]) -> Set[Type[CodecBase]]:
+        """Search for codecs whose signatures match the beginning of the file.
+        
+        Args:
+            header (Optional[bytes]): The beginning of the file (`None` if it could not be read).
+        
+        Returns:
+            Set[Type[CodecBase]]: Compatible codecs.
+        """
+        if not header:
+            return set()
+        return {codec for signature, codec in self.table.get(header[0], []) if header.startswith(signature)}
@@ -1,13 +1,15 @@
 import asyncio
 import hashlib
-import aiofiles
+import threading
 import validators
+from collections import OrderedDict
 # > Typing Import
-from urlopen2 import URLFile
 from typing import Optional
 # > Local Imports
 from .Any import AnyCodec
 from .AnySound import AnySound
+from .Sniffer import HEADER_SIZE, read_header
+from ..types import ProgressiveDownload, CacheEntry
 
 # ! Vars
 SIGNATURES = {
@@ -16,64 +18,84 @@ SIGNATURES = {
     b'WAVE': "WAVE",
     b'RIFF': "WAVE"
 }
+MAX_PROBES = 16
+"""The maximum number of the downloads opened by probing that wait for the codec."""
+
+probes: "OrderedDict[str, ProgressiveDownload]" = OrderedDict()
+probes_lock = threading.Lock()
+
+# ! Probes Functions
+def put_probe(url: str, stream: ProgressiveDownload) -> None:
+    """Keeping the download opened by probing, so that the codec continues it instead of connecting again."""
+    with probes_lock:
+        if (old:=probes.pop(url, None)) is not None:
+            old.close()
+        probes[url] = stream
+        while len(probes) > MAX_PROBES:
+            probes.popitem(last=False)[1].close()
+
+def take_probe(url: str) -> Optional[ProgressiveDownload]:
+    with probes_lock:
+        return probes.pop(url, None)
 
 # ! Any URL Sound File
 class URLSoundCodec(AnyCodec):
     codec_name: str = "URLS"
     codec_priority: float=6.0
+    sound_releasable: bool=False
+    """The sound is downloaded into a temporary file, downloading it again is expensive."""
+    sound_probed: bool=False
     
     # ! Codec Test
     @staticmethod
     def is_this_codec(url: str) -> bool:
         try:
             if validators.url(url):
-                with URLFile(url) as file:
-                    d = file.read(4)
+                stream = AnySound.open_url(url)
+                if isinstance(stream, CacheEntry):
+                    header = read_header(stream.path)
+                else:
+                    header = stream.peek(HEADER_SIZE)
                 for i in SIGNATURES:
-                    if d[:len(i)] == i:
+                    if header[:len(i)] == i:
+                        if isinstance(stream, ProgressiveDownload):
+                            put_probe(url, stream)
                         return True
+                if isinstance(stream, ProgressiveDownload):
+                    stream.close()
         except: pass
         return False
     
     @staticmethod
     async def aio_is_this_codec(url: str) -> bool:
-        try:
-            if validators.url(url):
-                with URLFile(url) as file:
-                    d = file.read(4)
-                for i in SIGNATURES:
-                    if d[:len(i)] == i:
-                        return True
-        except: pass
-        return False
+        return await asyncio.to_thread(URLSoundCodec.is_this_codec, url)
     
     # ! SHA1 Generation
+    @property
+    def identity_key(self) -> str:
+        """The stable key of the sound, its hash identifies the sound in the playlist, the library and the artwork cache (overridden by the codecs whose URL is temporary)."""
+        return self.name
+    
     def __sha1__(self, buffer_size: int) -> str:
-        sha1 = hashlib.sha1()
-        with open(self._sound.name, "rb") as file:
-            while True:
-                data = file.read(buffer_size)
-                if not data: break
-                sha1.update(data)
-        return sha1.hexdigest()
+        # * The identity does not depend on whether the sound is streamed, downloaded or taken from the files cache
+        return hashlib.sha1(self.identity_key.encode("utf-8")).hexdigest()
     
     async def __aio_sha1__(self, buffer_size: int) -> str:
-        sha1 = hashlib.sha1()
-        async with aiofiles.open(self._sound.name, "rb") as file:
-            while True:
-                data = await file.read(buffer_size)
-                if not data: break
-                sha1.update(data)
-        return sha1.hexdigest()
+        return self.__sha1__(buffer_size)
     
     # ! Initialization
     def __init__(self, url: str, sound_device_id: Optional[int]=None, aio_init: bool=False, **kwargs) -> None:
         self.name = url
+        self._init_state(sound_device_id, kwargs)
         if not aio_init:
-            self._sound = AnySound.from_url(self.name, device_id=sound_device_id, **kwargs)
+            self.prepare()
     
     @staticmethod
     async def __aio_init__(url: str, sound_device_id: Optional[int]=None, **kwargs):
-        self = URLSoundCodec(url, aio_init=True)
-        self._sound = await asyncio.to_thread(AnySound.from_url, url, device_id=sound_device_id, **kwargs)
+        self = URLSoundCodec(url, sound_device_id, aio_init=True, **kwargs)
+        await self.aio_prepare()
         return self
+    
+    # ! Sound Loading
+    def load_sound(self) -> AnySound:
+        return AnySound.from_url(self.name, take_probe(self.name), device_id=self.sound_device_id, **self.sound_kwargs)
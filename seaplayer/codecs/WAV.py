@@ -1,21 +1,18 @@
-import aiofiles
 # > Local Imports
 from .Any import AnyCodec
+from .Sniffer import read_header, aio_read_header
 
 
 class WAVECodec(AnyCodec):
     codec_name: str = "WAVE"
     codec_priority: float=2.0
+    codec_signatures = (b'WAVE', b'RIFF')
     
     # ! Testing
     @staticmethod
     def is_this_codec(path: str) -> bool:
-        with open(path, "rb") as file:
-            signature = file.read(4)
-        return (signature == b'WAVE') or (signature == b'RIFF')
+        return WAVECodec.is_this_header(read_header(path))
     
     @staticmethod
     async def aio_is_this_codec(path: str) -> bool:
-        async with aiofiles.open(path, "rb") as file:
-            signature = await file.read(4)
-        return (signature == b'WAVE') or (signature == b'RIFF')
\ No newline at end of file
+        return WAVECodec.is_this_header(await aio_read_header(path))
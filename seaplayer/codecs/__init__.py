@@ -4,7 +4,9 @@ from .WAV import WAVECodec
 from .MIDI import MIDICodec
 from .FLAC import FLACCodec
 from .URLS import URLSoundCodec
-from .Any import AnyCodec
+from .Any import AnyCodec, live_sounds
+from .AnySound import AnySound, render_scheduler
+from .Sniffer import SignatureTable, read_header, aio_read_header
 from ..codeсbase import CodecBase
 from typing import List
 
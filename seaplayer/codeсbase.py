@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Optional, Tuple, Callable
 
 # ! Functions
 def formater(**kwargs) -> str:
@@ -13,6 +13,8 @@ class CodecBase:
     """The name of the codec (abbreviation)."""
     codec_priority: float=0.0
     """Sorting priority (the lower the value, the earlier it will be processed, checked for compatibility and initialized)"""
+    codec_signatures: Tuple[bytes, ...]=()
+    """The signatures (magic bytes) with which the files of the codec begin. If set, the compatibility is checked by the already read beginning of the file, without calling `is_this_codec`."""
     
     # * Info
     name: str
@@ -144,6 +146,59 @@ class CodecBase:
         """
         return False
     
+    @classmethod
+    def is_this_header(cls, header: bytes) -> bool:
+        """Compatibility check by the beginning of the file.
+        
+        Args:
+            header (bytes): The beginning of the file.
+        
+        Returns:
+            bool: True if compatible.
+        """
+        for signature in cls.codec_signatures:
+            if header.startswith(signature):
+                return True
+        return False
+    
+    # ! Resource Functions
+    def prepare(self) -> None:
+        """Preparing the sound for playback (opening the file, decoding and so on). It is called when the sound is selected."""
+        ...
+    
+    def release(self) -> bool:
+        """Releasing the resources of the sound, they will be prepared again when needed.
+        
+        Returns:
+            bool: True if the resources have been released.
+        """
+        return False
+    
+    def discard(self) -> None:
+        """Discarding the sound removed from the playlist: the unfinished background work for it (rendering and so on) is cancelled."""
+        ...
+    
+    # ! Callback Functions
+    def add_finish_callback(self, callback: Callable[[], None], before: float=0.0) -> bool:
+        """Adding a function that is called when the sound has finished playing by itself (it is not called after `stop` or `pause`).
+        
+        Args:
+            callback (Callable[[], None]): The function (it can be called from another thread).
+            before (float, optional): How many seconds before the end to call it. Defaults to 0.0.
+        
+        Returns:
+            bool: True if the codec supports the callbacks, otherwise the end of the playback has to be checked by the caller.
+        """
+        return False
+    
+    def remove_finish_callback(self, callback: Callable[[], None]) -> None:
+        """Removing the function added by `add_finish_callback`.
+        
+        Args:
+            callback (Callable[[], None]): The function.
+        """
+        ...
+    
     # ! Playback Functions
     def play(self) -> None:
         """Start playing the sound."""
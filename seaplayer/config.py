@@ -1,6 +1,10 @@
+import os
+import atexit
+import threading
 import properties
 from pathlib import Path
-from typing import Dict, Any, Optional, TypeVar, Union, Literal
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, TypeVar, Union, Literal, Iterator
 
 # ! Types
 T = TypeVar("T")
@@ -10,12 +14,20 @@ DEFAULT_CONFIG_DATA: Dict[str, Any] = {
     "main.lang": "en-eng",
     "sound.sound_font_path": None,
     "sound.output_sound_device_id": None,
+    "sound.max_live_sounds": 4,
+    "sound.url_prebuffer_size": 0,
+    "sound.url_cache_size": 1024,
+    "sound.midi_cache_size": 1024,
+    "sound.midi_streaming": False,
+    "sound.midi_render_workers": 0,
     "image.image_update_method": "sync",
     "image.image_resample_method": "bilinear",
     "playback.rewind_count_seconds": 5,
     "playback.volume_change_percent": 0.05,
     "playback.max_volume_percent": 2.0,
+    "playback.prebuffer_seconds": 3,
     "playlist.recursive_search": False,
+    "playlist.loading_workers": 4,
     "keys.quit": "q,й",
     "keys.rewind_forward": "*",
     "keys.rewind_back": "/",
@@ -28,10 +40,16 @@ DEFAULT_CONFIG_DATA: Dict[str, Any] = {
 # ! Main Class
 class SeaPlayerConfig:
     """The main configuration class of the SeaPlayer."""
+    flush_delay: float=0.5
+    """How many seconds after the last change the configuration is written to the file (the changes in the meantime are written once)."""
+    
     @staticmethod
     def dump(filepath: Path, data: Dict[str, Any]) -> None:
-        with open(filepath, "w", encoding="utf-8", errors="ignore") as file:
+        """Writing the configuration atomically: to a temporary file, which then replaces the original one."""
+        temp_filepath = filepath.with_name(f"{filepath.name}.tmp")
+        with open(temp_filepath, "w", encoding="utf-8", errors="ignore") as file:
             properties.dump(data, file)
+        os.replace(temp_filepath, filepath)
     
     @staticmethod
     def load(filepath: Path, default: Dict[str, Any]) -> Dict[str, Any]:
@@ -40,13 +58,57 @@ class SeaPlayerConfig:
                 return properties.load(file)
             except:
                 pass
-        with open(filepath, "w", encoding="utf-8", errors="ignore") as file:
-            properties.dump(default, file)
+        SeaPlayerConfig.dump(filepath, default)
         return default
     
     def refresh(self) -> None:
-        """Overwriting configurations to a file."""
-        self.dump(self.filepath, self.config)
+        """Overwriting configurations to a file right away."""
+        with self.write_lock:
+            with self.lock:
+                if self.flush_timer is not None:
+                    self.flush_timer.cancel()
+                    self.flush_timer = None
+                self.dirty = False
+                data = self.config.copy()
+            self.dump(self.filepath, data)
+    
+    def flush(self) -> None:
+        """Writing the unsaved changes to the file right away (for example, on quit)."""
+        if self.dirty:
+            self.refresh()
+    
+    def schedule_refresh(self, delay: Optional[float]=None) -> None:
+        """Writing the configuration in the background after the delay, each new change restarts it."""
+        with self.lock:
+            self.dirty = True
+            if self.batch_depth > 0:
+                return
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+            self.flush_timer = threading.Timer(self.flush_delay if (delay is None) else delay, self.flush)
+            self.flush_timer.daemon = True
+            self.flush_timer.start()
+    
+    @contextmanager
+    def batch(self) -> Iterator["SeaPlayerConfig"]:
+        """Changing several configurations at once: they are written to the file in one write when the outer block ends.
+        
+        ```python
+        with config.batch():
+            config.max_live_sounds = 8
+            config.loading_workers = 8
+        ```
+        """
+        with self.lock:
+            self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.batch_depth -= 1
+                changed = (self.batch_depth == 0) and self.dirty
+            if changed:
+                self.schedule_refresh(0)
     
     def __init__(
         self,
@@ -62,22 +124,32 @@ class SeaPlayerConfig:
         """
         self.filepath = Path(filepath)
         self.default_data = default_data
+        self.lock = threading.RLock()
+        self.write_lock = threading.Lock()
+        self.flush_timer: Optional[threading.Timer] = None
+        self.batch_depth = 0
+        self.dirty = False
         if self.filepath.exists():
             self.config = self.load(self.filepath, self.default_data)
             config_temp = self.default_data.copy()
             config_temp.update(self.config)
+            # * The file is rewritten only if it lacks some of the configurations
+            self.dirty = len(config_temp) != len(self.config)
             self.config = config_temp.copy()
             del config_temp
         else:
             self.config = default_data.copy()
-        self.refresh()
+            self.dirty = True
+        self.flush()
+        atexit.register(self.flush)
     
     def get(self, key: str, default: T=None) -> Union[Any, T]:
         return self.config.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
-        self.config[key] = value
-        self.refresh()
+        with self.lock:
+            self.config[key] = value
+        self.schedule_refresh()
     
     # ! Main
     @property
@@ -114,11 +186,77 @@ class SeaPlayerConfig:
     @output_sound_device_id.setter
     def output_sound_device_id(self, value: Optional[int]): self.set("sound.output_sound_device_id", value)
     
+    @property
+    def max_live_sounds(self) -> int:
+        """The maximum number of sounds that are kept open, the rest of the playlist is opened on demand.
+        
+        Returns:
+            The number of sounds.
+        """
+        return self.get("sound.max_live_sounds")
+    @max_live_sounds.setter
+    def max_live_sounds(self, value: int): self.set("sound.max_live_sounds", value)
+    
+    @property
+    def url_prebuffer_size(self) -> int:
+        """How many kilobytes of the sound from the URL are downloaded before it starts playing (`0` - the whole file, the default).
+        
+        Returns:
+            The size in kilobytes.
+        """
+        return self.get("sound.url_prebuffer_size")
+    @url_prebuffer_size.setter
+    def url_prebuffer_size(self, value: int): self.set("sound.url_prebuffer_size", value)
+    
+    @property
+    def url_cache_size(self) -> int:
+        """How many megabytes the cache of the sounds downloaded from URLs can take (`0` - the cache is disabled).
+        
+        Returns:
+            The size in megabytes.
+        """
+        return self.get("sound.url_cache_size")
+    @url_cache_size.setter
+    def url_cache_size(self, value: int): self.set("sound.url_cache_size", value)
+    
+    @property
+    def midi_cache_size(self) -> int:
+        """How many megabytes the cache of the rendered MIDI can take (`0` - the cache is disabled).
+        
+        Returns:
+            The size in megabytes.
+        """
+        return self.get("sound.midi_cache_size")
+    @midi_cache_size.setter
+    def midi_cache_size(self, value: int): self.set("sound.midi_cache_size", value)
+    
+    @property
+    def midi_streaming(self) -> bool:
+        """Playing the MIDI while it is being rendered.
+        
+        Returns:
+            On or off.
+        """
+        return self.get("sound.midi_streaming")
+    @midi_streaming.setter
+    def midi_streaming(self, value: bool): self.set("sound.midi_streaming", value)
+    
+    @property
+    def midi_render_workers(self) -> int:
+        """The maximum number of MIDI that are rendered at the same time (`0` - the number of CPU cores).
+        
+        Returns:
+            The number of synthesizer processes.
+        """
+        return self.get("sound.midi_render_workers")
+    @midi_render_workers.setter
+    def midi_render_workers(self, value: int): self.set("sound.midi_render_workers", value)
+    
     # ! Image
     @property
-    def image_update_method(self) -> Literal["sync", "async"]: return self.get("image.image_update_method")
+    def image_update_method(self) -> Literal["sync", "async", "vector", "process"]: return self.get("image.image_update_method")
     @image_update_method.setter
-    def image_update_method(self, value: Literal["sync", "async"]): self.set("image.image_update_method", value)
+    def image_update_method(self, value: Literal["sync", "async", "vector", "process"]): self.set("image.image_update_method", value)
     
     @property
     def image_resample_method(self) -> Literal["nearest", "bilinear", "bicubic", "lanczos", "hamming", "box"]:
@@ -166,6 +304,17 @@ class SeaPlayerConfig:
     @max_volume_percent.setter
     def max_volume_percent(self, value: float): self.set("playback.max_volume_percent", value)
     
+    @property
+    def prebuffer_seconds(self) -> int:
+        """How many seconds before the end of the current sound the next one is prepared (in the replay list mode).
+        
+        Returns:
+            The time in seconds.
+        """
+        return self.get("playback.prebuffer_seconds")
+    @prebuffer_seconds.setter
+    def prebuffer_seconds(self, value: int): self.set("playback.prebuffer_seconds", value)
+    
     # ! Playlist
     @property
     def recursive_search(self) -> bool:
@@ -178,6 +327,17 @@ class SeaPlayerConfig:
     @recursive_search.setter
     def recursive_search(self, value: bool): self.set("playlist.recursive_search", value)
     
+    @property
+    def loading_workers(self) -> int:
+        """The maximum number of values that are loaded into the playlist at the same time.
+        
+        Returns:
+            The number of workers.
+        """
+        return self.get("playlist.loading_workers")
+    @loading_workers.setter
+    def loading_workers(self, value: int): self.set("playlist.loading_workers", value)
+    
     # ! Keys
     @property
     def key_quit(self) -> str:
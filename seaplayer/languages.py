@@ -1,21 +1,123 @@
 import os
 import glob
+import marshal
+import hashlib
 import properties
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Any
 # > Local Imports
 from .functions import formater
 from .exceptions import LanguageNotExistError, LanguageNotLoadedError
 
+# ! Vars
+METADATA_PREFIX = "language.metadata."
+"""The prefix of the keys that are kept in the header index."""
+
+# ! Functions
+def parse_language_file(filepath: str) -> Dict[str, str]:
+    with open(filepath, 'r', errors='ignore', encoding='utf-8') as file:
+        return dict(properties.load(file))
+
+# ! Cache Class
+class LanguageCache:
+    """The translation files compiled into `marshal` tables and the index of their metadata headers, both are kept until the file is modified."""
+    VERSION = 1
+    
+    def __init__(self, dirpath: str) -> None:
+        """The translation files compiled into `marshal` tables and the index of their metadata headers, both are kept until the file is modified.
+        
+        Args:
+            dirpath (str): The path to the cache directory.
+        """
+        self.dirpath = os.path.abspath(dirpath)
+        self.index_path = os.path.join(self.dirpath, "index.marshal")
+        os.makedirs(self.dirpath, 0o755, True)
+        self.index: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = self.read(self.index_path) or {}
+        """The metadata headers by the paths of the files: `(stat_key, header)`."""
+        self.changed = False
+    
+    # ! Functions
+    @staticmethod
+    def stat_key(filepath: str) -> Tuple[int, int]:
+        stat = os.stat(filepath)
+        return stat.st_mtime_ns, stat.st_size
+    
+    @staticmethod
+    def read(path: str) -> Optional[Any]:
+        try:
+            with open(path, "rb") as file:
+                version, value = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return value if (version == LanguageCache.VERSION) else None
+    
+    @staticmethod
+    def write(path: str, value: Any) -> None:
+        with open(f"{path}.tmp", "wb") as file:
+            marshal.dump((LanguageCache.VERSION, value), file)
+        os.replace(f"{path}.tmp", path)
+    
+    def table_path(self, filepath: str) -> str:
+        return os.path.join(self.dirpath, f"{hashlib.sha1(filepath.encode('utf-8')).hexdigest()}.marshal")
+    
+    # ! Main Methods
+    def table(self, filepath: str) -> Dict[str, str]:
+        """Getting all translations of the file (it is parsed only if it has been modified since the last time).
+        
+        Args:
+            filepath (str): The full path to the translation file.
+        
+        Returns:
+            Dict[str, str]: The translations.
+        """
+        key = self.stat_key(filepath)
+        if ((cached:=self.read(self.table_path(filepath))) is not None) and (tuple(cached[0]) == key):
+            return cached[1]
+        data = parse_language_file(filepath)
+        try:
+            self.write(self.table_path(filepath), (key, data))
+        except OSError:
+            pass
+        return data
+    
+    def header(self, filepath: str) -> Dict[str, str]:
+        """Getting the metadata of the file from the index (the file is compiled if it is not indexed or has been modified).
+        
+        Args:
+            filepath (str): The full path to the translation file.
+        
+        Returns:
+            Dict[str, str]: The keys of the metadata (`language.metadata.*`).
+        """
+        key = self.stat_key(filepath)
+        if ((entry:=self.index.get(filepath)) is not None) and (tuple(entry[0]) == key):
+            return entry[1]
+        header = {k: v for k, v in self.table(filepath).items() if k.startswith(METADATA_PREFIX)}
+        self.index[filepath] = (key, header)
+        self.changed = True
+        return header
+    
+    def save(self) -> None:
+        """Writing the index, if it has been changed."""
+        if self.changed:
+            try:
+                self.write(self.index_path, self.index)
+                self.changed = False
+            except OSError:
+                pass
+
 # ! Child Class
 class Language:
     """The class reflects the file with the translation."""
-    @staticmethod
-    def __load_file(filepath: str) -> Dict[str, str]:
-        with open(filepath, 'r', errors='ignore', encoding='utf-8') as file:
-            return properties.load(file)
+    def __load_file(self, filepath: str) -> Dict[str, str]:
+        if self.__cache is not None:
+            return self.__cache.table(filepath)
+        return parse_language_file(filepath)
     
     def __get_metadata(self) -> Tuple[str, str, Optional[str], Dict[str, str]]:
-        data = self.__load_file(self.__name)
+        if self.__cache is not None:
+            data = self.__cache.header(self.__name)
+        else:
+            data = self.__load_file(self.__name)
         return \
             data.get("language.metadata.title", f"<LTNF:{self.__mark}>"), \
             data.get("language.metadata.author", "<unknown>"), \
@@ -25,16 +127,18 @@ class Language:
             }
     
     # ? Initialization
-    def __init__(self, language_filepath: str) -> None:
+    def __init__(self, language_filepath: str, cache: Optional[LanguageCache]=None) -> None:
         """The class reflects the file with the translation.
         
         Args:
             language_filepath (str): The path to the file with the translation.
+            cache (Optional[LanguageCache], optional): The cache of the compiled translations and their metadata. Defaults to None (the file is parsed every time).
         
         Raises:
             FileNotFoundError: It is called if the file with the translation does not exist.
         """
         self.__name = os.path.abspath(language_filepath)
+        self.__cache = cache
         self.__data, self.__loaded = None, False
         # * Checking
         if not os.path.isfile(self.__name):
@@ -165,6 +269,7 @@ class LanguageLoader:
         langs_dirpath: str,
         main_lang_mark: str,
         default_lang_mark: str="en-eng",
+        cache_dirpath: Optional[str]=None
     ) -> None:
         """The loader of files with translation.
         
@@ -172,6 +277,7 @@ class LanguageLoader:
             langs_dirpath (str): The path to the folder with the translation files.
             main_lang_mark (str): The name of the file with the main translation without the extension.
             default_lang_mark (str, optional): The name of the file with the default translation without an extension. Defaults to "en-eng".
+            cache_dirpath (Optional[str], optional): The directory of the compiled translations: the files are parsed only when they are modified, and only the metadata of the languages that are not used is read. Defaults to None (no cache).
         
         Raises:
             FileNotFoundError: Called if the file with the default translation without the extension could not be found.
@@ -184,8 +290,11 @@ class LanguageLoader:
         if not os.path.isdir(self.__name):
             raise FileNotFoundError
         # * Searching and loading languages
-        self.__langs: List[Language] = [Language(lp) for lp in glob.glob(os.path.join(self.__name, "??-???.properties"))]
+        cache = LanguageCache(cache_dirpath) if (cache_dirpath is not None) else None
+        self.__langs: List[Language] = [Language(lp, cache) for lp in glob.glob(os.path.join(self.__name, "??-???.properties"))]
         self.__dlang, self.__mlang = self.__search_langs(self.__dlm, self.__mlm)
+        if cache is not None:
+            cache.save()
     
     # ? Magic Methods
     def __str__(self) -> str:
@@ -0,0 +1,103 @@
+import numpy as np
+from rich.color import Color, ColorType
+from rich.color_triplet import ColorTriplet
+from rich.style import Style
+from rich.segment import Segment
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
+# > Image Works
+from PIL import Image
+from PIL.Image import Resampling
+# > Typing
+from typing import Dict, List, Tuple
+
+# ! Vars
+HALF_BLOCK = "▀"
+"""The upper half block: its foreground is the upper pixel, its background is the lower one."""
+
+# ! Functions
+def rgb_color(value: int) -> Color:
+    # * The same as `Color.from_rgb`, without formatting the name through the triplet
+    return Color(f"#{value:06x}", ColorType.TRUECOLOR, triplet=ColorTriplet((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF))
+
+# ! Main Class
+class HalfBlockPixels:
+    """A Rich renderable of the image drawn with half blocks: each cell shows two pixels, the neighbouring cells of the same colors are merged into one segment."""
+    def __init__(self, lines: List[List[Segment]], width: int) -> None:
+        self.lines = lines
+        self.width = width
+    
+    @staticmethod
+    def pack(image: Image.Image, size: Tuple[int, int], resample: Resampling=Resampling.NEAREST) -> np.ndarray:
+        """Resizing the image to the cells and packing the colors of the upper and the lower pixel of each cell into one number.
+        
+        Args:
+            image (Image.Image): The image.
+            size (Tuple[int, int]): The size in cells (width, height).
+            resample (Resampling, optional): The resampling method. Defaults to Resampling.NEAREST.
+        
+        Returns:
+            np.ndarray: The array of the cells `(height, width)`: `upper_rgb << 24 | lower_rgb`.
+        """
+        width, height = size
+        if image.mode in ("1", "P"):
+            image = image.convert("RGB")
+        pixels = np.asarray(image.resize((width, height*2), resample).convert("RGB"), dtype=np.uint64)
+        rgb = (pixels[..., 0] << np.uint64(16)) | (pixels[..., 1] << np.uint64(8)) | pixels[..., 2]
+        return (rgb[0::2] << np.uint64(24)) | rgb[1::2]
+    
+    @classmethod
+    def from_image(cls, image: Image.Image, size: Tuple[int, int], resample: Resampling=Resampling.NEAREST) -> "HalfBlockPixels":
+        """Rendering the image.
+        
+        Args:
+            image (Image.Image): The image.
+            size (Tuple[int, int]): The size in cells (width, height).
+            resample (Resampling, optional): The resampling method. Defaults to Resampling.NEAREST.
+        
+        Returns:
+            HalfBlockPixels: The renderable.
+        """
+        return cls.from_cells(cls.pack(image, (max(1, size[0]), max(1, size[1])), resample))
+    
+    @classmethod
+    def from_cells(cls, cells: np.ndarray) -> "HalfBlockPixels":
+        """Rendering the packed cells (see `HalfBlockPixels.pack`).
+        
+        Args:
+            cells (np.ndarray): The array of the cells `(height, width)`.
+        
+        Returns:
+            HalfBlockPixels: The renderable.
+        """
+        height, width = cells.shape
+        # * The runs of the same cells: each row starts a new run
+        changes = np.ones(cells.shape, dtype=bool)
+        changes[:, 1:] = cells[:, 1:] != cells[:, :-1]
+        starts = np.flatnonzero(changes)
+        lengths = np.diff(np.append(starts, cells.size))
+        rows = starts // width
+        values = cells.reshape(-1)[starts]
+        styles: Dict[int, Style] = {}
+        colors: Dict[int, Color] = {}
+        lines: List[List[Segment]] = [[] for _ in range(height)]
+        for row, length, value in zip(rows.tolist(), lengths.tolist(), values.tolist()):
+            if (style:=styles.get(value)) is None:
+                upper, lower = value >> 24, value & 0xFFFFFF
+                if (color:=colors.get(upper)) is None:
+                    color = colors[upper] = rgb_color(upper)
+                if (bgcolor:=colors.get(lower)) is None:
+                    bgcolor = colors[lower] = rgb_color(lower)
+                style = styles[value] = Style.from_color(color, bgcolor)
+            lines[row].append(Segment(HALF_BLOCK * length, style))
+        return cls(lines, width)
+    
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        new_line = Segment.line()
+        for index, line in enumerate(self.lines):
+            yield from line
+            if index < len(self.lines)-1:
+                yield new_line
+    
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        return Measurement(self.width, self.width)
\ No newline at end of file
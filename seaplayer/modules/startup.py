@@ -0,0 +1,139 @@
+import sys
+import time
+import builtins
+import threading
+import importlib.util
+from contextlib import contextmanager
+from rich.table import Table
+from rich.console import Console
+# > Typing
+from typing import Optional, Iterator, Callable, Generic, TypeVar, List, Tuple, Any
+
+# ! Types
+T = TypeVar("T")
+StartupEvent = Tuple[float, float, int, str, str]
+"""The event of the timeline: `(start, duration, depth, kind, name)`, the times are in seconds from the start of the process."""
+
+# ! Main Class
+class StartupProfiler:
+    """The timeline of the SeaPlayer start: the imports of the modules and the initialization of the subsystems until the first frame (see `--profile-startup`)."""
+    def __init__(self) -> None:
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.events: List[StartupEvent] = []
+        self.depth = 0
+        self.thread_id: Optional[int] = None
+        self.original_import: Optional[Callable[..., Any]] = None
+    
+    # ! Control Methods
+    def enable(self) -> None:
+        """Starting the recording: the imports of the main thread are tracked from now on."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.thread_id = threading.get_ident()
+        self.original_import = builtins.__import__
+        builtins.__import__ = self.tracking_import
+    
+    def disable(self) -> None:
+        if not self.enabled:
+            return
+        self.enabled = False
+        builtins.__import__ = self.original_import
+    
+    # ! Record Methods
+    def now(self) -> float:
+        return time.perf_counter() - self.origin
+    
+    @contextmanager
+    def span(self, name: str, kind: str="init") -> Iterator[None]:
+        """Recording the duration of the block (nothing is recorded if the profiler is disabled)."""
+        if (not self.enabled) or (threading.get_ident() != self.thread_id):
+            yield
+            return
+        start, depth = self.now(), self.depth
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            self.events.append((start, self.now() - start, depth, kind, name))
+    
+    def mark(self, name: str) -> None:
+        """Recording the moment (for example, the first frame)."""
+        if self.enabled:
+            self.events.append((self.now(), 0.0, self.depth, "mark", name))
+    
+    def finish(self, name: str) -> None:
+        """Recording the last moment of the start (the first frame) and stopping the recording."""
+        self.mark(name)
+        self.disable()
+    
+    def tracking_import(self, name: str, globals=None, locals=None, fromlist=(), level: int=0) -> Any:
+        try:
+            module_name = importlib.util.resolve_name(("." * level) + name, (globals or {}).get("__package__")) if (level > 0) else name
+        except (ImportError, ValueError):
+            module_name = name
+        if (module_name in sys.modules) or (threading.get_ident() != self.thread_id):
+            return self.original_import(name, globals, locals, fromlist, level)
+        with self.span(module_name, "import"):
+            return self.original_import(name, globals, locals, fromlist, level)
+    
+    # ! Output Methods
+    def print(self, console: Optional[Console]=None, threshold: float=0.001) -> None:
+        """Printing the timeline.
+        
+        Args:
+            console (Optional[Console], optional): The console. Defaults to None (stderr).
+            threshold (float, optional): The events shorter than this (in seconds) are hidden, except for the marks. Defaults to 0.001.
+        """
+        console = console or Console(stderr=True)
+        table = Table(title="Startup Timeline", title_justify="left")
+        table.add_column("start, ms", justify="right")
+        table.add_column("duration, ms", justify="right")
+        table.add_column("kind")
+        table.add_column("name")
+        for start, duration, depth, kind, name in sorted(self.events, key=lambda e: (e[0], e[2])):
+            if (kind != "mark") and (duration < threshold):
+                continue
+            style = {"mark": "bold green", "init": "yellow"}.get(kind)
+            table.add_row(
+                f"{start*1000:.1f}", "" if (kind == "mark") else f"{duration*1000:.1f}",
+                kind, ("  " * depth) + name, style=style
+            )
+        console.print(table)
+
+# ! Vars
+startup = StartupProfiler()
+"""The profiler of the start of the SeaPlayer."""
+
+# ! Lazy Attribute Class
+class lazy(Generic[T]):
+    """A class attribute that is created on the first access (from the class or from an instance) and then shared, its creation is recorded in the startup timeline.
+    
+    ```python
+    class SeaPlayer(App):
+        @lazy
+        def config(cls) -> SeaPlayerConfig:
+            return SeaPlayerConfig(CONFIG_FILEPATH)
+    ```
+    """
+    def __init__(self, factory: Callable[[type], T]) -> None:
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+        self.lock = threading.RLock()
+        self.created = False
+        self.value: Optional[T] = None
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = f"{owner.__name__}.{name}"
+    
+    def __get__(self, instance: Any, owner: type) -> T:
+        if not self.created:
+            with self.lock:
+                if not self.created:
+                    with startup.span(self.name):
+                        self.value = self.factory(owner)
+                    self.created = True
+        return self.value
@@ -1,52 +1,136 @@
 import asyncio
 from textual.widgets import Label
+from textual.timer import Timer
 # > Image Works
 from PIL import Image
 from PIL.Image import Resampling
 from ripix import AsyncPixels, Pixels
 # > Typing
-from typing import Optional, Union, Tuple
+from typing import Optional, Union, Tuple, TYPE_CHECKING
+# > Local Imports
+from ..types import ArtworkCache
+from ..types.Artwork import DEFAULT_KEY
+# > Lazy Imports (numpy is imported only by the methods that need it)
+if TYPE_CHECKING:
+    from ..types import ImageProcessPool
+    from ..modules.halfblock import HalfBlockPixels
 
-# ! Main Class
-class StandartImageLabel(Label):
-    DEFAULT_CSS = """
-    StandartImageLabel {
-        height: 1fr;
-        width: 1fr;
-        align: center middle;
-        text-align: center;
-    }
-    """
+# ! Vars
+RESIZE_DEBOUNCE = 0.15
+"""How many seconds the size of the widget must stay the same before the image is rendered for it."""
+
+
+# ! Base Class
+class BaseImageLabel(Label):
+    """The base class of the image widgets: the renderings are memoized, the rendering for a resize starts when the resize stops, and the previous unfinished rendering is cancelled.
     
+    The image is rendered progressively: a fast `NEAREST` preview first, then with the configured resampling method.
+    """
     def __init__(
         self,
         default_image: Image.Image,
         image: Optional[Image.Image]=None,
         *,
-        resample: Resampling=Resampling.NEAREST
+        resample: Resampling=Resampling.NEAREST,
+        artwork: Optional[ArtworkCache]=None
     ) -> None:
         super().__init__("<image not found>")
         self.image_resample = resample
         self.default_image: Image.Image = default_image
         self.image: Optional[Image.Image] = image
-        self.image_text: Union[str, Pixels] = "<image not found>"
+        self.image_key: Optional[str] = None
+        """The hash of the sound whose cover art is shown, the renderings are memoized by it."""
+        self.artwork = artwork
+        self.image_text: Union[str, Pixels, AsyncPixels, "HalfBlockPixels"] = "<image not found>"
         self.last_image_size: Optional[Tuple[int, int]] = None
+        self.resize_timer: Optional[Timer] = None
+        self.render_size: Optional[Tuple[int, int]] = None
+        """The size of the unfinished rendering."""
+    
+    # ! Render Methods
+    async def pixels_from_image(self, image: Image.Image, size: Tuple[int, int], resample: Resampling) -> Union[Pixels, AsyncPixels, "HalfBlockPixels"]:
+        """Rendering the image (overridden by the subclasses that render it differently)."""
+        return await asyncio.to_thread(Pixels.from_image, image, size, resample)
     
+    def get_render_source(self) -> Tuple[Image.Image, Resampling, Optional[str]]:
+        if self.image is None:
+            return self.default_image, Resampling.NEAREST, DEFAULT_KEY
+        return self.image, self.image_resample, self.image_key
+    
+    def get_memoized(self, size: Tuple[int, int], resample: Resampling) -> Optional[Union[Pixels, AsyncPixels, "HalfBlockPixels"]]:
+        _, _, key = self.get_render_source()
+        if (self.artwork is None) or (key is None):
+            return None
+        return self.artwork.get_render((key, size, int(resample)))
+    
+    async def render_image(self, size: Tuple[int, int], resample: Optional[Resampling]=None) -> Union[Pixels, AsyncPixels, "HalfBlockPixels"]:
+        image, image_resample, key = self.get_render_source()
+        resample = image_resample if (resample is None) else resample
+        if (pixels:=self.get_memoized(size, resample)) is None:
+            pixels = await self.pixels_from_image(image, size, resample)
+            if (self.artwork is not None) and (key is not None):
+                self.artwork.put_render((key, size, int(resample)), pixels)
+        return pixels
+    
+    async def render_progressive(self, size: Tuple[int, int]) -> None:
+        _, resample, _ = self.get_render_source()
+        if (resample != Resampling.NEAREST) and (self.get_memoized(size, resample) is None):
+            self.image_text = await self.render_image(size, Resampling.NEAREST)
+            self.update(self.image_text)
+        self.image_text = await self.render_image(size)
+        self.last_image_size, self.render_size = size, None
+        self.update(self.image_text)
+    
+    def start_render(self) -> None:
+        """Starting the rendering for the current size, the previous unfinished rendering is cancelled."""
+        self.resize_timer = None
+        self.render_size = (self.size[0], self.size[1])
+        self.run_worker(
+            self.render_progressive(self.render_size),
+            name="Image Render",
+            group="seaplayer-image-render",
+            exclusive=True
+        )
+    
+    # ! On Methods
     async def on_resize(self) -> None:
-        image, resample = (self.default_image, Resampling.NEAREST) if (self.image is None) else (self.image, self.image_resample)
         new_size = (self.size[0], self.size[1])
-        if self.last_image_size != new_size:
-            self.image_text = await asyncio.to_thread(Pixels.from_image, image, new_size, resample)
-            self.last_image_size = new_size
-        self.update(self.image_text)
+        if self.resize_timer is not None:
+            self.resize_timer.stop()
+            self.resize_timer = None
+        cancelled = (self.render_size is not None) and (self.render_size != new_size)
+        if cancelled:
+            # * The unfinished rendering for another size would overwrite the image of this size
+            self.workers.cancel_group(self, "seaplayer-image-render")
+            self.render_size = None
+        if (self.last_image_size == new_size) and not cancelled:
+            return
+        if (pixels:=self.get_memoized(new_size, self.get_render_source()[1])) is not None:
+            self.image_text, self.last_image_size = pixels, new_size
+            self.update(self.image_text)
+            return
+        self.resize_timer = self.set_timer(RESIZE_DEBOUNCE, self.start_render)
     
-    async def update_image(self, image: Optional[Image.Image]=None) -> None:
-        self.image = image
-        image, resample = (self.default_image, Resampling.NEAREST) if (self.image is None) else (self.image, self.image_resample)
-        self.image_text = await asyncio.to_thread(Pixels.from_image, image, (self.size[0], self.size[1]), resample)
-        self.update(self.image_text)
+    async def update_image(self, image: Optional[Image.Image]=None, key: Optional[str]=None) -> None:
+        self.image, self.image_key = image, key
+        if self.resize_timer is not None:
+            self.resize_timer.stop()
+        self.start_render()
+
+
+# ! Main Class
+class StandartImageLabel(BaseImageLabel):
+    DEFAULT_CSS = """
+    StandartImageLabel {
+        height: 1fr;
+        width: 1fr;
+        align: center middle;
+        text-align: center;
+    }
+    """
+
 
-class AsyncImageLabel(Label):
+class AsyncImageLabel(BaseImageLabel):
     DEFAULT_CSS = """
     AsyncImageLabel {
         height: 1fr;
@@ -56,30 +140,43 @@ class AsyncImageLabel(Label):
     }
     """
     
-    def __init__(
-        self,
-        default_image: Image.Image,
-        image: Optional[Image.Image]=None,
-        *,
-        resample: Resampling=Resampling.NEAREST
-    ):
-        self.image_resample = resample
-        self.default_image: Image.Image = default_image
-        self.image: Optional[Image.Image] = image
-        self.image_text: Union[str, AsyncPixels] = "<image not found>"
-        self.last_image_size: Optional[Tuple[int, int]] = None
-        super().__init__("<image not found>")
+    async def pixels_from_image(self, image: Image.Image, size: Tuple[int, int], resample: Resampling) -> AsyncPixels:
+        return await AsyncPixels.from_image(image, size, resample)
+
+
+class VectorImageLabel(BaseImageLabel):
+    DEFAULT_CSS = """
+    VectorImageLabel {
+        height: 1fr;
+        width: 1fr;
+        align: center middle;
+        text-align: center;
+    }
+    """
     
-    async def on_resize(self) -> None:
-        image, resample = (self.default_image, Resampling.NEAREST) if (self.image is None) else (self.image, self.image_resample)
-        new_size = (self.size[0], self.size[1])
-        if self.last_image_size != new_size:
-            self.image_text = await AsyncPixels.from_image(image, new_size, resample)
-            self.last_image_size = new_size
-        self.update(self.image_text)
+    async def pixels_from_image(self, image: Image.Image, size: Tuple[int, int], resample: Resampling) -> "HalfBlockPixels":
+        from ..modules.halfblock import HalfBlockPixels
+        return await asyncio.to_thread(HalfBlockPixels.from_image, image, size, resample)
+
+
+class ProcessImageLabel(BaseImageLabel):
+    """Renders like `VectorImageLabel`, but resizes the image in a persistent pool of processes, which receive the pixels through the shared memory."""
+    DEFAULT_CSS = """
+    ProcessImageLabel {
+        height: 1fr;
+        width: 1fr;
+        align: center middle;
+        text-align: center;
+    }
+    """
+    
+    def __init__(self, *args, pool: Optional["ImageProcessPool"]=None, **kwargs) -> None:
+        from ..types import ImageProcessPool
+        super().__init__(*args, **kwargs)
+        self.pool = pool or ImageProcessPool()
+    
+    async def pixels_from_image(self, image: Image.Image, size: Tuple[int, int], resample: Resampling) -> "HalfBlockPixels":
+        return await self.pool.aio_render(image, size, resample)
     
-    async def update_image(self, image: Optional[Image.Image]=None) -> None:
-        self.image = image
-        image, resample = (self.default_image, Resampling.NEAREST) if (self.image is None) else (self.image, self.image_resample)
-        self.image_text = await AsyncPixels.from_image(image, (self.size[0], self.size[1]), resample)
-        self.update(self.image_text)
\ No newline at end of file
+    def on_unmount(self) -> None:
+        self.pool.close()
@@ -1,29 +1,22 @@
-from textual.widgets import Label, ListItem, ListView
+from rich.segment import Segment
+from textual import events
+from textual.binding import Binding
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
 # > Typing
-from typing import Optional, Dict, Sequence
+from typing import Optional, Dict, Iterable, Tuple, List
 # > Local Import's
-from .Labels import FillLabel
 from ..codeсbase import CodecBase
-from ..functions import get_sound_basename, aiter
+from ..types import LibraryIndex
+from ..functions import get_sound_basename
 
 # ! Children Classes
-class PlayListViewItem(ListItem):
-    DEFAULT_CSS = """
-    PlayListViewItem {
-        height: 4;
-    }
-    PlayListViewItem .title-label {
-        height: 1;
-        color: #cacaca;
-    }
-    PlayListViewItem .subtitle-label {
-        height: 1;
-        color: #a9a9a9;
-    }
-    PlayListViewItem FillLabel {
-        height: 1;
-    }
-    """
+class PlayListViewItem:
+    """The row of the playlist. It is not a widget: the rows are drawn by `PlayListView` only when they are visible."""
+    __slots__ = ("sound", "sound_sha1", "title", "first_subtitle", "second_subtitle", "view")
     
     def __init__(
         self,
@@ -33,17 +26,12 @@ class PlayListViewItem(ListItem):
         first_subtitle: str="",
         second_subtitle: str=""
     ) -> None:
-        super().__init__()
-        self.title_label = Label(title, classes="title-label")
-        self.first_subtitle_label = Label(f" {first_subtitle}", classes="subtitle-label")
-        self.second_subtitle_label = Label(f" {second_subtitle}", classes="subtitle-label")
         self.sound = sound
         self.sound_sha1 = sound_sha1
-        
-        self.compose_add_child(self.title_label)
-        self.compose_add_child(self.first_subtitle_label)
-        self.compose_add_child(self.second_subtitle_label)
-        self.compose_add_child(FillLabel('─'))
+        self.title = title
+        self.first_subtitle = f" {first_subtitle}"
+        self.second_subtitle = f" {second_subtitle}"
+        self.view: Optional["PlayListView"] = None
     
     async def update_labels(
         self,
@@ -51,19 +39,68 @@ class PlayListViewItem(ListItem):
         first_subtitle: Optional[str]=None,
         second_subtitle: Optional[str]=None,
     ) -> None:
-        if title is not None: self.title_label.update(title)
-        if first_subtitle is not None: self.first_subtitle_label.update(first_subtitle)
-        if second_subtitle is not None: self.second_subtitle_label.update(second_subtitle)
+        if title is not None: self.title = title
+        if first_subtitle is not None: self.first_subtitle = first_subtitle
+        if second_subtitle is not None: self.second_subtitle = second_subtitle
+        if self.view is not None:
+            self.view.refresh_rows()
 
 # ! Main Class
-class PlayListView(ListView):
+class PlayListView(ScrollView, can_focus=True):
     DEFAULT_CSS = """
     PlayListView {
         height: 1fr;
+        overflow-x: hidden;
+    }
+    PlayListView > .playlist-view--title {
+        color: #cacaca;
+    }
+    PlayListView > .playlist-view--subtitle {
+        color: #a9a9a9;
+    }
+    PlayListView > .playlist-view--highlight {
+        background: $accent 50%;
+    }
+    PlayListView:focus > .playlist-view--highlight {
+        background: $accent;
     }
     """
-    highlighted_child: Optional[PlayListViewItem]
-    children: Sequence[PlayListViewItem]
+    COMPONENT_CLASSES = {
+        "playlist-view--title",
+        "playlist-view--subtitle",
+        "playlist-view--separator",
+        "playlist-view--highlight"
+    }
+    BINDINGS = [
+        Binding("enter", "select_cursor", "Select", show=False),
+        Binding("up", "cursor_up", "Cursor Up", show=False),
+        Binding("down", "cursor_down", "Cursor Down", show=False)
+    ]
+    ITEM_HEIGHT = 4
+    """The number of lines occupied by one row."""
+    OVERSCAN = 2
+    """The number of rows outside the viewport that are kept rendered."""
+    
+    index: reactive[Optional[int]] = reactive(None, always_update=True)
+    """The index of the highlighted row."""
+    
+    # ! Messages
+    class Selected(Message):
+        """Posted when a row is selected (clicked, the enter key is pressed or one of the `select_*` methods is called)."""
+        def __init__(self, playlist_view: "PlayListView", item: PlayListViewItem) -> None:
+            super().__init__()
+            self.playlist_view = playlist_view
+            self.item = item
+        
+        @property
+        def control(self) -> "PlayListView":
+            return self.playlist_view
+    
+    # ! Propertyes
+    @property
+    def highlighted_child(self) -> Optional[PlayListViewItem]:
+        if (self.index is not None) and (0 <= self.index < len(self.items)):
+            return self.items[self.index]
     
     @property
     def currect_sound(self) -> Optional[CodecBase]:
@@ -79,76 +116,252 @@ class PlayListView(ListView):
         if self.highlighted_child is not None:
             return self.highlighted_child.sound_sha1
     
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(self, *args, library: Optional[LibraryIndex]=None, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        self.library = library
+        self.items: List[PlayListViewItem] = []
+        """The rows of the playlist."""
         self.sounds: Dict[str, CodecBase] = {}
+        """Sounds by their sha1."""
+        self.sounds_items: Dict[str, PlayListViewItem] = {}
+        """Playlist items by the sha1 of their sounds."""
+        self.sounds_indexes: Dict[str, int] = {}
+        """Positions of the playlist items by the sha1 of their sounds."""
+        self.rendered_rows: Dict[int, Tuple[Tuple[int, bool], List[Strip]]] = {}
+        """The rendered lines of the rows that are in the viewport (plus `OVERSCAN`)."""
     
-    # ! Sync Methods
-    def add_sound(self, sound: CodecBase) -> str:
-        sound_sha1 = sound.__sha1__(65536)
-        self.sounds[sound_sha1] = sound
-        self.append(
-            PlayListViewItem(
-                sound,
-                sound_sha1,
-                f"{get_sound_basename(sound)}",
-                "{duration} sec, {channel_mode}, {samplerate} Hz, {bitrate} kbps, {codec_name}".format(
-                    duration=round(sound.duration),
-                    channel_mode="Mono" if sound.channels <= 1 else "Stereo",
-                    samplerate=round(sound.samplerate),
-                    bitrate=round(sound.bitrate / 1000),
-                    codec_name=str(sound.codec_name)
-                ),
-                sound.__namerepr__()
-            )
+    # ! Rendering Methods
+    def refresh_rows(self) -> None:
+        """Discarding the rendered rows and redrawing the visible part of the playlist."""
+        self.rendered_rows.clear()
+        self.virtual_size = Size(0, len(self.items) * self.ITEM_HEIGHT)
+        self.refresh()
+    
+    def render_row(self, row: int, width: int) -> List[Strip]:
+        item = self.items[row]
+        title_style = self.get_component_rich_style("playlist-view--title")
+        subtitle_style = self.get_component_rich_style("playlist-view--subtitle")
+        separator_style = self.get_component_rich_style("playlist-view--separator")
+        strips = [
+            Strip([Segment(item.title, title_style)]).adjust_cell_length(width, title_style),
+            Strip([Segment(item.first_subtitle, subtitle_style)]).adjust_cell_length(width, subtitle_style),
+            Strip([Segment(item.second_subtitle, subtitle_style)]).adjust_cell_length(width, subtitle_style),
+            Strip([Segment("─" * width, separator_style)], width)
+        ]
+        if row == self.index:
+            highlight_style = self.get_component_rich_style("playlist-view--highlight")
+            strips = [strip.apply_style(highlight_style) for strip in strips]
+        return strips
+    
+    def render_line(self, y: int) -> Strip:
+        scroll_y = self.scroll_offset.y
+        width = self.size.width
+        row, row_line = divmod(scroll_y + y, self.ITEM_HEIGHT)
+        if not (0 <= row < len(self.items)):
+            return Strip.blank(width, self.rich_style)
+        key = (width, row == self.index)
+        rendered = self.rendered_rows.get(row, None)
+        if (rendered is None) or (rendered[0] != key):
+            rendered = (key, self.render_row(row, width))
+            self.rendered_rows[row] = rendered
+            # * Only the rows near the viewport are kept
+            first_row = (scroll_y // self.ITEM_HEIGHT) - self.OVERSCAN
+            last_row = ((scroll_y + self.size.height) // self.ITEM_HEIGHT) + self.OVERSCAN
+            for cached_row in [r for r in self.rendered_rows.keys() if not (first_row <= r <= last_row)]:
+                del self.rendered_rows[cached_row]
+        return rendered[1][row_line]
+    
+    def scroll_to_index(self, index: int) -> None:
+        self.scroll_to_region(
+            Region(0, index * self.ITEM_HEIGHT, self.size.width, self.ITEM_HEIGHT),
+            animate=False
         )
+    
+    # ! Textual Methods
+    def validate_index(self, index: Optional[int]) -> Optional[int]:
+        if (index is None) or (len(self.items) == 0):
+            return None
+        return max(0, min(index, len(self.items) - 1))
+    
+    def watch_index(self, old_index: Optional[int], new_index: Optional[int]) -> None:
+        for row in (old_index, new_index):
+            if row is not None:
+                self.rendered_rows.pop(row, None)
+        if new_index is not None:
+            self.scroll_to_index(new_index)
+        self.refresh()
+    
+    def on_resize(self) -> None:
+        self.rendered_rows.clear()
+    
+    def on_focus(self) -> None:
+        self.rendered_rows.clear()
+    
+    def on_blur(self) -> None:
+        self.rendered_rows.clear()
+    
+    def on_click(self, event: events.Click) -> None:
+        row = (event.y + self.scroll_offset.y) // self.ITEM_HEIGHT
+        if 0 <= row < len(self.items):
+            self.select_by_index(row)
+    
+    def action_cursor_up(self) -> None:
+        if self.index is None:
+            self.index = 0
+        elif self.index > 0:
+            self.index -= 1
+    
+    def action_cursor_down(self) -> None:
+        if self.index is None:
+            self.index = 0
+        elif self.index < len(self.items) - 1:
+            self.index += 1
+    
+    def action_select_cursor(self) -> None:
+        if self.highlighted_child is not None:
+            self.select_child(self.highlighted_child)
+    
+    # ! Hash Methods
+    def get_sound_sha1(self, sound: CodecBase) -> str:
+        if self.library is not None:
+            return self.library.sha1(sound, 65536)
+        return sound.__sha1__(65536)
+    
+    async def aio_get_sound_sha1(self, sound: CodecBase) -> str:
+        if self.library is not None:
+            return await self.library.aio_sha1(sound, 65536)
+        return await sound.__aio_sha1__(65536)
+    
+    # ! Items Methods
+    @staticmethod
+    def create_item(sound: CodecBase, sound_sha1: str) -> PlayListViewItem:
+        return PlayListViewItem(
+            sound,
+            sound_sha1,
+            f"{get_sound_basename(sound)}",
+            "{duration} sec, {channel_mode}, {samplerate} Hz, {bitrate} kbps, {codec_name}".format(
+                duration=round(sound.duration),
+                channel_mode="Mono" if sound.channels <= 1 else "Stereo",
+                samplerate=round(sound.samplerate),
+                bitrate=round(sound.bitrate / 1000),
+                codec_name=str(sound.codec_name)
+            ),
+            sound.__namerepr__()
+        )
+    
+    def index_item(self, item: PlayListViewItem) -> None:
+        """Adding an item to the end of the playlist and the index."""
+        item.view = self
+        self.sounds[item.sound_sha1] = item.sound
+        self.sounds_items[item.sound_sha1] = item
+        self.sounds_indexes[item.sound_sha1] = len(self.items)
+        self.items.append(item)
+    
+    def unindex_item(self, item: PlayListViewItem) -> int:
+        """Removing an item from the playlist and the index, the positions of the next items are shifted.
+        
+        Returns:
+            int: The position that the item occupied.
+        """
+        item.view = None
+        del self.sounds[item.sound_sha1]
+        del self.sounds_items[item.sound_sha1]
+        index = self.sounds_indexes.pop(item.sound_sha1)
+        del self.items[index]
+        for sha1, position in self.sounds_indexes.items():
+            if position > index:
+                self.sounds_indexes[sha1] = position - 1
+        return index
+    
+    def reindex_item(self, item: PlayListViewItem, index: int) -> int:
+        """Moving an item in the playlist and the index, the positions of the items between are shifted.
+        
+        Returns:
+            int: The position that the item occupied.
+        """
+        last_index = self.sounds_indexes[item.sound_sha1]
+        for sha1, position in self.sounds_indexes.items():
+            if last_index < position <= index:
+                self.sounds_indexes[sha1] = position - 1
+            elif index <= position < last_index:
+                self.sounds_indexes[sha1] = position + 1
+        self.sounds_indexes[item.sound_sha1] = index
+        self.items.insert(index, self.items.pop(last_index))
+        return last_index
+    
+    # ! Sync Methods
+    def add_sound(self, sound: CodecBase, sound_sha1: Optional[str]=None) -> str:
+        if sound_sha1 is None:
+            sound_sha1 = self.get_sound_sha1(sound)
+        if sound_sha1 not in self.sounds:
+            self.index_item(self.create_item(sound, sound_sha1))
+            self.refresh_rows()
         return sound_sha1
     
+    def remove_sound(self, sha1: str) -> None:
+        item = self.get_child_by_sha1(sha1)
+        index = self.unindex_item(item)
+        item.sound.discard()
+        if self.index is not None:
+            self.index = (self.index - 1) if (self.index > index) else self.index
+        self.refresh_rows()
+    
+    def move_sound(self, sha1: str, index: int) -> None:
+        item = self.get_child_by_sha1(sha1)
+        if not (0 <= index < len(self.items)):
+            raise IndexError(f"There is no position with such an index: {repr(index)}.")
+        last_index = self.reindex_item(item, index)
+        if self.index == last_index:
+            self.index = index
+        self.refresh_rows()
+    
+    def exist_sha1(self, sha1: str) -> bool:
+        return sha1 in self.sounds
+    
     def exist_sound(self, sound: CodecBase) -> bool:
-        check_sound_sha1 = sound.__sha1__(65536)
-        child: PlayListViewItem
-        for child in self.children:
-            if child.sound_sha1 == check_sound_sha1:
-                return True
-        return False
+        return self.exist_sha1(self.get_sound_sha1(sound))
     
     def get_sound_by_index(self, index: int) -> CodecBase:
-        if len(self.children) > index:
-            return self.children[index].sound
+        if len(self.items) > index:
+            return self.items[index].sound
         raise IndexError(f"There is no `Sound` with such an index: {index}.")
     
     def get_sound_by_sha1(self, sha1: str) -> CodecBase:
-        for child in self.children:
-            if child.sound_sha1 == sha1:
-                return child.sound
+        if (sound:=self.sounds.get(sha1, None)) is not None:
+            return sound
         raise IndexError(f"There is no `Sound` with such a sha1: {sha1}")
     
+    def get_index_by_sha1(self, sha1: str) -> int:
+        if (index:=self.sounds_indexes.get(sha1, None)) is not None:
+            return index
+        raise IndexError(f"There is no `PlayListViewItem` with such a sha1: {repr(sha1)}.")
+    
     def get_child_by_index(self, index: int) -> PlayListViewItem:
-        if len(self.children) > index:
-            return self.children[index]
+        if len(self.items) > index:
+            return self.items[index]
         raise IndexError(f"There is no `PlayListViewItem` with such an index: {repr(index)}.")
     
     def get_child_by_sha1(self, sha1: str) -> PlayListViewItem:
-        for child in self.children:
-            if child.sound_sha1 == sha1:
-                return child
+        if (item:=self.sounds_items.get(sha1, None)) is not None:
+            return item
         raise IndexError(f"There is no `PlayListViewItem` with such a sha1: {repr(sha1)}.")
     
     def get_next_sound_index(self) -> Optional[int]:
         if self.currect_sound_index is not None:
-            if len(self.children) > (self.currect_sound_index + 1):
+            if len(self.items) > (self.currect_sound_index + 1):
                 return self.currect_sound_index + 1
             else:
                 return 0
     
     def select_child(self, widget: PlayListViewItem) -> None:
-        self._on_list_item__child_clicked(ListItem._ChildClicked(widget))
+        self.index = self.sounds_indexes[widget.sound_sha1]
+        self.post_message(self.Selected(self, widget))
     
     def select_by_index(self, index: int) -> None:
         self.select_child(self.get_child_by_index(index))
     
     def select_by_sha1(self, sha1: str) -> None:
-        self.select_child(self.get_child_by_index(sha1))
+        self.select_child(self.get_child_by_sha1(sha1))
     
     def select_next_sound(self) -> None:
         index = self.get_next_sound_index()
@@ -157,71 +370,62 @@ class PlayListView(ListView):
     
     # ! Async Methods
     async def aio_exist_sound(self, sound: CodecBase) -> bool:
-        check_sound_sha1 = await sound.__aio_sha1__(65536)
-        child: PlayListViewItem
-        async for child in aiter(self.children):
-            if child.sound_sha1 == check_sound_sha1:
-                return True
-        return False
-    
-    async def aio_add_sound(self, sound: CodecBase) -> str:
-        sound_sha1 = await sound.__aio_sha1__(65536)
-        self.sounds[sound_sha1] = sound
-        await self.append(
-            PlayListViewItem(
-                sound, sound_sha1,
-                f"{get_sound_basename(sound)}",
-                "{duration} sec, {channel_mode}, {samplerate} Hz, {bitrate} kbps, {codec_name}".format(
-                    duration=round(sound.duration),
-                    channel_mode="Mono" if sound.channels <= 1 else "Stereo",
-                    samplerate=round(sound.samplerate),
-                    bitrate=round(sound.bitrate / 1000),
-                    codec_name=str(sound.codec_name)
-                ),
-                sound.__namerepr__()
-            )
-        )
-        return sound_sha1
+        return self.exist_sha1(await self.aio_get_sound_sha1(sound))
+    
+    async def aio_add_sound(self, sound: CodecBase, sound_sha1: Optional[str]=None) -> str:
+        if sound_sha1 is None:
+            sound_sha1 = await self.aio_get_sound_sha1(sound)
+        return self.add_sound(sound, sound_sha1)
+    
+    async def aio_add_sounds(self, sounds: Iterable[Tuple[CodecBase, str]]) -> List[str]:
+        """Adding several sounds to the playlist with a single redraw.
+        
+        Args:
+            sounds (Iterable[Tuple[CodecBase, str]]): Pairs of the sound and its sha1.
+        
+        Returns:
+            List[str]: The sha1 of the sounds that have been added (duplicates are skipped).
+        """
+        added: List[str] = []
+        for sound, sound_sha1 in sounds:
+            if sound_sha1 not in self.sounds:
+                self.index_item(self.create_item(sound, sound_sha1))
+                added.append(sound_sha1)
+        if len(added) > 0:
+            self.refresh_rows()
+        return added
+    
+    async def aio_remove_sound(self, sha1: str) -> None:
+        self.remove_sound(sha1)
     
     async def aio_get_sound_by_index(self, index: int) -> CodecBase:
-        if len(self.children) > index:
-            return self.children[index].sound
-        raise IndexError(f"There is no `Sound` with such an index: {index}.")
+        return self.get_sound_by_index(index)
     
     async def aio_get_sound_by_sha1(self, sha1: str) -> CodecBase:
-        async for child in aiter(self.children):
-            if child.sound_sha1 == sha1:
-                return child.sound
-        raise IndexError(f"There is no `Sound` with such a sha1: {sha1}")
+        return self.get_sound_by_sha1(sha1)
+    
+    async def aio_get_index_by_sha1(self, sha1: str) -> int:
+        return self.get_index_by_sha1(sha1)
     
     async def aio_get_child_by_index(self, index: int) -> PlayListViewItem:
-        if len(self.children) > index:
-            return self.children[index]
-        raise IndexError(f"There is no `PlayListViewItem` with such an index: {repr(index)}.")
+        return self.get_child_by_index(index)
     
     async def aio_get_child_by_sha1(self, sha1: str) -> PlayListViewItem:
-        async for child in aiter(self.children):
-            if child.sound_sha1 == sha1:
-                return child
-        raise IndexError(f"There is no `PlayListViewItem` with such a sha1: {repr(sha1)}.")
+        return self.get_child_by_sha1(sha1)
     
     async def aio_get_next_sound_index(self) -> Optional[int]:
-        if self.currect_sound_index is not None:
-            if len(self.children) > (self.currect_sound_index + 1):
-                return self.currect_sound_index + 1
-            else:
-                return 0
+        return self.get_next_sound_index()
     
     async def aio_select_child(self, widget: PlayListViewItem) -> None:
-        self._on_list_item__child_clicked(ListItem._ChildClicked(widget))
+        self.select_child(widget)
     
     async def aio_select_by_index(self, index: int) -> None:
         await self.aio_select_child(await self.aio_get_child_by_index(index))
     
     async def aio_select_by_sha1(self, sha1: str) -> None:
-        await self.aio_select_child(await self.aio_get_child_by_index(sha1))
+        await self.aio_select_child(await self.aio_get_child_by_sha1(sha1))
     
     async def aio_select_next_sound(self) -> None:
         index = await self.aio_get_next_sound_index()
         if index is not None:
-            await self.aio_select_by_index(index)
\ No newline at end of file
+            await self.aio_select_by_index(index)
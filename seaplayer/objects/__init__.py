@@ -5,7 +5,7 @@ from .Buttons import ClikableButton, WaitButton
 from .Notification import Nofy, CallNofy
 from .ProgressBar import IndeterminateProgress
 from .DataOptions import DataOption, DataOptionList
-from .Image import AsyncImageLabel, StandartImageLabel
+from .Image import AsyncImageLabel, StandartImageLabel, VectorImageLabel, ProcessImageLabel
 from .PlayList import PlayListView, PlayListViewItem
 from .Configurate import ConfigurateListItem, ConfigurateList
 from .Radio import DataRadioSet, DataRadioButton
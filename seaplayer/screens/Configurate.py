@@ -270,11 +270,58 @@ class Configurate(Screen):
             )
             if INIT_SOUNDDEVICE:
                 yield self.create_configurator_sound_devices()
+            yield self.create_configurator_integer(
+                "app.config.max_live_sounds",
+                1, 1, 32, "",
+                self.ll.get("configurate.sound"),
+                self.ll.get("configurate.sound.max_live_sounds"),
+                self.ll.get("configurate.sound.max_live_sounds.desc")
+            )
+            yield self.create_configurator_integer(
+                "app.config.url_prebuffer_size",
+                128, 0, 8192, "KB",
+                self.ll.get("configurate.sound"),
+                self.ll.get("configurate.sound.url_prebuffer_size"),
+                self.ll.get("configurate.sound.url_prebuffer_size.desc")
+            )
+            yield self.create_configurator_integer(
+                "app.config.url_cache_size",
+                256, 0, 65536, "MB",
+                self.ll.get("configurate.sound"),
+                self.ll.get("configurate.sound.url_cache_size"),
+                self.ll.get("configurate.sound.url_cache_size.desc")
+            )
+            yield self.create_configurator_integer(
+                "app.config.midi_cache_size",
+                256, 0, 65536, "MB",
+                self.ll.get("configurate.sound"),
+                self.ll.get("configurate.sound.midi_cache_size"),
+                self.ll.get("configurate.sound.midi_cache_size.desc")
+            )
+            yield self.create_configurator_literal(
+                "app.config.midi_streaming",
+                [
+                    (True, self.ll.get("words.on")),
+                    (False, self.ll.get("words.off"))
+                ],
+                self.ll.get("configurate.sound"),
+                self.ll.get("configurate.sound.midi_streaming"),
+                self.ll.get("configurate.sound.midi_streaming.desc")
+            )
+            yield self.create_configurator_integer(
+                "app.config.midi_render_workers",
+                1, 0, 64, "",
+                self.ll.get("configurate.sound"),
+                self.ll.get("configurate.sound.midi_render_workers"),
+                self.ll.get("configurate.sound.midi_render_workers.desc")
+            )
             yield self.create_configurator_literal(
                 "app.config.image_update_method",
                 [
                     ("sync", self.ll.get("configurate.image.update_method.sync")),
-                    ("async", self.ll.get("configurate.image.update_method.async"))
+                    ("async", self.ll.get("configurate.image.update_method.async")),
+                    ("vector", self.ll.get("configurate.image.update_method.vector")),
+                    ("process", self.ll.get("configurate.image.update_method.process"))
                 ],
                 self.ll.get("configurate.image"),
                 self.ll.get("configurate.image.update_method"),
@@ -318,6 +365,14 @@ class Configurate(Screen):
                 self.ll.get("configurate.playback.max_volume_percent.desc"),
                 False
             )
+            yield self.create_configurator_integer(
+                "app.config.prebuffer_seconds",
+                1, 1, 30, f" {self.ll.get('words.second.char')}",
+                self.ll.get("configurate.playback"),
+                self.ll.get("configurate.playback.prebuffer_seconds"),
+                self.ll.get("configurate.playback.prebuffer_seconds.desc"),
+                False
+            )
             yield self.create_configurator_literal(
                 "app.config.recursive_search",
                 [
@@ -329,6 +384,14 @@ class Configurate(Screen):
                 self.ll.get("configurate.playlist.recursive_search.desc"),
                 False
             )
+            yield self.create_configurator_integer(
+                "app.config.loading_workers",
+                1, 1, 32, "",
+                self.ll.get("configurate.playlist"),
+                self.ll.get("configurate.playlist.loading_workers"),
+                self.ll.get("configurate.playlist.loading_workers.desc"),
+                False
+            )
             yield self.create_configurator_literal(
                 "app.config.logging",
                 [
@@ -1,26 +1,27 @@
 import os
 import glob
+import time
 import asyncio
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 # > Graphics
 from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding, _Bindings
+from textual.timer import Timer
 from textual.containers import Horizontal, Vertical, Container
-from textual.widgets import Header, Footer, Static, Label, Button, Input, ListView
-# > Image Works
-from PIL import Image
+from textual.widgets import Header, Footer, Static, Label, Button, Input
 # > Typing
-from typing import Optional, Literal, Tuple, List, Type, Union
+from typing import Optional, Literal, Tuple, List, Dict, Type, Union, Callable, TYPE_CHECKING
 # > Local Imports
 from .config import SeaPlayerConfig
-from .types import Cacher, Environment
+from .types import Cacher, Environment, LibraryIndex, FilesCache, ArtworkCache
 from .codeсbase import CodecBase
 from .languages import LanguageLoader
+from .modules.startup import startup, lazy
 from .screens import Unknown, Configurate, UNKNOWN_OPEN_KEY
-from .codecs import codecs
 from .functions import (
-    aiter, awrap,
-    image_from_bytes,
+    awrap,
     get_sound_basename,
     aio_check_status_code
 )
@@ -31,6 +32,8 @@ from .objects import (
     PlayListView,
     AsyncImageLabel,
     StandartImageLabel,
+    VectorImageLabel,
+    ProcessImageLabel,
     IndeterminateProgress
 )
 from .units import (
@@ -47,11 +50,15 @@ from .units import (
     LOCALDIR,
     ENABLE_PLUGIN_SYSTEM,
     CACHE_DIRPATH,
-    LANGUAGES_DIRPATH
+    LANGUAGES_DIRPATH,
+    SOUNDS_LOADING_BATCH_SIZE
 )
 # > Plugin System Init
 if ENABLE_PLUGIN_SYSTEM:
     from .plug import PluginLoader
+# > Lazy Imports (the codecs pull in the audio stack, they are imported when the app is created)
+if TYPE_CHECKING:
+    from .codecs import SignatureTable
 
 # ! Main Functions
 def build_bindings(config: SeaPlayerConfig, ll: LanguageLoader):
@@ -85,25 +92,47 @@ class SeaPlayer(App):
     # ! SeaPlayer Configuration
     cache: Cacher = Cacher(CACHE_DIRPATH)
     """An image of a class for caching variables."""
-    config: SeaPlayerConfig = SeaPlayerConfig(CONFIG_FILEPATH)
-    """The image of the SeaPlayer configuration file."""
-    ll: LanguageLoader = LanguageLoader(LANGUAGES_DIRPATH, config.lang)
-    """An image of the class for receiving the loaded SeaPlayer translation. With the translation uploaded from the `seaplayer/langs/` directory."""
-    image_type: Optional[Union[Type[AsyncImageLabel], Type[StandartImageLabel]]] = None
-    env = Environment(
-        {
-            "seaplayer": {
-                "codecs": [*codecs],
-                "codecs_kwargs": {
-                    "sound_fonts_path": config.sound_font_path,
-                    "sound_device_id": config.output_sound_device_id
+    image_type: Optional[Union[Type[AsyncImageLabel], Type[StandartImageLabel], Type[VectorImageLabel], Type[ProcessImageLabel]]] = None
+    
+    # * The subsystems are created on the first use, not when the module is imported
+    @lazy
+    def library(cls) -> LibraryIndex:
+        """An image of the class of the persistent index of hashes and metadata of the sound files."""
+        return LibraryIndex(os.path.join(CACHE_DIRPATH, "library.sqlite"))
+    
+    @lazy
+    def artwork(cls) -> ArtworkCache:
+        """An image of the class of the cache of the cover art thumbnails and their renderings."""
+        return ArtworkCache(os.path.join(CACHE_DIRPATH, "artwork"))
+    
+    @lazy
+    def config(cls) -> SeaPlayerConfig:
+        """The image of the SeaPlayer configuration file."""
+        return SeaPlayerConfig(CONFIG_FILEPATH)
+    
+    @lazy
+    def ll(cls) -> LanguageLoader:
+        """An image of the class for receiving the loaded SeaPlayer translation. With the translation uploaded from the `seaplayer/langs/` directory."""
+        return LanguageLoader(LANGUAGES_DIRPATH, cls.config.lang, cache_dirpath=os.path.join(CACHE_DIRPATH, "langs"))
+    
+    @lazy
+    def env(cls) -> Environment:
+        from .codecs import codecs
+        return Environment(
+            {
+                "seaplayer": {
+                    "codecs": [*codecs],
+                    "codecs_kwargs": {
+                        "sound_fonts_path": cls.config.sound_font_path,
+                        "sound_device_id": cls.config.output_sound_device_id
+                    }
                 }
             }
-        }
-    )
+        )
     
     # ! Bindings
-    BINDINGS = list(build_bindings(config, ll))
+    BINDINGS = []
+    """The bindings are built from the configuration in `SeaPlayer.update_bindings`."""
     
     # ! Template Configuration
     currect_sound: Optional[CodecBase] = None
@@ -115,30 +144,75 @@ class SeaPlayer(App):
     last_playback_status: Optional[Literal[0, 1, 2]] = None
     playback_mode: int = cache.var("playback_mode", 0)
     """The current playback mode (cached)."""
+    prebuffered_sound: Optional[CodecBase] = None
+    """The next sound in the playlist, prepared in advance in the replay list mode."""
+    last_switch_latency: Optional[float] = None
+    """The time in seconds that the last switch to the next sound took."""
+    watched_sound: Optional[CodecBase] = None
+    """The sound whose end of the playback is watched (usually the current one)."""
+    watched_callbacks: Tuple[Callable[[], None], ...] = ()
+    fallback_watch_timer: Optional[Timer] = None
     block_select: bool = False
     block_playback_control: bool = False
     last_handlered_values: List[str] = []
     started: bool = True
     
     # ! Init Objects
-    log_menu = LogMenu(
-        enable_logging=config.logging,
-        wrap=True, highlight=True, markup=True
-    )
+    @lazy
+    def log_menu(cls) -> LogMenu:
+        return LogMenu(
+            enable_logging=cls.config.logging,
+            wrap=True, highlight=True, markup=True
+        )
     
     # ! Log Functions
-    info = log_menu.info
-    error = log_menu.error
-    warn = log_menu.warn
-    exception = log_menu.exception
+    def info(self, msg: str, *, in_console: bool=False) -> None:
+        self.log_menu.info(msg, in_console=in_console)
+    
+    def error(self, msg: str, *, in_console: bool=False) -> None:
+        self.log_menu.error(msg, in_console=in_console)
+    
+    def warn(self, msg: str, *, in_console: bool=False) -> None:
+        self.log_menu.warn(msg, in_console=in_console)
+    
+    def exception(self, e: Exception, *, in_console: bool=False) -> None:
+        self.log_menu.exception(e, in_console=in_console)
+    
+    def on_cache_error(self, e: Exception) -> None:
+        """Logging the error of the background writing of the cached variables (it is called from the thread of the timer)."""
+        loop = self.main_loop
+        if (loop is None) or loop.is_closed() or (not loop.is_running()):
+            # * The app is not running, the `Cacher` prints the error to stderr
+            raise RuntimeError("The app is not running.")
+        try:
+            called_from_app = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            called_from_app = False
+        if called_from_app:
+            self.exception(e)
+        else:
+            # * Not waiting for the app, so the timer is never blocked by it
+            loop.call_soon_threadsafe(self.exception, e)
     
     # ! App Init
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        from .codecs import live_sounds, render_scheduler, AnySound
+        self.main_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.cache.error_handler = self.on_cache_error
+        live_sounds.capacity = max(1, self.config.max_live_sounds)
+        AnySound.url_prebuffer_size = (self.config.url_prebuffer_size * 1024) or None
+        if self.config.url_cache_size > 0:
+            AnySound.files_cache = FilesCache(os.path.join(CACHE_DIRPATH, "files"), self.config.url_cache_size * 1048576)
+        AnySound.midi_streaming = self.config.midi_streaming
+        render_scheduler.workers = max(1, self.config.midi_render_workers or os.cpu_count() or 1)
+        if self.config.midi_cache_size > 0:
+            AnySound.midi_cache = FilesCache(os.path.join(CACHE_DIRPATH, "midi"), self.config.midi_cache_size * 1048576)
         if ENABLE_PLUGIN_SYSTEM:
-            self.plugin_loader = PluginLoader(self)
-            self.plugin_loader.on_init()
-            self.update_bindings()
+            with startup.span("PluginLoader.on_init"):
+                self.plugin_loader = PluginLoader(self)
+                self.plugin_loader.on_init()
+        self.update_bindings()
     
     def update_bindings(self) -> None:
         bindings = list(build_bindings(self.config, self.ll))
@@ -309,11 +383,14 @@ class SeaPlayer(App):
         Args:
             sound (Optional[CodecBase]): The current sound.
         """
-        image = None
+        image, sha1 = None, None
         if sound is not None:
-            if sound.icon_data is not None:
-                image = image_from_bytes(sound.icon_data)
-        await self.player_image.update_image(image)
+            if self.playlist_view.currect_sound is sound:
+                sha1 = self.playlist_view.currect_sound_sha1
+            else:
+                sha1 = await self.playlist_view.aio_get_sound_sha1(sound)
+            image = await asyncio.to_thread(self.artwork.thumbnail, sha1, lambda: sound.icon_data)
+        await self.player_image.update_image(image, sha1)
     
     # ! Update Currect Sound
     async def aio_update_currect_sound(self) -> None:
@@ -321,17 +398,20 @@ class SeaPlayer(App):
         self.currect_sound = self.playlist_view.currect_sound
         self.currect_sound_index = self.playlist_view.currect_sound_index
         if self.currect_sound is not None:
+            from .codecs import render_scheduler
+            render_scheduler.prioritize(self.currect_sound.name)
+            await asyncio.to_thread(self.currect_sound.prepare)
             self.currect_sound.set_volume(self.currect_volume)
+        self.watch_sound(self.currect_sound)
     
     # ! Switch Mode Button
-    def gpms(
-        self,
-        modes: Tuple[str, str, str]=(
-            ll.get("player.button.mode.play"),
-            ll.get("player.button.mode.replay_sound"),
-            ll.get("player.button.mode.replay_list")
-        )
-    ) -> str:
+    def gpms(self, modes: Optional[Tuple[str, str, str]]=None) -> str:
+        if modes is None:
+            modes = (
+                self.ll.get("player.button.mode.play"),
+                self.ll.get("player.button.mode.replay_sound"),
+                self.ll.get("player.button.mode.replay_list")
+            )
         return modes[self.playback_mode]
     
     def switch_playback_mode(self) -> None:
@@ -348,34 +428,114 @@ class SeaPlayer(App):
             return f"{minutes}:{str(seconds).rjust(2,'0')} | {str(round(sound.get_volume()*100)).rjust(3)}%", pos, sound.duration
         return "0:00 |   0%", None, None
     
-    # ! Loop Functions
-    async def playback_control_loop(self) -> None:
-        while self.started:
-            sound = await self.aio_gcs()
-            if sound is not None:
-                if self.last_playback_status is not None:
-                    if self.playback_mode != 0:
-                        status = await aio_check_status_code(sound)
-                        if (self.last_playback_status == 1) and (status == 0):
-                            if not self.block_playback_control:
-                                self.info(f"The status of the current sound has changed to: {repr(status)}.")
-                                if self.playback_mode == 1:
-                                    self.currect_sound.play()
-                                    await self.aio_update_select_label(sound)
-                                    self.last_playback_status = 0
-                                    self.info(f"Replay this sound: {repr(self.currect_sound)}.")
-                                elif self.playback_mode == 2:
-                                    self.block_select = True
-                                    await self.playlist_view.aio_select_next_sound()
-                                    await self.aio_update_currect_sound()
-                                    if self.currect_sound is not None:
-                                        self.currect_sound.play()
-                                    await self.aio_update_select_label(self.currect_sound)
-                                    await self.aio_update_select_image(self.currect_sound)
-                                    self.last_playback_status = 0
-                                    self.block_select = False
-                                    self.info(f"Play next sound: {repr(self.currect_sound)}.")
-            await asyncio.sleep(0.1)
+    # ! Playback Watch Functions
+    def watch_sound(self, sound: Optional[CodecBase]) -> None:
+        """Subscribing to the end of the playback of the sound instead of the previous one.
+        
+        Args:
+            sound (Optional[CodecBase]): The current sound.
+        """
+        if self.watched_sound is not None:
+            for callback in self.watched_callbacks:
+                self.watched_sound.remove_finish_callback(callback)
+        if self.fallback_watch_timer is not None:
+            self.fallback_watch_timer.stop()
+            self.fallback_watch_timer = None
+        self.watched_sound, self.watched_callbacks = sound, ()
+        if sound is None:
+            return
+        on_finish = lambda: self.call_from_thread(self.on_sound_finished, sound)
+        on_near_end = lambda: self.call_from_thread(self.on_sound_near_end, sound)
+        if sound.add_finish_callback(on_finish):
+            sound.add_finish_callback(on_near_end, before=self.config.prebuffer_seconds)
+            self.watched_callbacks = (on_finish, on_near_end)
+        else:
+            # * The codec can't notify about the end, so its status is checked while it is selected
+            self.fallback_watch_timer = self.set_interval(0.1, partial(self.aio_check_sound_status, sound))
+    
+    def on_sound_finished(self, sound: CodecBase) -> None:
+        if self.started:
+            self.run_worker(
+                awrap(self.aio_sound_finished, sound),
+                name="Sound Finished",
+                group="seaplayer-playback",
+                description="Control of playback modes and status updates."
+            )
+    
+    def on_sound_near_end(self, sound: CodecBase) -> None:
+        if self.started and (self.playback_mode == 2):
+            self.run_worker(
+                awrap(self.aio_prebuffer_next_sound, sound),
+                name="Prebuffer Next Sound",
+                group="seaplayer-playback",
+                description="Preparing the next sound of the playlist."
+            )
+    
+    async def aio_check_sound_status(self, sound: CodecBase) -> None:
+        """Checking the status of the sound whose codec does not support the finish callbacks.
+        
+        Args:
+            sound (CodecBase): The current sound.
+        """
+        status = await aio_check_status_code(sound)
+        if (self.last_playback_status == 1) and (status == 0):
+            await self.aio_sound_finished(sound)
+        elif (self.playback_mode == 2) and (status == 1):
+            await self.aio_prebuffer_next_sound(sound)
+    
+    async def aio_prebuffer_next_sound(self, sound: CodecBase) -> None:
+        """Preparing the next sound of the playlist when the current one is close to the end.
+        
+        Args:
+            sound (CodecBase): The current sound.
+        """
+        if (sound is not self.currect_sound) or ((index:=await self.playlist_view.aio_get_next_sound_index()) is None):
+            return
+        next_sound = await self.playlist_view.aio_get_sound_by_index(index)
+        if (next_sound is sound) or (next_sound is self.prebuffered_sound):
+            return
+        if sound.duration - sound.get_pos() <= self.config.prebuffer_seconds:
+            start_time = time.perf_counter()
+            await asyncio.to_thread(next_sound.prepare)
+            next_sound.set_volume(self.currect_volume)
+            self.prebuffered_sound = next_sound
+            self.info(f"The next sound is prebuffered in {round((time.perf_counter()-start_time)*1000, 1)} ms: {repr(next_sound)}.")
+    
+    async def aio_sound_finished(self, sound: CodecBase) -> None:
+        """Switching the playback according to the playback mode when the sound has finished playing by itself.
+        
+        Args:
+            sound (CodecBase): The sound that has finished playing.
+        """
+        if (sound is not self.currect_sound) or self.block_playback_control:
+            return
+        switch_time = time.perf_counter()
+        self.last_playback_status = 0
+        self.info(f"The current sound has finished playing: {repr(sound)}.")
+        if self.playback_mode == 0:
+            await self.aio_update_select_label(sound)
+        elif self.playback_mode == 1:
+            self.currect_sound.play()
+            self.last_playback_status = 1
+            await self.aio_update_select_label(sound)
+            self.info(f"Replay this sound: {repr(self.currect_sound)}.")
+        elif self.playback_mode == 2:
+            self.block_select = True
+            await self.playlist_view.aio_select_next_sound()
+            await self.aio_update_currect_sound()
+            prebuffered = (self.currect_sound is not None) and (self.currect_sound is self.prebuffered_sound)
+            if self.currect_sound is not None:
+                self.currect_sound.play()
+            self.last_switch_latency = time.perf_counter() - switch_time
+            self.prebuffered_sound = None
+            self.last_playback_status = 1
+            await self.aio_update_select_label(self.currect_sound)
+            await self.aio_update_select_image(self.currect_sound)
+            self.block_select = False
+            self.info(
+                f"Play next sound: {repr(self.currect_sound)} "
+                f"(switch latency: {round(self.last_switch_latency*1000, 1)} ms, prebuffered: {prebuffered})."
+            )
     
     # ! Mounting Function
     def compose(self) -> ComposeResult:
@@ -404,19 +564,25 @@ class SeaPlayer(App):
             self.image_type = StandartImageLabel
         elif self.config.image_update_method == "async":
             self.image_type = AsyncImageLabel
+        elif self.config.image_update_method == "vector":
+            self.image_type = VectorImageLabel
+        elif self.config.image_update_method == "process":
+            self.image_type = ProcessImageLabel
         else:
             raise RuntimeError("The configuration 'image_update_method' is incorrect.")
         
+        from PIL import Image
         self.player_image = self.image_type(
             Image.open(IMGPATH_IMAGE_NOT_FOUND),
-            resample=RESAMPLING_SAFE[self.config.image_resample_method]
+            resample=RESAMPLING_SAFE[self.config.image_resample_method],
+            artwork=self.artwork
         )
         self.info(f"The picture from the media file is rendered using the {repr(self.config.image_update_method)} method.")
         
         # * Compositions Screen
         self.playlist_box = Container(classes="playlist-box")
         self.playlist_box.border_title = self.ll.get("playlist")
-        self.playlist_view = PlayListView(classes="playlist-view")
+        self.playlist_view = PlayListView(classes="playlist-view", library=self.library)
         
         self.playlist_add_sound_input = Input(
             classes="playlist-add-sound-input", id="addsoundinput",
@@ -459,13 +625,6 @@ class SeaPlayer(App):
             yield self.playlist_add_sound_input
         yield self.log_menu
         yield Footer()
-        self.pcw = self.run_worker(
-            self.playback_control_loop,
-            name="Playback Control Loop",
-            group="seaplayer-main",
-            description="Control of playback modes and status updates.",
-            thread=True
-        )
         self.info("---")
     
     # ! Currect Sound Controls
@@ -518,50 +677,113 @@ class SeaPlayer(App):
             sound.unpause()
     
     # ! Sound Controls
+    async def aio_load_sound(
+        self,
+        value: str,
+        executor: ThreadPoolExecutor,
+        signatures: "SignatureTable"
+    ) -> Optional[Tuple[CodecBase, str]]:
+        """Loading a value through the first compatible codec.
+        
+        Args:
+            value (str): The value to be loaded (file path, URL and so on).
+            executor (ThreadPoolExecutor): The pool in which the blocking codec methods are called.
+            signatures (SignatureTable): The signatures of the codecs, checked against the beginning of the file read once.
+        
+        Returns:
+            Optional[Tuple[CodecBase, str]]: The loaded sound and its sha1, or `None` if it could not be loaded.
+        """
+        from .codecs import read_header
+        loop = asyncio.get_running_loop()
+        if (record:=await loop.run_in_executor(executor, self.library.get, value)) is not None:
+            if self.playlist_view.exist_sha1(record.sha1):
+                self.info(f"The sound is already in the playlist: {repr(value)}")
+                return None
+            # * A known file is added as a descriptor, its sound is opened when it is selected
+            for codec in self.env['seaplayer']['codecs']:
+                if (codec.codec_name == record.codec_name) and hasattr(codec, "from_record"):
+                    return codec.from_record(record, **self.env['seaplayer']['codecs_kwargs']), record.sha1
+        try:
+            header = await loop.run_in_executor(executor, read_header, value)
+        except OSError:
+            header = None
+        matched = signatures.match(header)
+        codec: CodecBase
+        for codec in self.env['seaplayer']['codecs']:
+            if signatures.is_signed(codec) and (codec not in matched):
+                continue
+            self.info(f"Attempt to load via {repr(codec)}")
+            try:
+                if codec in matched:
+                    this_codec = True
+                elif hasattr(codec, "aio_is_this_codec"):
+                    this_codec = await codec.aio_is_this_codec(value)
+                else:
+                    this_codec = await loop.run_in_executor(executor, codec.is_this_codec, value)
+                if this_codec:
+                    sound: Optional[CodecBase] = None
+                    if getattr(codec, "sound_probed", False):
+                        # * The info is read from the headers, the sound is decoded when it is selected
+                        sound = await loop.run_in_executor(
+                            executor, partial(codec.from_probe, value, **self.env['seaplayer']['codecs_kwargs'])
+                        )
+                    if sound is None:
+                        if hasattr(codec, "__aio_init__"):
+                            sound = await codec.__aio_init__(value, **self.env['seaplayer']['codecs_kwargs'])
+                        else:
+                            sound = await loop.run_in_executor(
+                                executor, partial(codec, value, **self.env['seaplayer']['codecs_kwargs'])
+                            )
+                    return sound, await loop.run_in_executor(executor, self.library.sha1, sound, 65536)
+            except FileNotFoundError:
+                self.error(f"The file does not exist or is a directory: {repr(value)}")
+                break
+            except OSError:
+                pass
+            except Exception as e:
+                self.exception(e)
+        self.error(f"The sound could not be loaded: {repr(value)}")
+    
     async def adding_sounds_loader(self, handlered_values: List[str]) -> None:
-        added_oks = 0
+        added_oks, loaded_count = 0, 0
         loading_nofy = await self.aio_callnofy(
             self.ll.get("nofys.sound.found").format(count=len(handlered_values))
         )
+        from .codecs import SignatureTable
         self.env['seaplayer']['codecs'].sort(key=lambda x: x.codec_priority)
-        codec: CodecBase
-        async for value in aiter(handlered_values):
-            sound = None
-            async for codec in aiter(self.env['seaplayer']['codecs']):
-                self.info(f"Attempt to load via {repr(codec)}")
-                try:
-                    if hasattr(codec, "aio_is_this_codec"):
-                        this_codec = await codec.aio_is_this_codec(value)
-                    else:
-                        this_codec = codec.is_this_codec(value)
-                    if this_codec:
-                        if hasattr(codec, "__aio_init__"):
-                            try:
-                                sound: CodecBase = await codec.__aio_init__(value, **self.env['seaplayer']['codecs_kwargs'])
-                            except Exception as e:
-                                sound = None
-                                raise e
-                        else:
-                            try:
-                                sound: CodecBase = codec(value, **self.env['seaplayer']['codecs_kwargs'])
-                            except Exception as e:
-                                sound = None
-                                raise e
-                        if sound is not None:
-                            if not await self.playlist_view.aio_exist_sound(sound):
-                                await self.playlist_view.aio_add_sound(sound)
-                                self.info(f"Song added: {repr(sound)}")
-                                added_oks += 1
-                                break
-                except FileNotFoundError:
-                    self.error(f"The file does not exist or is a directory: {repr(value)}")
-                    break
-                except OSError:
-                    pass
-                except Exception as e:
-                    self.exception(e)
-            if sound is None:
-                self.error(f"The sound could not be loaded: {repr(value)}")
+        signatures = SignatureTable(self.env['seaplayer']['codecs'])
+        workers = max(1, self.config.loading_workers)
+        semaphore = asyncio.Semaphore(workers)
+        # * Results are added to the playlist in the order of the values
+        results: Dict[int, Optional[Tuple[CodecBase, str]]] = {}
+        next_index = 0
+        
+        async def load(index: int, value: str) -> None:
+            async with semaphore:
+                results[index] = await self.aio_load_sound(value, executor, signatures)
+        
+        async def flush(force: bool=False) -> None:
+            nonlocal next_index, added_oks
+            ready = 0
+            while (next_index + ready) in results:
+                ready += 1
+            if (ready >= SOUNDS_LOADING_BATCH_SIZE) or (force and (ready > 0)):
+                batch: List[Tuple[CodecBase, str]] = []
+                for index in range(next_index, next_index + ready):
+                    if (loaded:=results.pop(index)) is not None:
+                        batch.append(loaded)
+                next_index += ready
+                added_oks += len(await self.playlist_view.aio_add_sounds(batch))
+        
+        with ThreadPoolExecutor(workers, thread_name_prefix="seaplayer-loader") as executor:
+            tasks = [asyncio.create_task(load(index, value)) for index, value in enumerate(handlered_values)]
+            for task in asyncio.as_completed(tasks):
+                await task
+                loaded_count += 1
+                await flush(loaded_count == len(tasks))
+                loading_nofy.update(
+                    self.ll.get("nofys.sound.loading").format(done=loaded_count, count=len(tasks), added=added_oks)
+                )
         await loading_nofy.remove()
         self.info(f"Added [cyan]{added_oks}[/cyan] songs!")
         await self.aio_nofy(self.ll.get("nofys.sound.added").format(count=added_oks))
@@ -579,7 +801,7 @@ class SeaPlayer(App):
         self.block_playback_control = False
     
     # ! Playlist Actions
-    @on(ListView.Selected, ".playlist-view")
+    @on(PlayListView.Selected, ".playlist-view")
     async def pl_select_worker(self) -> None:
         if not self.block_select:
             self.block_playback_control = True
@@ -680,6 +902,10 @@ class SeaPlayer(App):
         if (sound:=await self.aio_gcs()) is not None:
             sound.unpause()
             sound.stop()
+        await asyncio.to_thread(self.cache.background_flush)
+        # * The app is stopping, the errors of the next attempts (on exit) are printed to stderr
+        self.cache.error_handler = None
+        await asyncio.to_thread(self.config.flush)
         return await super().action_quit()
     
     # ! On Functions
@@ -694,6 +920,8 @@ class SeaPlayer(App):
     
     def on_ready(self, *args, **kwargs) -> None:
         """A function called when the SeaPlayer is completely confused."""
+        self.main_loop = asyncio.get_running_loop()
+        self.call_after_refresh(startup.finish, "first frame")
         if ENABLE_PLUGIN_SYSTEM:
             self.run_worker(
                 self.plugin_loader.on_ready,
@@ -0,0 +1,138 @@
+import os
+import threading
+from io import BytesIO
+from collections import OrderedDict
+# > Image Works
+from PIL import Image
+# > Typing
+from typing import Optional, Tuple, Callable, Hashable, Any
+# > Local Imports
+from .FilesCache import FilesCache
+
+# ! Types
+RenderKey = Tuple[str, Tuple[int, int], int]
+"""The key of the rendering: `(sha1, size, resample)`."""
+
+# ! Vars
+DEFAULT_KEY = ""
+"""The key of the picture shown when the sound has no cover art."""
+
+# ! Functions
+def lru_get(cache: OrderedDict, key: Hashable) -> Any:
+    value = cache[key]
+    cache.move_to_end(key)
+    return value
+
+def lru_put(cache: OrderedDict, key: Hashable, value: Any, capacity: int) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > capacity:
+        cache.popitem(last=False)
+
+# ! Main Class
+class ArtworkCache:
+    """A cache of the cover art: downscaled thumbnails by the hash of the sound (in memory and on the disk) and their terminal renderings by the size and the resampling method."""
+    def __init__(
+        self,
+        dirpath: Optional[str]=None,
+        thumbnail_size: int=512,
+        max_thumbnails: int=32,
+        max_renders: int=64,
+        budget: int=64*1048576
+    ) -> None:
+        """A cache of the cover art: downscaled thumbnails by the hash of the sound (in memory and on the disk) and their terminal renderings by the size and the resampling method.
+        
+        Args:
+            dirpath (Optional[str], optional): The directory of the thumbnails on the disk. Defaults to None (only in memory).
+            thumbnail_size (int, optional): The maximum width and height of the thumbnail in pixels. Defaults to 512.
+            max_thumbnails (int, optional): The number of thumbnails kept in memory. Defaults to 32.
+            max_renders (int, optional): The number of renderings kept in memory. Defaults to 64.
+            budget (int, optional): The maximum total size of the thumbnails on the disk in bytes, the least recently used ones are removed. Defaults to 64 MiB.
+        """
+        self.dirpath = dirpath
+        self.thumbnail_size = thumbnail_size
+        self.max_thumbnails = max_thumbnails
+        self.max_renders = max_renders
+        self.lock = threading.Lock()
+        self.thumbnails: "OrderedDict[str, Optional[Image.Image]]" = OrderedDict()
+        self.renders: "OrderedDict[RenderKey, Any]" = OrderedDict()
+        self.files: Optional[FilesCache] = None
+        """The thumbnails on the disk by the hash of the sound."""
+        if self.dirpath is not None:
+            self.files = FilesCache(self.dirpath, budget)
+            self.remove_legacy_thumbnails()
+    
+    # ! Functions
+    def remove_legacy_thumbnails(self) -> None:
+        """Removing the thumbnails of the old versions (`<sha1[:2]>/<sha1>.png`), which were kept without a size limit."""
+        for name in os.listdir(self.dirpath):
+            dirpath = os.path.join(self.dirpath, name)
+            if (len(name) != 2) or (not os.path.isdir(dirpath)):
+                continue
+            for filename in os.listdir(dirpath):
+                if filename.endswith(".png"):
+                    try: os.remove(os.path.join(dirpath, filename))
+                    except OSError: pass
+            try: os.rmdir(dirpath)
+            except OSError: pass
+    
+    def save_thumbnail(self, sha1: str, image: Image.Image) -> None:
+        # * The file is complete before it gets into the cache, so a crash or a reader never sees a part of it
+        temp_path = os.path.join(self.dirpath, f"{sha1}.{threading.get_ident()}.tmp")
+        try:
+            image.save(temp_path, "PNG")
+            self.files.put(sha1, temp_path)
+        except OSError:
+            pass
+        finally:
+            try: os.remove(temp_path)
+            except OSError: pass
+    
+    def downscale(self, data: bytes) -> Image.Image:
+        image = Image.open(BytesIO(data))
+        # * JPEG is decoded right away at a reduced scale
+        image.draft("RGB", (self.thumbnail_size, self.thumbnail_size))
+        image = image.convert("RGB")
+        image.thumbnail((self.thumbnail_size, self.thumbnail_size), Image.Resampling.LANCZOS)
+        return image
+    
+    # ! Thumbnails Methods
+    def thumbnail(self, sha1: str, load: Callable[[], Optional[bytes]]) -> Optional[Image.Image]:
+        """Getting the thumbnail of the cover art of the sound.
+        
+        Args:
+            sha1 (str): The hash of the sound.
+            load (Callable[[], Optional[bytes]]): The function that returns the cover art data (it is called only if there is no thumbnail).
+        
+        Returns:
+            Optional[Image.Image]: The thumbnail, or `None` if the sound has no cover art.
+        """
+        with self.lock:
+            if sha1 in self.thumbnails:
+                return lru_get(self.thumbnails, sha1)
+        image = None
+        if (self.files is not None) and ((entry:=self.files.get(sha1)) is not None):
+            try:
+                image = Image.open(entry.path)
+                image.load()
+            except OSError:
+                image = None
+                self.files.remove(sha1)
+        if image is None:
+            if (data:=load()) is not None:
+                image = self.downscale(data)
+                if self.files is not None:
+                    self.save_thumbnail(sha1, image)
+        with self.lock:
+            lru_put(self.thumbnails, sha1, image, self.max_thumbnails)
+        return image
+    
+    # ! Renders Methods
+    def get_render(self, key: RenderKey) -> Optional[Any]:
+        with self.lock:
+            if key in self.renders:
+                return lru_get(self.renders, key)
+    
+    def put_render(self, key: RenderKey, render: Any) -> None:
+        with self.lock:
+            lru_put(self.renders, key, render, self.max_renders)
\ No newline at end of file
@@ -1,7 +1,13 @@
 import os
+import sys
+import atexit
 import pickle
+import sqlite3
+import threading
 # > Typing
-from typing import TypeVar, Any
+from typing import Optional, TypeVar, Tuple, Dict, Callable, Any
+# > Local Imports
+from .State import StateStore
 
 # ! T
 D = TypeVar("D")
@@ -9,45 +15,137 @@ D = TypeVar("D")
 # ! Main Class
 class Cacher:
     """The caching management class."""
-    def __init__(self, cache_dirpath: str) -> None:
+    def __init__(self, cache_dirpath: str, flush_delay: float=1.0) -> None:
         """The caching management class.
         
         Args:
             cache_dirpath (str): The path to the directory with the cache.
+            flush_delay (float, optional): How many seconds the changed variables wait before being written to the disk (the changes in the meantime are written in one batch). Defaults to 1.0.
         """
         self.main_dirpath = os.path.abspath(cache_dirpath)
         self.vars_dirpath = os.path.join(self.main_dirpath, "vars")
+        """The directory of the variables of the old versions, they are moved to the state store."""
+        self.flush_delay = flush_delay
+        self.lock = threading.RLock()
+        self.write_lock = threading.Lock()
+        """Keeps the order of the batches being written."""
+        self.values: Dict[Tuple[str, str], Any] = {}
+        """The values of the variables by `(name, group)`."""
+        self.pending: Dict[Tuple[str, str], Any] = {}
+        """The changed values that are not written yet."""
+        self.flush_timer: Optional[threading.Timer] = None
+        self.error_handler: Optional[Callable[[Exception], None]] = None
+        """Receives the errors of the background writes (for example, the app logger), otherwise they are printed to stderr."""
         # * Create Directory
         os.makedirs(self.main_dirpath, 0o755, True)
-        os.makedirs(self.vars_dirpath, 0o755, True)
         # * Check Directory
         assert os.path.isdir(self.main_dirpath)
-        assert os.path.isdir(self.vars_dirpath)
+        self.state_store: Optional[StateStore] = None
+        # * The changes are not lost on exit
+        atexit.register(self.background_flush)
     
-    # ! I/O Methods
-    def write(self, data: Any, filepath: str) -> None:
-        with open(filepath, "wb") as file:
-            pickle.dump(data, file)
+    @property
+    def state(self) -> StateStore:
+        """The state store, it is opened on the first use."""
+        with self.lock:
+            if self.state_store is None:
+                self.state_store = StateStore(os.path.join(self.main_dirpath, "state.sqlite"))
+                self.migrate_vars()
+            return self.state_store
     
-    def read(self, filepath: str, default: D) -> D:
+    # ! Migration Methods
+    def migrate_vars(self) -> None:
+        """Moving the variables of the old versions (one pickle file per variable) to the state store."""
+        if not os.path.isdir(self.vars_dirpath):
+            return
+        filenames = [filename for filename in os.listdir(self.vars_dirpath) if filename.endswith(".pycache")]
+        values = []
+        for filename in filenames:
+            name, _, group = filename[:-len(".pycache")].rpartition("-")
+            if (len(name) == 0) or self.state.contains(name, group):
+                continue
+            try:
+                with open(os.path.join(self.vars_dirpath, filename), "rb") as file:
+                    values.append((name, group, pickle.load(file)))
+            except:
+                pass
+        self.state.put_many(values)
+        for filename in filenames:
+            os.remove(os.path.join(self.vars_dirpath, filename))
         try:
-            with open(filepath, "rb") as file:
-                return pickle.load(file)
-        except:
-            self.write(default, filepath)
-            return default
+            os.rmdir(self.vars_dirpath)
+        except OSError:
+            pass
+    
+    # ! Write-Back Methods
+    def flush(self) -> None:
+        """Writing the changed variables to the disk right away in one batch (for example, on quit)."""
+        with self.lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            pending, self.pending = self.pending, {}
+            if len(pending) == 0:
+                return
+            state = self.state
+        # * The writing waits for the disk, so the reading of the variables is not blocked meanwhile
+        with self.write_lock:
+            try:
+                state.put_many([(name, group, value) for (name, group), value in pending.items()])
+            except sqlite3.Error:
+                # * The batch is kept for the next attempt, the newer changes take precedence
+                with self.lock:
+                    self.pending = {**pending, **self.pending}
+                    self.schedule_flush()
+                raise
+    
+    def background_flush(self) -> bool:
+        """Writing the changed variables like `Cacher.flush`, but the error is reported instead of being raised (for the timer, the exit and the quit).
+        
+        Returns:
+            bool: `False`, if the changes have not been written, they are kept for the next attempt.
+        """
+        try:
+            self.flush()
+        except sqlite3.Error as e:
+            self.report_error(e)
+            return False
+        return True
+    
+    def report_error(self, e: Exception) -> None:
+        if self.error_handler is not None:
+            try:
+                self.error_handler(e)
+                return
+            except Exception:
+                pass
+        print(f"The cached variables could not be written to {repr(self.main_dirpath)}: {e}", file=sys.stderr)
+    
+    def schedule_flush(self) -> None:
+        if self.flush_timer is None:
+            self.flush_timer = threading.Timer(self.flush_delay, self.background_flush)
+            self.flush_timer.daemon = True
+            self.flush_timer.start()
     
     # ! Var Methods
     def write_var(self, value: Any, name: str, *, group: str="main") -> None:
-        self.write(value, os.path.join(self.vars_dirpath, f"{name}-{group}.pycache"))
+        with self.lock:
+            self.values[(name, group)] = self.pending[(name, group)] = value
+            self.schedule_flush()
     
     def read_var(self, name: str, default: D, *, group: str="main") -> D:
-        return self.read(os.path.join(self.vars_dirpath, f"{name}-{group}.pycache"), default)
+        with self.lock:
+            if (name, group) not in self.values:
+                self.values[(name, group)] = self.state.get(name, group, default)
+            return self.values[(name, group)]
     
     # ! Main Methods
     def var(self, name: str, default: D, *, group: str="main") -> D:
         """Caching a variable, wraps the value of the variable in `property` and saves it when the value is changed, and the next time SeaPlayer is started, the value is loaded from the cache.
         
+        The value is read from the state store only once and kept in memory, the changes are written in the background (see `Cacher.flush`).
+        If the stored value cannot be read or has another type, the default value is used.
+        
         Args:
             name (str): The name of the cached variable.
             default (D): The default value of the variable.
@@ -0,0 +1,397 @@
+import io
+import os
+import sys
+import threading
+import http.client
+from tempfile import mkstemp
+from urllib.parse import urlsplit, urljoin
+# > Typing
+from typing import Optional, List, Dict, Tuple, Callable, Any
+
+# ! Vars
+CHUNK_SIZE = 65536
+"""The size of the block read from the network at a time."""
+JUMP_DISTANCE = 1048576
+"""If the reader is waiting for data that is further than this from the download position, the download jumps there (with a range request)."""
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# ! Connections Pool
+class HTTPPool:
+    """A pool of keep-alive HTTP connections shared by all downloads, the requests to the same host reuse the connections."""
+    max_redirects: int=5
+    
+    def __init__(self, max_idle: int=8, timeout: Optional[float]=10.0) -> None:
+        """A pool of keep-alive HTTP connections shared by all downloads, the requests to the same host reuse the connections.
+        
+        Args:
+            max_idle (int, optional): The maximum number of idle connections per host. Defaults to 8.
+            timeout (Optional[float], optional): The timeout of the connections in seconds. Defaults to 10.0.
+        """
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self.created: int = 0
+        """The number of connections opened by the pool."""
+    
+    def connect(self, scheme: str, netloc: str) -> Tuple[http.client.HTTPConnection, bool]:
+        with self.lock:
+            if len(connections:=self.idle.get((scheme, netloc), [])) > 0:
+                return connections.pop(), True
+            self.created += 1
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        elif scheme == "http":
+            connection = http.client.HTTPConnection(netloc, timeout=self.timeout)
+        else:
+            raise OSError(f"Unsupported URL scheme: {repr(scheme)}")
+        connection.pool_key = (scheme, netloc)
+        return connection, False
+    
+    def send(self, url: str, headers: Dict[str, str]) -> http.client.HTTPResponse:
+        parts = urlsplit(url)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        connection, reused = self.connect(parts.scheme, parts.netloc)
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionError):
+            connection.close()
+            if not reused:
+                raise
+            # * The idle connection has been closed by the server in the meantime
+            return self.send(url, headers)
+        response.pool_connection = connection
+        return response
+    
+    def request(self, url: str, headers: Dict[str, str]={}) -> http.client.HTTPResponse:
+        """Sending the `GET` request (following redirects).
+        
+        Args:
+            url (str): The URL.
+            headers (Dict[str, str], optional): The request headers. Defaults to {}.
+        
+        Raises:
+            OSError: If the server has responded with an error.
+        
+        Returns:
+            http.client.HTTPResponse: The response, it must be returned by `release` after reading.
+        """
+        for _ in range(self.max_redirects+1):
+            response = self.send(url, headers)
+            if (response.status in REDIRECT_CODES) and ((location:=response.getheader("Location")) is not None):
+                response.read()
+                self.release(response)
+                url = urljoin(url, location)
+                continue
+            if response.status >= 400:
+                self.release(response)
+                raise OSError(f"The server responded with {response.status} {response.reason}: {repr(url)}")
+            return response
+        raise OSError(f"Too many redirects: {repr(url)}")
+    
+    def release(self, response: http.client.HTTPResponse) -> None:
+        """Returning the connection of the response to the pool (it is closed if the response has not been read to the end).
+        
+        Args:
+            response (http.client.HTTPResponse): The response received by `request`.
+        """
+        connection: http.client.HTTPConnection = response.pool_connection
+        if response.isclosed() and not response.will_close:
+            with self.lock:
+                connections = self.idle.setdefault(connection.pool_key, [])
+                if len(connections) < self.max_idle:
+                    connections.append(connection)
+                    return
+        response.close()
+        connection.close()
+    
+    def close(self) -> None:
+        with self.lock:
+            for connections in self.idle.values():
+                for connection in connections:
+                    connection.close()
+            self.idle.clear()
+
+# ! Vars
+http_pool = HTTPPool()
+"""The pool of connections shared by all downloads."""
+
+# ! Main Class
+class ProgressiveDownload(io.RawIOBase):
+    """A file-like object of the remote file that is downloaded in the background into a sparse temporary file.
+    
+    The connection is opened immediately, and the beginning of the file can be read by `peek` from it (for example, to check the signature), the background download continues with the same response when the data is needed. Reading waits only for the requested bytes, and seeking to a part that has not been downloaded yet moves the download there by HTTP range requests (if the server supports them). The skipped parts are downloaded after the end is reached.
+    """
+    def __init__(
+        self,
+        url: str,
+        pool: Optional[HTTPPool]=None,
+        chunk_size: int=CHUNK_SIZE,
+        headers: Dict[str, str]={}
+    ) -> None:
+        """A file-like object of the remote file that is downloaded in the background into a sparse temporary file.
+        
+        Args:
+            url (str): The URL of the file.
+            pool (Optional[HTTPPool], optional): The pool of connections. Defaults to `http_pool`.
+            chunk_size (int, optional): The size of the block read from the network at a time. Defaults to CHUNK_SIZE.
+            headers (Dict[str, str], optional): Additional request headers. Defaults to {}.
+        """
+        super().__init__()
+        self.url = url
+        self.pool = pool or http_pool
+        self.chunk_size = chunk_size
+        self.headers = headers
+        self.position = 0
+        self.length: Optional[int] = None
+        self.accept_ranges: bool = False
+        self.ranges: List[List[int]] = []
+        """The downloaded parts of the file (sorted and merged `[start, end)` pairs)."""
+        self.requested: Optional[int] = None
+        self.finished: bool = False
+        self.exception: Optional[BaseException] = None
+        self.cond = threading.Condition()
+        self.thread: Optional[threading.Thread] = None
+        self.response: Optional[http.client.HTTPResponse] = None
+        self.offset = 0
+        """The offset of the next byte of the current response."""
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.not_modified: bool = False
+        """`True` if the server responded that the file has not changed (to the `If-None-Match` or `If-Modified-Since` headers), there is nothing to download."""
+        self.finish_callbacks: List[Callable[["ProgressiveDownload"], None]] = []
+        
+        fd, self.path = mkstemp(suffix=".bin")
+        self.file = os.fdopen(fd, "r+b")
+        try:
+            self.open(0)
+            self.etag = self.response.getheader("ETag")
+            self.last_modified = self.response.getheader("Last-Modified")
+            if self.response.status == 304:
+                self.not_modified = True
+                self.release()
+                return
+            self.accept_ranges = (self.response.getheader("Accept-Ranges", "").lower() == "bytes")
+            if (length:=self.response.getheader("Content-Length")) is not None:
+                self.length = int(length)
+                self.file.truncate(self.length)
+        except:
+            self.close()
+            raise
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(url={repr(self.url)}, length={repr(self.length)}, downloaded={repr(self.downloaded)})"
+    
+    # ! Network Methods
+    def open(self, offset: int) -> None:
+        headers = self.headers.copy()
+        if offset > 0:
+            headers["Range"] = f"bytes={offset}-"
+        response = self.pool.request(self.url, headers)
+        if (offset > 0) and (response.status != 206):
+            self.pool.release(response)
+            raise OSError(f"The server ignored the range request: {repr(self.url)}")
+        with self.cond:
+            self.response, self.offset = response, offset
+    
+    def release(self) -> None:
+        with self.cond:
+            response, self.response = self.response, None
+        if response is not None:
+            self.pool.release(response)
+    
+    def write(self, data: bytes) -> None:
+        self.file.seek(self.offset)
+        self.file.write(data)
+        self.mark(self.offset, self.offset+len(data))
+        self.offset += len(data)
+    
+    def add_finish_callback(self, callback: Callable[["ProgressiveDownload"], None]) -> None:
+        """Adding a function that is called in the download thread when the whole file is downloaded (immediately, if it already is)."""
+        with self.cond:
+            if not self.finished:
+                self.finish_callbacks.append(callback)
+                return
+        callback(self)
+    
+    def start(self) -> None:
+        """Starting the background download (if it has not been started yet)."""
+        with self.cond:
+            if (self.thread is None) and not (self.closed or self.not_modified):
+                self.thread = threading.Thread(target=self.download, name="seaplayer-download", daemon=True)
+                self.thread.start()
+    
+    def download(self) -> None:
+        try:
+            while True:
+                data = self.response.read(self.chunk_size)
+                offset = None
+                with self.cond:
+                    if self.closed:
+                        break
+                    if len(data) > 0:
+                        self.write(data)
+                        self.cond.notify_all()
+                        jump = self.accept_ranges \
+                            and (self.requested is not None) \
+                            and (self.available(self.requested, 1) == 0) \
+                            and ((self.requested < self.offset) or (self.requested > self.offset+JUMP_DISTANCE))
+                        if not jump:
+                            continue
+                        offset = self.requested
+                    else:
+                        if self.length is None:
+                            self.length = self.offset
+                        if (offset:=self.missing()) is None:
+                            self.file.flush()
+                            self.finished = True
+                            self.cond.notify_all()
+                self.release()
+                if (offset is None) or self.closed:
+                    break
+                self.open(offset)
+        except BaseException as e:
+            with self.cond:
+                if not self.closed:
+                    self.exception = e
+                self.cond.notify_all()
+        if self.closed:
+            self.release()
+        elif self.finished:
+            for callback in self.finish_callbacks:
+                callback(self)
+    
+    # ! Ranges Methods
+    def mark(self, start: int, end: int) -> None:
+        ranges = []
+        for range_start, range_end in self.ranges:
+            if (range_end < start) or (range_start > end):
+                ranges.append([range_start, range_end])
+            else:
+                start, end = min(start, range_start), max(end, range_end)
+        ranges.append([start, end])
+        self.ranges = sorted(ranges)
+    
+    def available(self, offset: int, size: int) -> int:
+        """The number of downloaded bytes from the `offset` (not more than the `size`)."""
+        for start, end in self.ranges:
+            if start <= offset < end:
+                return min(end, offset+size) - offset
+        return 0
+    
+    def missing(self) -> Optional[int]:
+        """The beginning of the first part that has not been downloaded."""
+        if (len(self.ranges) == 0) or (self.ranges[0][0] > 0):
+            return 0
+        if (self.length is not None) and (self.ranges[0][1] >= self.length):
+            return None
+        return self.ranges[0][1]
+    
+    @property
+    def downloaded(self) -> int:
+        return sum(end-start for start, end in self.ranges)
+    
+    def check(self) -> None:
+        if self.exception is not None:
+            raise OSError(f"Failed to download {repr(self.url)}") from self.exception
+    
+    # ! Waiting Methods
+    def peek(self, size: int) -> bytes:
+        """Reading the beginning of the file without moving the position. If the background download has not been started, the beginning is read right from the opened response.
+        
+        Args:
+            size (int): The number of bytes.
+        
+        Returns:
+            bytes: The beginning of the file (it is shorter if the file is shorter).
+        """
+        with self.cond:
+            if self.thread is None:
+                while (self.offset < size) and (self.response is not None):
+                    if len(data:=self.response.read(size-self.offset)) == 0:
+                        break
+                    self.write(data)
+            else:
+                self.wait(size)
+            self.file.seek(0)
+            return self.file.read(self.available(0, size))
+    
+    def wait(self, size: Optional[int]=None) -> None:
+        """Waiting until the beginning of the file is downloaded.
+        
+        Args:
+            size (Optional[int], optional): The size of the beginning in bytes, it is limited by the size of the file. Defaults to None (the whole file).
+        """
+        size = size or sys.maxsize
+        self.start()
+        with self.cond:
+            while not (self.finished or self.closed or self.not_modified):
+                self.check()
+                if (self.length is not None) and (self.available(0, size) >= min(size, self.length)):
+                    break
+                if (self.length is None) and (self.available(0, size) >= size):
+                    break
+                self.cond.wait()
+            self.check()
+    
+    # ! IO Methods
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self.position
+    
+    def seek(self, offset: int, whence: int=io.SEEK_SET) -> int:
+        with self.cond:
+            if whence == io.SEEK_SET:
+                self.position = offset
+            elif whence == io.SEEK_CUR:
+                self.position += offset
+            elif whence == io.SEEK_END:
+                if self.length is None:
+                    self.start()
+                while (self.length is None) and not self.closed:
+                    self.check()
+                    self.cond.wait()
+                self.position = self.length + offset
+            else:
+                raise ValueError(f"Invalid whence: {repr(whence)}")
+            self.position = max(0, self.position)
+            return self.position
+    
+    def readinto(self, buffer: Any) -> int:
+        with self.cond:
+            while True:
+                if self.closed:
+                    raise ValueError("I/O operation on closed file.")
+                self.check()
+                size = len(buffer)
+                if self.length is not None:
+                    size = min(size, self.length - self.position)
+                if size <= 0:
+                    return 0
+                if (count:=self.available(self.position, size)) > 0:
+                    break
+                self.requested = self.position
+                self.start()
+                self.cond.wait()
+            self.requested = None
+            self.file.seek(self.position)
+            count = self.file.readinto(memoryview(buffer)[:count])
+            self.position += count
+            return count
+    
+    def close(self) -> None:
+        if self.closed:
+            return
+        with self.cond:
+            super().close()
+            self.cond.notify_all()
+            self.file.close()
+        self.release()
+        try: os.remove(self.path)
+        except OSError: pass
@@ -0,0 +1,187 @@
+import os
+import time
+import shutil
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from pydantic import BaseModel
+# > Typing
+from typing import Optional
+
+# ! Record Class
+class CacheEntry(BaseModel):
+    key: str
+    sha1: str
+    path: str
+    size: int
+    etag: Optional[str]=None
+    last_modified: Optional[str]=None
+    checked: float
+    """The time when the entry was saved or checked for relevance."""
+
+# ! Main Class
+class FilesCache:
+    """A size-bounded content-addressed cache of files: the files are stored by their hash, the keys refer to them, the least recently used ones are evicted when the budget is exceeded."""
+    FIELDS = ("key", "sha1", "size", "etag", "last_modified", "checked")
+    fresh_time: float=3600.0
+    """The time in seconds during which the entry is considered relevant without checking it."""
+    
+    def __init__(self, dirpath: str, budget: int) -> None:
+        """A size-bounded content-addressed cache of files: the files are stored by their hash, the keys refer to them, the least recently used ones are evicted when the budget is exceeded.
+        
+        Args:
+            dirpath (str): The path to the cache directory.
+            budget (int): The maximum total size of the files in bytes.
+        """
+        self.dirpath = os.path.abspath(dirpath)
+        self.objects_dirpath = os.path.join(self.dirpath, "objects")
+        self.budget = budget
+        os.makedirs(self.objects_dirpath, 0o755, True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(os.path.join(self.dirpath, "index.sqlite"), check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, sha1 TEXT, size INTEGER, etag TEXT, last_modified TEXT, checked REAL, atime REAL"
+                ")"
+            )
+    
+    # ! Functions
+    def object_path(self, sha1: str) -> str:
+        return os.path.join(self.objects_dirpath, sha1[:2], sha1)
+    
+    @staticmethod
+    def file_sha1(path: str, buffer_size: int=65536) -> str:
+        sha1 = hashlib.sha1()
+        with open(path, "rb") as file:
+            while True:
+                data = file.read(buffer_size)
+                if not data: break
+                sha1.update(data)
+        return sha1.hexdigest()
+    
+    @property
+    def size(self) -> int:
+        """The total size of the stored files in bytes."""
+        with self.lock:
+            return self.connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM entries GROUP BY sha1)"
+            ).fetchone()[0]
+    
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return (time.time() - entry.checked) < self.fresh_time
+    
+    # ! Main Methods
+    def contains(self, key: str) -> bool:
+        with self.lock:
+            row = self.connection.execute("SELECT sha1 FROM entries WHERE key = ?", (key,)).fetchone()
+        return (row is not None) and os.path.isfile(self.object_path(row[0]))
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Getting the entry and marking it as the last used.
+        
+        Args:
+            key (str): The key.
+        
+        Returns:
+            Optional[CacheEntry]: The entry, or `None` if there is no such key or its file has been lost.
+        """
+        with self.lock, self.connection:
+            row = self.connection.execute(
+                f"SELECT {', '.join(self.FIELDS)} FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            entry = CacheEntry(path=self.object_path(row[1]), **dict(zip(self.FIELDS, row)))
+            if not os.path.isfile(entry.path):
+                self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            self.connection.execute("UPDATE entries SET atime = ? WHERE key = ?", (time.time(), key))
+        return entry
+    
+    def put(
+        self,
+        key: str,
+        path: str,
+        etag: Optional[str]=None,
+        last_modified: Optional[str]=None
+    ) -> Optional[CacheEntry]:
+        """Saving a copy of the file (a hard link, if possible) under the key.
+        
+        Args:
+            key (str): The key.
+            path (str): The path to the file, it must not be changed afterwards.
+            etag (Optional[str], optional): The `ETag` of the file source. Defaults to None.
+            last_modified (Optional[str], optional): The `Last-Modified` of the file source. Defaults to None.
+        
+        Returns:
+            Optional[CacheEntry]: The saved entry, or `None` if the file is larger than the budget.
+        """
+        size = os.path.getsize(path)
+        if size > self.budget:
+            return None
+        sha1 = self.file_sha1(path)
+        object_path = self.object_path(sha1)
+        if not os.path.isfile(object_path):
+            os.makedirs(os.path.dirname(object_path), 0o755, True)
+            temp_path = f"{object_path}.{threading.get_ident()}.tmp"
+            try:
+                os.link(path, temp_path)
+            except OSError:
+                shutil.copyfile(path, temp_path)
+            os.replace(temp_path, object_path)
+        entry = CacheEntry(
+            key=key, sha1=sha1, path=object_path, size=size,
+            etag=etag, last_modified=last_modified, checked=time.time()
+        )
+        with self.lock, self.connection:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO entries ({', '.join(self.FIELDS)}, atime) VALUES ({', '.join('?' * len(self.FIELDS))}, ?)",
+                (*(getattr(entry, field) for field in self.FIELDS), entry.checked)
+            )
+        self.evict()
+        return entry
+    
+    def checked(self, key: str) -> None:
+        """Marking the entry as relevant at the moment (for example, when the server responded that it has not changed)."""
+        with self.lock, self.connection:
+            self.connection.execute("UPDATE entries SET checked = ?, atime = ? WHERE key = ?", (time.time(), time.time(), key))
+    
+    def remove(self, key: str) -> None:
+        with self.lock, self.connection:
+            if (row:=self.connection.execute("SELECT sha1 FROM entries WHERE key = ?", (key,)).fetchone()) is None:
+                return
+            self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.remove_object(row[0])
+    
+    def remove_object(self, sha1: str) -> None:
+        if self.connection.execute("SELECT 1 FROM entries WHERE sha1 = ? LIMIT 1", (sha1,)).fetchone() is None:
+            try: os.remove(self.object_path(sha1))
+            except OSError: pass
+    
+    def evict(self) -> None:
+        """Removing the least recently used entries until the total size fits into the budget."""
+        size = self.size
+        with self.lock, self.connection:
+            for key, sha1, entry_size in self.connection.execute(
+                "SELECT key, sha1, size FROM entries ORDER BY atime"
+            ).fetchall():
+                if size <= self.budget:
+                    break
+                self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                if self.connection.execute("SELECT 1 FROM entries WHERE sha1 = ? LIMIT 1", (sha1,)).fetchone() is None:
+                    size -= entry_size
+                    self.remove_object(sha1)
+    
+    # ! Async Methods
+    async def aio_get(self, key: str) -> Optional[CacheEntry]:
+        return await asyncio.to_thread(self.get, key)
+    
+    async def aio_put(self, key: str, path: str, etag: Optional[str]=None, last_modified: Optional[str]=None) -> Optional[CacheEntry]:
+        return await asyncio.to_thread(self.put, key, path, etag, last_modified)
+    
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
\ No newline at end of file
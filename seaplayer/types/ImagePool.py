@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import numpy as np
+from collections import OrderedDict
+from multiprocessing.shared_memory import SharedMemory
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+# > Image Works
+from PIL import Image
+from PIL.Image import Resampling
+# > Typing
+from typing import Optional, Tuple
+# > Local Imports
+from ..modules.halfblock import HalfBlockPixels
+from .Artwork import lru_get
+
+# ! Worker Functions
+def pack_shared(name: str, mode: str, size: Tuple[int, int], cells: Tuple[int, int], resample: int) -> np.ndarray:
+    """Packing the image from the shared memory into the cells (runs in the worker process)."""
+    memory = SharedMemory(name=name)
+    try:
+        image = Image.frombytes(mode, size, memory.buf)
+        return HalfBlockPixels.pack(image, cells, Resampling(resample))
+    finally:
+        memory.close()
+
+# ! Shared Image Class
+class SharedImage:
+    """The pixels of the image in the shared memory: the workers attach them by the name instead of receiving the pickled image."""
+    def __init__(self, image: Image.Image) -> None:
+        if image.mode not in ("RGB", "RGBA", "L"):
+            image = image.convert("RGB")
+        data = image.tobytes()
+        self.mode, self.size = image.mode, image.size
+        self.memory = SharedMemory(create=True, size=max(1, len(data)))
+        self.memory.buf[:len(data)] = data
+    
+    @property
+    def name(self) -> str:
+        return self.memory.name
+    
+    def close(self) -> None:
+        self.memory.close()
+        self.memory.unlink()
+
+# ! Main Class
+class ImageProcessPool:
+    """A persistent pool of processes that resize the cover art and pack it into half-block cells out of the GIL of the interface."""
+    def __init__(self, workers: int=2, max_shared: int=4) -> None:
+        """A persistent pool of processes that resize the cover art and pack it into half-block cells out of the GIL of the interface.
+        
+        Args:
+            workers (int, optional): The number of processes. Defaults to 2.
+            max_shared (int, optional): The number of images kept in the shared memory. Defaults to 4.
+        """
+        self.workers = workers
+        self.max_shared = max_shared
+        self.lock = threading.Lock()
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.shared: "OrderedDict[int, Tuple[Image.Image, SharedImage]]" = OrderedDict()
+    
+    # ! Functions
+    def share(self, image: Image.Image) -> SharedImage:
+        """Getting the image in the shared memory, it is copied there only once."""
+        with self.lock:
+            if id(image) in self.shared:
+                return lru_get(self.shared, id(image))[1]
+            shared = SharedImage(image)
+            # * The image is kept with its copy, so that its id is not reused
+            self.shared[id(image)] = (image, shared)
+            while len(self.shared) > self.max_shared:
+                self.shared.popitem(last=False)[1][1].close()
+            return shared
+    
+    def get_executor(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(self.workers)
+            return self.executor
+    
+    async def aio_render(self, image: Image.Image, size: Tuple[int, int], resample: Resampling) -> HalfBlockPixels:
+        """Rendering the image: resizing and packing in the pool, merging the cells into segments in a thread.
+        
+        If the pool is not available, the image is rendered entirely in a thread.
+        """
+        size = (max(1, size[0]), max(1, size[1]))
+        try:
+            shared = await asyncio.to_thread(self.share, image)
+            cells = await asyncio.get_running_loop().run_in_executor(
+                self.get_executor(), pack_shared,
+                shared.name, shared.mode, shared.size, size, int(resample)
+            )
+        except (OSError, BrokenProcessPool):
+            return await asyncio.to_thread(HalfBlockPixels.from_image, image, size, resample)
+        return await asyncio.to_thread(HalfBlockPixels.from_cells, cells)
+    
+    def close(self) -> None:
+        """Stopping the processes and freeing the shared memory."""
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False)
+                self.executor = None
+            while len(self.shared) > 0:
+                self.shared.popitem(last=False)[1][1].close()
@@ -0,0 +1,162 @@
+import os
+import asyncio
+import sqlite3
+import threading
+from pydantic import BaseModel
+# > Typing
+from typing import Optional, Tuple
+# > Local Imports
+from ..codeсbase import CodecBase
+
+# ! Types
+StatKey = Tuple[int, int, int]
+
+# ! Record Class
+class SoundRecord(BaseModel):
+    path: str
+    size: int
+    mtime: int
+    inode: int
+    sha1: str
+    codec_name: str
+    duration: float
+    channels: int
+    samplerate: int
+    bitrate: int
+    title: Optional[str]=None
+    artist: Optional[str]=None
+    album: Optional[str]=None
+
+# ! Main Class
+class LibraryIndex:
+    """A persistent index of the sound files: hashes and metadata, keyed by the path and the file status."""
+    FIELDS = tuple(SoundRecord.model_fields.keys())
+    
+    def __init__(self, filepath: str) -> None:
+        """A persistent index of the sound files: hashes and metadata, keyed by the path and the file status.
+        
+        Args:
+            filepath (str): The path to the index database file.
+        """
+        self.filepath = os.path.abspath(filepath)
+        os.makedirs(os.path.dirname(self.filepath), 0o755, True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.filepath, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sounds ("
+                "path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, inode INTEGER, sha1 TEXT, codec_name TEXT, "
+                "duration REAL, channels INTEGER, samplerate INTEGER, bitrate INTEGER, title TEXT, artist TEXT, album TEXT"
+                ")"
+            )
+    
+    # ! Functions
+    @staticmethod
+    def stat_key(path: str) -> Optional[StatKey]:
+        """Getting the key of the file status: `(size, mtime, inode)`.
+        
+        Args:
+            path (str): File path.
+        
+        Returns:
+            Optional[StatKey]: The key, or `None` if the path is not a file.
+        """
+        try:
+            stat = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        if not os.path.isfile(path):
+            return None
+        return stat.st_size, stat.st_mtime_ns, stat.st_ino
+    
+    # ! Main Methods
+    def get(self, path: str) -> Optional[SoundRecord]:
+        """Getting the record of the file, if the file has not changed since it was indexed.
+        
+        Args:
+            path (str): File path.
+        
+        Returns:
+            Optional[SoundRecord]: The record or `None`.
+        """
+        path = os.path.abspath(path)
+        if (key:=self.stat_key(path)) is None:
+            return None
+        with self.lock:
+            row = self.connection.execute(
+                f"SELECT {', '.join(self.FIELDS)} FROM sounds WHERE path = ?", (path,)
+            ).fetchone()
+        if row is not None:
+            record = SoundRecord(**dict(zip(self.FIELDS, row)))
+            if (record.size, record.mtime, record.inode) == key:
+                return record
+    
+    def put(self, sound: CodecBase, sha1: str) -> Optional[SoundRecord]:
+        """Saving the hash and metadata of the sound.
+        
+        Args:
+            sound (CodecBase): The sound whose `name` is the path to the file.
+            sha1 (str): The hash of the file.
+        
+        Returns:
+            Optional[SoundRecord]: The saved record, or `None` if the sound is not a file.
+        """
+        if (sound.name is None) or ((key:=self.stat_key(sound.name)) is None):
+            return None
+        try:
+            record = SoundRecord(
+                path=os.path.abspath(sound.name),
+                size=key[0], mtime=key[1], inode=key[2],
+                sha1=sha1,
+                codec_name=sound.codec_name,
+                duration=sound.duration,
+                channels=sound.channels,
+                samplerate=sound.samplerate,
+                bitrate=sound.bitrate,
+                title=sound.title,
+                artist=sound.artist,
+                album=sound.album
+            )
+        except ValueError:
+            return None
+        with self.lock, self.connection:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO sounds ({', '.join(self.FIELDS)}) VALUES ({', '.join('?' * len(self.FIELDS))})",
+                tuple(getattr(record, field) for field in self.FIELDS)
+            )
+        return record
+    
+    def sha1(self, sound: CodecBase, buffer_size: int=65536) -> str:
+        """Getting the hash of the sound from the index, calculating and indexing it if there is no record.
+        
+        Args:
+            sound (CodecBase): The sound.
+            buffer_size (int, optional): The size of the temporary buffer. Defaults to 65536.
+        
+        Returns:
+            str: The hash of the sound.
+        """
+        if (sound.name is not None) and ((record:=self.get(sound.name)) is not None):
+            return record.sha1
+        sha1 = sound.__sha1__(buffer_size)
+        self.put(sound, sha1)
+        return sha1
+    
+    # ! Async Methods
+    async def aio_get(self, path: str) -> Optional[SoundRecord]:
+        return await asyncio.to_thread(self.get, path)
+    
+    async def aio_put(self, sound: CodecBase, sha1: str) -> Optional[SoundRecord]:
+        return await asyncio.to_thread(self.put, sound, sha1)
+    
+    async def aio_sha1(self, sound: CodecBase, buffer_size: int=65536) -> str:
+        if (sound.name is not None) and ((record:=await self.aio_get(sound.name)) is not None):
+            return record.sha1
+        sha1 = await sound.__aio_sha1__(buffer_size)
+        await self.aio_put(sound, sha1)
+        return sha1
+    
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,49 @@
+import threading
+from collections import OrderedDict
+# > Typing
+from typing import Any, Protocol
+
+# ! Types
+class Releasable(Protocol):
+    def release(self) -> bool: ...
+
+# ! Main Class
+class LivePool:
+    """A pool of objects holding heavy resources: only the last used `capacity` objects keep them, the rest are released."""
+    def __init__(self, capacity: int=4) -> None:
+        """A pool of objects holding heavy resources: only the last used `capacity` objects keep them, the rest are released.
+        
+        Args:
+            capacity (int, optional): The maximum number of objects with live resources. Defaults to 4.
+        """
+        self.capacity = capacity
+        self.lock = threading.RLock()
+        self.objects: "OrderedDict[int, Releasable]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self.objects)
+    
+    def __contains__(self, obj: Any) -> bool:
+        return id(obj) in self.objects
+    
+    def touch(self, obj: Releasable) -> None:
+        """Marking the object as the last used, the oldest objects are released if the pool is full.
+        
+        Args:
+            obj (Releasable): An object whose resources are alive.
+        """
+        with self.lock:
+            self.objects[id(obj)] = obj
+            self.objects.move_to_end(id(obj))
+            if len(self.objects) > self.capacity:
+                for key, old_obj in list(self.objects.items())[:-1]:
+                    if len(self.objects) <= self.capacity:
+                        break
+                    # * Objects that cannot be released now (for example, playing) are kept
+                    if old_obj.release():
+                        self.objects.pop(key, None)
+    
+    def discard(self, obj: Any) -> None:
+        """Removing the object from the pool without releasing it."""
+        with self.lock:
+            self.objects.pop(id(obj), None)
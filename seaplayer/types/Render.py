@@ -0,0 +1,127 @@
+import os
+import asyncio
+import itertools
+import threading
+from concurrent.futures import Future, CancelledError
+from contextlib import contextmanager, asynccontextmanager
+# > Typing
+from typing import Optional, List, Set, Callable, Iterator, AsyncIterator
+
+# ! Ticket Class
+class RenderTicket(Future):
+    """The place of the render in the queue of the scheduler: the future is resolved when the render can be started, and cancelled if the render is no longer needed."""
+    def __init__(self, name: str, order: int) -> None:
+        super().__init__()
+        self.name = name
+        self.order = order
+        self.stop_callbacks: List[Callable[[], None]] = []
+        """The functions that stop the started render, if it is cancelled."""
+        self.preempted: bool = False
+        """If `True`, the render has been cancelled by the scheduler (see `RenderScheduler.cancel`), not by the one waiting for it."""
+    
+    def add_stop_callback(self, callback: Callable[[], None]) -> None:
+        self.stop_callbacks.append(callback)
+
+# ! Main Class
+class RenderScheduler:
+    """A scheduler of the synthesizer processes: not more than `workers` renders run at the same time, the render of the prioritized sound starts first."""
+    def __init__(self, workers: Optional[int]=None) -> None:
+        """A scheduler of the synthesizer processes: not more than `workers` renders run at the same time, the render of the prioritized sound starts first.
+        
+        Args:
+            workers (Optional[int], optional): The maximum number of renders at the same time. Defaults to None (the number of CPU cores).
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.lock = threading.Lock()
+        self.waiting: List[RenderTicket] = []
+        self.running: Set[RenderTicket] = set()
+        self.counter = itertools.count()
+        self.prioritized: Optional[str] = None
+    
+    # ! Queue Methods
+    def dispatch(self) -> None:
+        while (len(self.running) < self.workers) and (len(self.waiting) > 0):
+            ticket = min(self.waiting, key=lambda t: (t.name != self.prioritized, t.order))
+            self.waiting.remove(ticket)
+            if ticket.set_running_or_notify_cancel():
+                self.running.add(ticket)
+                ticket.set_result(None)
+    
+    def submit(self, name: str) -> RenderTicket:
+        """Putting the render in the queue.
+        
+        Args:
+            name (str): The name of the rendered sound (usually the path).
+        
+        Returns:
+            RenderTicket: The ticket, the render is started when it is resolved, and `done` must be called after it.
+        """
+        ticket = RenderTicket(name, next(self.counter))
+        with self.lock:
+            self.waiting.append(ticket)
+            self.dispatch()
+        return ticket
+    
+    def done(self, ticket: RenderTicket) -> None:
+        """Freeing the place of the finished (or no longer needed) render."""
+        with self.lock:
+            if ticket in self.waiting:
+                self.waiting.remove(ticket)
+                ticket.cancel()
+            self.running.discard(ticket)
+            self.dispatch()
+    
+    def prioritize(self, name: Optional[str]) -> None:
+        """Making the render of the sound the next to start (for example, when the sound is selected)."""
+        with self.lock:
+            self.prioritized = name
+    
+    def cancel(self, name: str) -> None:
+        """Cancelling the waiting renders of the sound and stopping the started ones."""
+        with self.lock:
+            for ticket in [t for t in self.waiting if t.name == name]:
+                self.waiting.remove(ticket)
+                ticket.preempted = True
+                ticket.cancel()
+            stopped = [t for t in self.running if t.name == name]
+        for ticket in stopped:
+            ticket.preempted = True
+            for callback in ticket.stop_callbacks:
+                callback()
+    
+    # ! Context Managers
+    @contextmanager
+    def slot(self, name: str) -> Iterator[RenderTicket]:
+        """Waiting for the place of the render in the current thread and freeing it on exit.
+        
+        Raises:
+            OSError: If the render has been cancelled while waiting.
+        """
+        ticket = self.submit(name)
+        try:
+            try:
+                ticket.result()
+            except CancelledError:
+                raise OSError(f"The render has been cancelled: {repr(name)}")
+            yield ticket
+        finally:
+            self.done(ticket)
+    
+    @asynccontextmanager
+    async def aio_slot(self, name: str) -> AsyncIterator[RenderTicket]:
+        """Waiting for the place of the render in the event loop and freeing it on exit.
+        
+        Raises:
+            OSError: If the render has been cancelled by the scheduler while waiting (the cancellation of the waiting task is passed on as is).
+        """
+        ticket = self.submit(name)
+        try:
+            try:
+                await asyncio.wrap_future(ticket)
+            except asyncio.CancelledError:
+                if not ticket.preempted:
+                    raise
+                raise OSError(f"The render has been cancelled: {repr(name)}")
+            yield ticket
+        finally:
+            self.done(ticket)
\ No newline at end of file
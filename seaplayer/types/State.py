@@ -0,0 +1,110 @@
+import json
+import pickle
+import sqlite3
+import threading
+# > Typing
+from typing import Iterable, Tuple, Any
+
+# ! Vars
+MISSING = object()
+"""Returned by `StateStore.get` when there is no such variable."""
+
+JSON_TYPES = (type(None), bool, int, float, str)
+
+# ! Functions
+def encode(value: Any) -> Tuple[str, bytes]:
+    """Encoding the value: the plain values are stored as JSON (readable with any SQLite tool), the rest is pickled."""
+    if isinstance(value, JSON_TYPES):
+        return type(value).__name__, json.dumps(value).encode("utf-8")
+    return "pickle", pickle.dumps(value)
+
+def decode(kind: str, data: bytes) -> Any:
+    if kind == "pickle":
+        return pickle.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+def is_compatible(value: Any, default: Any) -> bool:
+    """Checking that the stored value can replace the default one (an `int` can replace a `float`, `None` is always allowed as the default)."""
+    if (default is None) or (type(value) is type(default)):
+        return True
+    return isinstance(default, float) and (type(value) is int)
+
+# ! Main Class
+class StateStore:
+    """A single-file store of the SeaPlayer state: the variables are written in atomic batches, one transaction (and one sync to the disk) per batch."""
+    def __init__(self, filepath: str) -> None:
+        """A single-file store of the SeaPlayer state: the variables are written in atomic batches, one transaction (and one sync to the disk) per batch.
+        
+        Args:
+            filepath (str): The path to the database file.
+        """
+        self.filepath = filepath
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.filepath, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            # * Every committed batch is synced, so it survives a power loss
+            self.connection.execute("PRAGMA synchronous=FULL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS vars ("
+                "grp TEXT NOT NULL, name TEXT NOT NULL, kind TEXT NOT NULL, value BLOB NOT NULL, "
+                "PRIMARY KEY (grp, name)"
+                ")"
+            )
+    
+    # ! Main Methods
+    def get(self, name: str, group: str, default: Any=MISSING) -> Any:
+        """Getting the variable.
+        
+        Args:
+            name (str): The name of the variable.
+            group (str): The group of the variable.
+            default (Any, optional): The default value: it is returned if there is no variable, it cannot be decoded, or its type differs. Defaults to MISSING.
+        
+        Returns:
+            Any: The value.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT kind, value FROM vars WHERE grp = ? AND name = ?", (group, name)
+            ).fetchone()
+        if row is None:
+            return default
+        try:
+            value = decode(*row)
+        except Exception:
+            return default
+        if (default is not MISSING) and not is_compatible(value, default):
+            return default
+        return value
+    
+    def put_many(self, values: Iterable[Tuple[str, str, Any]]) -> None:
+        """Writing the variables in one transaction: either all of them are saved or none.
+        
+        Args:
+            values (Iterable[Tuple[str, str, Any]]): The variables `(name, group, value)`.
+        """
+        rows = [(group, name, *encode(value)) for name, group, value in values]
+        if len(rows) == 0:
+            return
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO vars (grp, name, kind, value) VALUES (?, ?, ?, ?)", rows
+            )
+    
+    def put(self, name: str, group: str, value: Any) -> None:
+        self.put_many([(name, group, value)])
+    
+    def remove(self, name: str, group: str) -> None:
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM vars WHERE grp = ? AND name = ?", (group, name))
+    
+    def contains(self, name: str, group: str) -> bool:
+        with self.lock:
+            return self.connection.execute(
+                "SELECT 1 FROM vars WHERE grp = ? AND name = ?", (group, name)
+            ).fetchone() is not None
+    
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
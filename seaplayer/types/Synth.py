@@ -0,0 +1,299 @@
+import io
+import os
+import struct
+import threading
+import subprocess
+from tempfile import mkstemp
+# > Typing
+from typing import Optional, List, Tuple, Callable, Any
+# > Local Imports
+from .Render import RenderScheduler, RenderTicket
+
+# ! Vars
+CHUNK_SIZE = 65536
+"""The size of the block read from the synthesizer at a time."""
+TAIL_SECONDS = 1.0
+"""How long the sound continues after the last MIDI event (so that the last notes fade out)."""
+DEFAULT_TEMPO = 500000
+"""The default MIDI tempo in microseconds per quarter note."""
+WAV_HEADER_SIZE = 44
+
+# ! MIDI Functions
+def read_varlen(data: bytes, offset: int) -> Tuple[int, int]:
+    """Reading the variable-length number of the MIDI.
+    
+    Returns:
+        Tuple[int, int]: The number and the offset after it.
+    """
+    value = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value = (value << 7) | (byte & 0x7F)
+        if byte < 0x80:
+            return value, offset
+
+def parse_track(data: bytes, start: int, end: int, tempos: List[Tuple[int, int]]) -> int:
+    """Going through the MIDI track, collecting the tempo changes.
+    
+    Returns:
+        int: The tick of the last event of the track.
+    """
+    tick, offset, running = 0, start, None
+    while offset < end:
+        delta, offset = read_varlen(data, offset)
+        tick += delta
+        status = data[offset]
+        if status >= 0x80:
+            offset += 1
+        elif running is not None:
+            status = running
+        else:
+            raise ValueError("The MIDI track event has no status.")
+        if status == 0xFF:
+            meta_type = data[offset]
+            length, offset = read_varlen(data, offset+1)
+            if (meta_type == 0x51) and (length == 3):
+                tempos.append((tick, int.from_bytes(data[offset:offset+3], "big")))
+            offset += length
+            if meta_type == 0x2F:
+                break
+        elif status in (0xF0, 0xF7):
+            length, offset = read_varlen(data, offset)
+            offset += length
+        else:
+            running = status
+            offset += 1 if ((status & 0xF0) in (0xC0, 0xD0)) else 2
+    return tick
+
+def midi_duration(path: str) -> float:
+    """Calculating the duration of the MIDI by its event timeline (taking the tempo changes into account).
+    
+    Args:
+        path (str): The path to the MIDI file.
+    
+    Raises:
+        ValueError: If the file is not a standard MIDI file.
+    
+    Returns:
+        float: The duration in seconds.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if data[:4] != b"MThd":
+        raise ValueError(f"The file is not a MIDI file: {repr(path)}")
+    header_size = int.from_bytes(data[4:8], "big")
+    division = struct.unpack(">H", data[12:14])[0]
+    tempos: List[Tuple[int, int]] = []
+    last_tick, offset = 0, 8 + header_size
+    while offset+8 <= len(data):
+        chunk_type, chunk_size = data[offset:offset+4], int.from_bytes(data[offset+4:offset+8], "big")
+        offset += 8
+        if chunk_type == b"MTrk":
+            last_tick = max(last_tick, parse_track(data, offset, min(offset+chunk_size, len(data)), tempos))
+        offset += chunk_size
+    if division & 0x8000:
+        # * SMPTE time division: frames per second and ticks per frame
+        return last_tick / ((256 - (division >> 8)) * (division & 0xFF))
+    seconds, tick, tempo = 0.0, 0, DEFAULT_TEMPO
+    for tempo_tick, tempo_value in sorted(tempos):
+        if tempo_tick >= last_tick:
+            break
+        seconds += (tempo_tick - tick) * tempo / (division * 1000000)
+        tick, tempo = tempo_tick, tempo_value
+    return seconds + (last_tick - tick) * tempo / (division * 1000000)
+
+def wav_header(frames: int, samplerate: int, channels: int=2, sample_width: int=2) -> bytes:
+    data_size = frames * channels * sample_width
+    return b"RIFF" + struct.pack("<I", 36 + data_size) + b"WAVE" \
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, channels, samplerate, samplerate*channels*sample_width, channels*sample_width, sample_width*8) \
+        + b"data" + struct.pack("<I", data_size)
+
+# ! Main Class
+class SynthStream(io.RawIOBase):
+    """A file-like WAV of the MIDI that the synthesizer renders in the background into a temporary file.
+    
+    The size of the WAV is known in advance from the MIDI event timeline, so the sound can be opened right away, reading waits only for the requested bytes. The synthesizer output is cut or padded with silence to that size.
+    """
+    channels: int=2
+    sample_width: int=2
+    
+    def __init__(
+        self,
+        path: str,
+        sound_fonts_path: str,
+        synth_path: str="fluidsynth",
+        synth_args: Tuple[str, ...]=(),
+        samplerate: int=44100,
+        is_temp: bool=False,
+        scheduler: Optional[RenderScheduler]=None
+    ) -> None:
+        """A file-like WAV of the MIDI that the synthesizer renders in the background into a temporary file.
+        
+        Args:
+            path (str): The path to the MIDI file.
+            sound_fonts_path (str): The path to the sound font.
+            synth_path (str, optional): The path to the `fluidsynth` executable. Defaults to "fluidsynth".
+            synth_args (Tuple[str, ...], optional): Additional arguments of the synthesizer. Defaults to ().
+            samplerate (int, optional): The sample rate. Defaults to 44100.
+            is_temp (bool, optional): If `True`, the MIDI file is removed when the rendering is finished. Defaults to False.
+            scheduler (Optional[RenderScheduler], optional): The scheduler that limits the number of synthesizers running at the same time. Defaults to None (the synthesizer starts right away).
+        """
+        super().__init__()
+        self.midi_path = path
+        self.is_temp = is_temp
+        self.samplerate = samplerate
+        self.duration = midi_duration(path) + TAIL_SECONDS
+        self.frames = round(self.duration * samplerate)
+        self.length = WAV_HEADER_SIZE + self.frames * self.channels * self.sample_width
+        self.position = 0
+        self.written = 0
+        self.finished: bool = False
+        self.exception: Optional[BaseException] = None
+        self.cond = threading.Condition()
+        self.finish_callbacks: List[Callable[["SynthStream"], None]] = []
+        self.command = [
+            synth_path, "-ni", *synth_args,
+            "-r", str(samplerate), "-T", "raw", "-O", "s16", "-E", "little",
+            "-F", "-", sound_fonts_path, path
+        ]
+        self.process: Optional[subprocess.Popen] = None
+        self.scheduler = scheduler
+        self.ticket: Optional[RenderTicket] = None
+        
+        fd, self.path = mkstemp(suffix=".wav")
+        self.file = os.fdopen(fd, "r+b")
+        self.file.write(wav_header(self.frames, samplerate, self.channels, self.sample_width))
+        self.written = WAV_HEADER_SIZE
+        self.thread = threading.Thread(target=self.render, name="seaplayer-synth", daemon=True)
+        self.thread.start()
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(midi_path={repr(self.midi_path)}, duration={repr(self.duration)}, written={repr(self.written)})"
+    
+    # ! Render Methods
+    def add_finish_callback(self, callback: Callable[["SynthStream"], None]) -> None:
+        """Adding a function that is called in the render thread when the whole WAV is rendered (immediately, if it already is)."""
+        with self.cond:
+            if not self.finished:
+                self.finish_callbacks.append(callback)
+                return
+        callback(self)
+    
+    def append(self, data: bytes) -> None:
+        with self.cond:
+            if self.closed:
+                return
+            self.file.seek(self.written)
+            self.file.write(data)
+            self.written += len(data)
+            self.cond.notify_all()
+    
+    def start(self) -> None:
+        """Waiting for the place in the scheduler (if there is one) and starting the synthesizer."""
+        if self.scheduler is not None:
+            with self.cond:
+                self.ticket = self.scheduler.submit(self.midi_path)
+            self.ticket.result()
+            self.ticket.add_stop_callback(self.close)
+        with self.cond:
+            if self.closed:
+                raise ValueError("I/O operation on closed file.")
+            self.process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+    
+    def render(self) -> None:
+        try:
+            self.start()
+            while (self.written < self.length) and not self.closed:
+                data = self.process.stdout.read(CHUNK_SIZE)
+                if not data:
+                    break
+                self.append(data[:self.length-self.written])
+            while (self.written < self.length) and not self.closed:
+                self.append(bytes(min(CHUNK_SIZE, self.length-self.written)))
+            with self.cond:
+                if not self.closed:
+                    self.file.flush()
+                    self.finished = True
+                self.cond.notify_all()
+        except BaseException as e:
+            with self.cond:
+                if not self.closed:
+                    self.exception = e
+                self.cond.notify_all()
+        self.stop()
+        if self.ticket is not None:
+            self.scheduler.done(self.ticket)
+        if self.is_temp:
+            try: os.remove(self.midi_path)
+            except OSError: pass
+        if self.finished and not self.closed:
+            for callback in self.finish_callbacks:
+                callback(self)
+    
+    def stop(self) -> None:
+        if self.process is None:
+            return
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        self.process.stdout.close()
+    
+    def check(self) -> None:
+        if self.exception is not None:
+            raise OSError(f"Failed to render {repr(self.midi_path)}") from self.exception
+    
+    # ! IO Methods
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self.position
+    
+    def seek(self, offset: int, whence: int=io.SEEK_SET) -> int:
+        with self.cond:
+            if whence == io.SEEK_SET:
+                self.position = offset
+            elif whence == io.SEEK_CUR:
+                self.position += offset
+            elif whence == io.SEEK_END:
+                self.position = self.length + offset
+            else:
+                raise ValueError(f"Invalid whence: {repr(whence)}")
+            self.position = max(0, self.position)
+            return self.position
+    
+    def readinto(self, buffer: Any) -> int:
+        with self.cond:
+            size = min(len(buffer), self.length - self.position)
+            if size <= 0:
+                return 0
+            while self.written <= self.position:
+                if self.closed:
+                    raise ValueError("I/O operation on closed file.")
+                self.check()
+                self.cond.wait()
+            self.file.seek(self.position)
+            count = self.file.readinto(memoryview(buffer)[:min(size, self.written-self.position)])
+            self.position += count
+            return count
+    
+    def close(self) -> None:
+        if self.closed:
+            return
+        with self.cond:
+            super().close()
+            self.cond.notify_all()
+            self.file.close()
+            if self.ticket is not None:
+                self.ticket.cancel()
+            if (self.process is not None) and (self.process.poll() is None):
+                self.process.kill()
+        try: os.remove(self.path)
+        except OSError: pass
\ No newline at end of file
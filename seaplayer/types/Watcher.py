@@ -0,0 +1,88 @@
+import threading
+# > Typing
+from typing import Callable, Optional, List, Tuple
+
+# ! Types
+Callback = Callable[[], None]
+
+# ! Main Class
+class PlaybackWatcher:
+    """Calls the callbacks when the playback finishes (or the set number of seconds before it) using timers instead of polling."""
+    MIN_DELAY = 0.01
+    """The minimum delay between checks when the end is expected, but the sound is still playing."""
+    
+    def __init__(self, get_remaining: Callable[[], float], is_playing: Callable[[], bool]) -> None:
+        """Calls the callbacks when the playback finishes (or the set number of seconds before it) using timers instead of polling.
+        
+        Args:
+            get_remaining (Callable[[], float]): Returns the number of seconds until the end of the playback.
+            is_playing (Callable[[], bool]): Returns `True` if the sound is still playing.
+        """
+        self.get_remaining = get_remaining
+        self.is_playing = is_playing
+        self.callbacks: List[Tuple[float, Callback]] = []
+        self.fired: List[Callback] = []
+        self.timer: Optional[threading.Timer] = None
+        self.lock = threading.RLock()
+    
+    # ! Callbacks Methods
+    def add_callback(self, callback: Callback, before: float=0.0) -> None:
+        """Adding a callback.
+        
+        Args:
+            callback (Callback): The function to call.
+            before (float, optional): How many seconds before the end to call it (`0.0` is when the playback has finished). Defaults to 0.0.
+        """
+        with self.lock:
+            self.callbacks.append((max(0.0, before), callback))
+            if self.timer is not None:
+                self.schedule()
+    
+    def remove_callback(self, callback: Callback) -> None:
+        with self.lock:
+            self.callbacks = [(before, cb) for before, cb in self.callbacks if cb != callback]
+    
+    # ! Control Methods
+    def start(self) -> None:
+        """Starting (or restarting after the position has changed) the watch, it is called when the playback starts."""
+        with self.lock:
+            self.fired.clear()
+            self.schedule()
+    
+    def stop(self) -> None:
+        """Stopping the watch without calling callbacks, it is called when the playback is stopped or paused."""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+    
+    # ! Timer Methods
+    def schedule(self, delay: Optional[float]=None) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+        if delay is None:
+            remaining = self.get_remaining()
+            waits = [remaining - before for before, cb in self.callbacks if (before > 0) and (cb not in self.fired)]
+            delay = max(0.0, min([remaining, *waits]))
+        self.timer = threading.Timer(delay, self.on_timer)
+        self.timer.daemon = True
+        self.timer.start()
+    
+    def on_timer(self) -> None:
+        with self.lock:
+            self.timer = None
+            remaining = self.get_remaining()
+            playing = self.is_playing()
+            calls: List[Callback] = []
+            for before, callback in self.callbacks:
+                if callback in self.fired:
+                    continue
+                if ((before > 0) and (remaining <= before)) or ((before == 0) and not playing):
+                    self.fired.append(callback)
+                    calls.append(callback)
+            if playing:
+                pending = [b for b, cb in self.callbacks if cb not in self.fired]
+                if len(pending) > 0:
+                    self.schedule(None if remaining > self.MIN_DELAY else self.MIN_DELAY)
+        for callback in calls:
+            callback()
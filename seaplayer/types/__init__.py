@@ -1,3 +1,20 @@
 from .Convert import Converter
 from .Cache import Cacher
 from .Environment import Environment
+from .Library import LibraryIndex, SoundRecord
+from .LivePool import LivePool
+from .Watcher import PlaybackWatcher
+from .Download import ProgressiveDownload
+from .FilesCache import FilesCache, CacheEntry
+from .Synth import SynthStream
+from .Render import RenderScheduler, RenderTicket
+from .Artwork import ArtworkCache
+from .State import StateStore
+
+# ! Lazy Exports
+def __getattr__(name: str):
+    # * The image process pool needs numpy, it is imported only when the pool is used
+    if name in ("ImageProcessPool", "SharedImage"):
+        from . import ImagePool
+        return getattr(ImagePool, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -41,6 +41,7 @@ GLOB_PLUGINS_DEPS_SEARCH = os.path.join(PLUGINS_DIRPATH, "*", "requirements.txt"
 IMGPATH_IMAGE_NOT_FOUND = os.path.join(ASSETS_DIRPATH, "image-not-found.png")
 
 # ! Constants
+SOUNDS_LOADING_BATCH_SIZE = 32
 RESAMPLING_SAFE = {
     "nearest": Resampling.NEAREST,
     "bilinear": Resampling.BILINEAR,
@@ -0,0 +1,54 @@
+import os
+from io import BytesIO
+from PIL import Image
+from seaplayer.types.Artwork import ArtworkCache
+
+# ! Functions
+def make_jpeg(size: int) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (size, size), (200, 40, 40)).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+# ! Tests
+def test_artwork_thumbnail_is_downscaled(tmp_path):
+    artwork = ArtworkCache(str(tmp_path), thumbnail_size=64)
+    image = artwork.thumbnail("a" * 40, lambda: make_jpeg(1000))
+    assert max(image.size) <= 64
+
+def test_artwork_thumbnail_is_cached(tmp_path):
+    calls = []
+    load = lambda: calls.append(1) or make_jpeg(256)
+    artwork = ArtworkCache(str(tmp_path), thumbnail_size=64)
+    artwork.thumbnail("a" * 40, load)
+    artwork.thumbnail("a" * 40, load)
+    # * A new cache reads the thumbnail from the disk
+    assert ArtworkCache(str(tmp_path), thumbnail_size=64).thumbnail("a" * 40, load).size == (64, 64)
+    assert len(calls) == 1
+
+def test_artwork_no_cover(tmp_path):
+    calls = []
+    artwork = ArtworkCache(str(tmp_path))
+    assert artwork.thumbnail("b" * 40, lambda: calls.append(1)) is None
+    assert artwork.thumbnail("b" * 40, lambda: calls.append(1)) is None
+    assert len(calls) == 1
+
+def test_artwork_renders_lru():
+    artwork = ArtworkCache(max_renders=2)
+    for width in range(3):
+        artwork.put_render(("a", (width, 10), 0), width)
+    assert artwork.get_render(("a", (0, 10), 0)) is None
+    assert artwork.get_render(("a", (2, 10), 0)) == 2
+
+def test_artwork_thumbnails_budget(tmp_path):
+    artwork = ArtworkCache(str(tmp_path), thumbnail_size=64, budget=1)
+    artwork.thumbnail("c" * 40, lambda: make_jpeg(256))
+    # * The thumbnail does not fit into the budget, so it is kept only in memory
+    assert artwork.files.get("c" * 40) is None
+    assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path))
+
+def test_artwork_legacy_thumbnails_removed(tmp_path):
+    legacy = tmp_path / "dd"
+    legacy.mkdir()
+    Image.new("RGB", (8, 8)).save(legacy / f"{'d' * 40}.png", "PNG")
+    ArtworkCache(str(tmp_path))
+    assert not legacy.exists()
@@ -0,0 +1,103 @@
+import os
+import pickle
+import pytest
+import sqlite3
+import threading
+from seaplayer.types import Cacher, StateStore
+
+# ! Tests
+def test_cacher_var_write_back(tmp_path):
+    cacher = Cacher(str(tmp_path), flush_delay=60)
+    class Holder:
+        volume: float = cacher.var("volume", 1.0)
+    holder = Holder()
+    assert holder.volume == 1.0
+    holder.volume = 0.5
+    holder.volume = 0.25
+    assert holder.volume == 0.25
+    assert not cacher.state.contains("volume", "main")
+    cacher.flush()
+    assert cacher.state.get("volume", "main") == 0.25
+
+def test_cacher_var_reads_store_once(tmp_path):
+    cacher = Cacher(str(tmp_path))
+    cacher.state.put("mode", "main", 7)
+    assert cacher.read_var("mode", 0) == 7
+    cacher.state.remove("mode", "main")
+    assert cacher.read_var("mode", 0) == 7
+
+def test_cacher_migrates_vars(tmp_path):
+    os.makedirs(tmp_path / "vars")
+    with open(tmp_path / "vars" / "currect_volume-main.pycache", "wb") as file:
+        pickle.dump(0.75, file)
+    with open(tmp_path / "vars" / "broken-main.pycache", "wb") as file:
+        file.write(b"not a pickle")
+    cacher = Cacher(str(tmp_path))
+    assert cacher.read_var("currect_volume", 1.0) == 0.75
+    assert cacher.read_var("broken", 3) == 3
+    assert not os.path.exists(tmp_path / "vars")
+
+def test_state_store_types(tmp_path):
+    store = StateStore(str(tmp_path / "state.sqlite"))
+    store.put_many([("volume", "main", 1), ("name", "main", "sea"), ("items", "main", {1, 2})])
+    assert store.get("volume", "main", 1.0) == 1
+    assert store.get("name", "main", 0) == 0
+    assert store.get("items", "main") == {1, 2}
+    assert store.get("missing", "main", None) is None
+    store.close()
+    store = StateStore(str(tmp_path / "state.sqlite"))
+    assert store.get("name", "main", "") == "sea"
+
+def test_cacher_flush_does_not_block_reads(tmp_path):
+    cacher = Cacher(str(tmp_path), flush_delay=60)
+    cacher.write_var(0.5, "volume")
+    started, release = threading.Event(), threading.Event()
+    put_many = cacher.state.put_many
+    def slow_put_many(values):
+        started.set()
+        release.wait(5)
+        put_many(values)
+    cacher.state.put_many = slow_put_many
+    thread = threading.Thread(target=cacher.flush)
+    thread.start()
+    assert started.wait(5)
+    # * The value is read from memory while the batch is being written
+    assert cacher.read_var("volume", 1.0) == 0.5
+    release.set()
+    thread.join(5)
+    assert cacher.state.get("volume", "main") == 0.5
+
+def test_cacher_failed_flush_retries(tmp_path):
+    cacher = Cacher(str(tmp_path), flush_delay=60)
+    cacher.write_var(0.5, "volume")
+    put_many = cacher.state.put_many
+    def failing_put_many(values):
+        raise sqlite3.OperationalError("database is locked")
+    cacher.state.put_many = failing_put_many
+    with pytest.raises(sqlite3.Error):
+        cacher.flush()
+    assert cacher.pending == {("volume", "main"): 0.5}
+    assert cacher.flush_timer is not None
+    cacher.state.put_many = put_many
+    cacher.flush()
+    assert cacher.state.get("volume", "main") == 0.5
+
+def test_cacher_background_flush_reports_error(tmp_path, capsys):
+    cacher = Cacher(str(tmp_path), flush_delay=60)
+    cacher.write_var(0.5, "volume")
+    put_many = cacher.state.put_many
+    def failing_put_many(values):
+        raise sqlite3.OperationalError("database is locked")
+    cacher.state.put_many = failing_put_many
+    errors = []
+    cacher.error_handler = errors.append
+    assert not cacher.background_flush()
+    assert len(errors) == 1 and isinstance(errors[0], sqlite3.OperationalError)
+    assert cacher.pending == {("volume", "main"): 0.5}
+    # * Without a handler (or if it fails), the error goes to stderr
+    cacher.error_handler = None
+    assert not cacher.background_flush()
+    assert "database is locked" in capsys.readouterr().err
+    cacher.state.put_many = put_many
+    assert cacher.background_flush()
+    assert cacher.state.get("volume", "main") == 0.5
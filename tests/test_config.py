@@ -0,0 +1,36 @@
+import time
+from seaplayer.config import SeaPlayerConfig
+
+# ! Tests
+def test_config_writes_are_debounced(tmp_path, monkeypatch):
+    filepath = tmp_path / "config.properties"
+    config = SeaPlayerConfig(str(filepath))
+    writes = []
+    dump = SeaPlayerConfig.dump
+    monkeypatch.setattr(SeaPlayerConfig, "dump", staticmethod(lambda path, data: (writes.append(data), dump(path, data))))
+    config.flush_delay = 0.05
+    config.max_live_sounds = 8
+    config.loading_workers = 2
+    config.recursive_search = True
+    assert writes == []
+    time.sleep(0.3)
+    assert len(writes) == 1
+    loaded = SeaPlayerConfig(str(filepath))
+    assert (loaded.max_live_sounds, loaded.loading_workers, loaded.recursive_search) == (8, 2, True)
+    assert not (tmp_path / "config.properties.tmp").exists()
+
+def test_config_batch(tmp_path):
+    filepath = tmp_path / "config.properties"
+    config = SeaPlayerConfig(str(filepath))
+    config.flush_delay = 60
+    with config.batch():
+        config.max_live_sounds = 3
+        with config.batch():
+            config.loading_workers = 5
+        assert config.flush_timer is None
+    for _ in range(100):
+        if not config.dirty: break
+        time.sleep(0.01)
+    assert not config.dirty
+    loaded = SeaPlayerConfig(str(filepath))
+    assert (loaded.max_live_sounds, loaded.loading_workers) == (3, 5)
@@ -0,0 +1,85 @@
+import io
+import os
+import threading
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from seaplayer.types.Download import ProgressiveDownload, HTTPPool
+
+# ! Vars
+DATA = os.urandom(3 * 1048576 + 12345)
+ETAG = '"sound"'
+
+# ! Server
+class RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, *args) -> None: ...
+    
+    def do_GET(self) -> None:
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        start = 0
+        if (value:=self.headers.get("Range")) is not None:
+            start = int(value.split("=")[1].split("-")[0])
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(DATA)-1}/{len(DATA)}")
+        else:
+            self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(DATA)-start))
+        self.end_headers()
+        try: self.wfile.write(DATA[start:])
+        except OSError: pass
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    def handle_error(self, *args) -> None: ...
+
+@pytest.fixture(scope="module")
+def url():
+    server = Server(("127.0.0.1", 0), RangeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/sound.bin"
+    server.shutdown()
+
+# ! Tests
+def test_download_read_all(url):
+    with ProgressiveDownload(url) as stream:
+        stream.wait(65536)
+        assert stream.seek(0, io.SEEK_END) == len(DATA)
+        stream.seek(0)
+        assert stream.readall() == DATA
+
+def test_download_seek(url):
+    with ProgressiveDownload(url) as stream:
+        stream.seek(len(DATA) - 100)
+        assert stream.read(100) == DATA[-100:]
+        stream.seek(12345)
+        assert stream.read(10) == DATA[12345:12355]
+
+def test_download_close_removes_file(url):
+    stream = ProgressiveDownload(url)
+    path = stream.path
+    stream.close()
+    assert not os.path.exists(path)
+
+def test_download_probe_reuses_connection(url):
+    pool = HTTPPool()
+    for _ in range(3):
+        with ProgressiveDownload(url, pool) as stream:
+            assert stream.peek(4) == DATA[:4]
+            stream.wait()
+            assert stream.readall() == DATA
+    assert pool.created == 1
+
+def test_download_not_modified(url):
+    with ProgressiveDownload(url) as stream:
+        stream.wait()
+        etag = stream.etag
+    assert etag is not None
+    with ProgressiveDownload(url, headers={"If-None-Match": etag}) as stream:
+        assert stream.not_modified
@@ -0,0 +1,47 @@
+import os
+import pytest
+from seaplayer.types.FilesCache import FilesCache
+
+# ! Vars
+SIZE = 1000
+
+# ! Fixtures
+@pytest.fixture
+def cache(tmp_path):
+    cache = FilesCache(str(tmp_path / "cache"), 3 * SIZE)
+    yield cache
+    cache.close()
+
+def make_file(tmp_path, name: str, data: bytes) -> str:
+    path = str(tmp_path / name)
+    with open(path, "wb") as file:
+        file.write(data)
+    return path
+
+# ! Tests
+def test_files_cache_put_get(cache, tmp_path):
+    path = make_file(tmp_path, "a.bin", os.urandom(SIZE))
+    entry = cache.put("http://host/a.mp3", path, etag='"a"')
+    assert entry.sha1 == cache.file_sha1(path)
+    got = cache.get("http://host/a.mp3")
+    assert (got.path == entry.path) and (got.etag == '"a"')
+    assert cache.get("http://host/b.mp3") is None
+
+def test_files_cache_deduplicates(cache, tmp_path):
+    data = os.urandom(SIZE)
+    cache.put("a", make_file(tmp_path, "a.bin", data))
+    cache.put("b", make_file(tmp_path, "b.bin", data))
+    assert cache.get("a").path == cache.get("b").path
+    assert cache.size == SIZE
+
+def test_files_cache_evicts_least_recently_used(cache, tmp_path):
+    for i in range(3):
+        cache.put(str(i), make_file(tmp_path, f"{i}.bin", os.urandom(SIZE)))
+    cache.get("0")
+    cache.put("3", make_file(tmp_path, "3.bin", os.urandom(SIZE)))
+    assert [cache.contains(str(i)) for i in range(4)] == [True, False, True, True]
+    assert cache.size <= cache.budget
+
+def test_files_cache_skips_large_files(cache, tmp_path):
+    assert cache.put("large", make_file(tmp_path, "large.bin", os.urandom(4 * SIZE))) is None
+    assert not cache.contains("large")
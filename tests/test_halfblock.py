@@ -0,0 +1,27 @@
+from PIL import Image
+from rich.console import Console
+from seaplayer.modules.halfblock import HalfBlockPixels, HALF_BLOCK
+
+# ! Tests
+def test_halfblock_merges_runs():
+    image = Image.new("RGB", (4, 4), (255, 0, 0))
+    pixels = HalfBlockPixels.from_image(image, (4, 2))
+    assert [len(line) for line in pixels.lines] == [1, 1]
+    segment = pixels.lines[0][0]
+    assert segment.text == HALF_BLOCK * 4
+    assert (segment.style.color.triplet, segment.style.bgcolor.triplet) == ((255, 0, 0), (255, 0, 0))
+
+def test_halfblock_upper_and_lower_pixels():
+    image = Image.new("RGB", (2, 2), (0, 0, 255))
+    image.putpixel((0, 0), (0, 255, 0))
+    pixels = HalfBlockPixels.from_image(image, (2, 1))
+    first, second = pixels.lines[0]
+    assert (first.style.color.triplet, first.style.bgcolor.triplet) == ((0, 255, 0), (0, 0, 255))
+    assert (second.style.color.triplet, second.style.bgcolor.triplet) == ((0, 0, 255), (0, 0, 255))
+
+def test_halfblock_renders_size():
+    image = Image.effect_noise((64, 64), 64).convert("RGB")
+    console = Console(width=100, color_system="truecolor")
+    lines = console.render_lines(HalfBlockPixels.from_image(image, (30, 10)), pad=False)
+    assert len(lines) == 10
+    assert all(sum(len(segment.text) for segment in line) == 30 for line in lines)
@@ -0,0 +1,88 @@
+import asyncio
+from PIL import Image
+from textual.app import App, ComposeResult
+from seaplayer.types import ArtworkCache
+from seaplayer.objects.Image import BaseImageLabel
+
+# ! Classes
+class RecordingImageLabel(BaseImageLabel):
+    DEFAULT_CSS = """
+    RecordingImageLabel {
+        width: 20;
+        height: 10;
+    }
+    """
+    
+    def __init__(self) -> None:
+        super().__init__(Image.new("RGB", (8, 8)), artwork=ArtworkCache())
+        self.started = []
+        self.slow = False
+    
+    async def pixels_from_image(self, image, size, resample) -> str:
+        self.started.append(size)
+        await asyncio.sleep(0.5 if self.slow else 0.05)
+        return f"{size[0]}x{size[1]}"
+
+class ImageApp(App):
+    def compose(self) -> ComposeResult:
+        yield RecordingImageLabel()
+
+# ! Tests
+def test_image_label_renders_last_resize():
+    async def run() -> None:
+        app = ImageApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            label = app.query_one(RecordingImageLabel)
+            await asyncio.sleep(0.4)
+            label.started.clear()
+            label.styles.width = 25
+            await pilot.pause()
+            label.styles.width = 30
+            await pilot.pause()
+            await asyncio.sleep(0.4)
+            await app.workers.wait_for_complete()
+            # * The first size has been debounced, only the last one is rendered
+            assert label.started == [(30, 10)]
+            assert (label.last_image_size, label.image_text) == ((30, 10), "30x10")
+    asyncio.run(run())
+
+def test_image_label_cancels_superseded_render():
+    async def run() -> None:
+        app = ImageApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            label = app.query_one(RecordingImageLabel)
+            await asyncio.sleep(0.4)
+            label.started.clear()
+            await label.update_image(Image.new("RGB", (8, 8)), "a")
+            await pilot.pause()
+            await label.update_image(Image.new("RGB", (8, 8)), "b")
+            await asyncio.sleep(0.3)
+            await pilot.pause()
+            # * The render of "a" has been started, but its result is not applied
+            size = (label.size[0], label.size[1])
+            assert len(label.started) == 2
+            assert (label.image_key, label.image_text) == ("b", f"{size[0]}x{size[1]}")
+            assert label.artwork.get_render(("a", size, 0)) is None
+            assert label.artwork.get_render(("b", size, 0)) == label.image_text
+    asyncio.run(run())
+
+def test_image_label_memoized_resize_cancels_render():
+    async def run() -> None:
+        app = ImageApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            label = app.query_one(RecordingImageLabel)
+            await label.update_image(Image.new("RGB", (8, 8)), "a")
+            await asyncio.sleep(0.4)
+            memoized = (label.size[0], label.size[1])
+            # * The render for the new size is running when the size returns to the memoized one
+            label.slow = True
+            label.styles.width = 30
+            await pilot.pause()
+            await asyncio.sleep(0.3)
+            assert label.started[-1] == (30, memoized[1])
+            label.styles.width = memoized[0]
+            await pilot.pause()
+            await asyncio.sleep(0.6)
+            await pilot.pause()
+            assert (label.last_image_size, label.image_text) == (memoized, f"{memoized[0]}x{memoized[1]}")
+    asyncio.run(run())
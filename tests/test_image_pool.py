@@ -0,0 +1,29 @@
+import asyncio
+from PIL import Image
+from PIL.Image import Resampling
+from seaplayer.types import ImageProcessPool
+from seaplayer.modules.halfblock import HalfBlockPixels
+
+# ! Tests
+def test_image_pool_renders_like_vector():
+    image = Image.effect_noise((96, 64), 48).convert("RGB")
+    pool = ImageProcessPool(workers=1)
+    try:
+        pixels = asyncio.run(pool.aio_render(image, (24, 8), Resampling.BILINEAR))
+        expected = HalfBlockPixels.from_image(image, (24, 8), Resampling.BILINEAR)
+        assert pixels.lines == expected.lines
+    finally:
+        pool.close()
+
+def test_image_pool_shares_once():
+    images = [Image.new("RGB", (8, 8), (index, 0, 0)) for index in range(3)]
+    pool = ImageProcessPool(workers=1, max_shared=2)
+    try:
+        first = pool.share(images[0])
+        assert pool.share(images[0]) is first
+        pool.share(images[1])
+        pool.share(images[2])
+        assert list(pool.shared) == [id(images[1]), id(images[2])]
+    finally:
+        pool.close()
+    assert len(pool.shared) == 0
@@ -12,3 +12,27 @@ def test_language_count_loaded():
 
 def test_language_get_not_exist():
     assert ll.get("") == "<LTNF>"
+
+def test_language_cache_reused(tmp_path, monkeypatch):
+    cached = LanguageLoader(LANGUAGES_DIRPATH, "en-eng", cache_dirpath=str(tmp_path))
+    assert [lang.title for lang in cached.langs] == [lang.title for lang in ll.langs]
+    assert cached.get("") == "<LTNF>"
+    # * The second loader reads only the compiled tables and the index
+    def fail(*args, **kwargs):
+        raise AssertionError("the file was parsed again")
+    monkeypatch.setattr("seaplayer.languages.parse_language_file", fail)
+    again = LanguageLoader(LANGUAGES_DIRPATH, "en-eng", cache_dirpath=str(tmp_path))
+    assert [lang.title for lang in again.langs] == [lang.title for lang in ll.langs]
+    assert again.main_lang.get("language.metadata.title") == ll.main_lang.get("language.metadata.title")
+
+def test_language_cache_invalidated(tmp_path):
+    langs_dirpath = tmp_path / "langs"
+    langs_dirpath.mkdir()
+    filepath = langs_dirpath / "en-eng.properties"
+    filepath.write_text("language.metadata.title=\"Old\"\nkey=\"old\"\n", encoding="utf-8")
+    cache_dirpath = str(tmp_path / "cache")
+    assert LanguageLoader(str(langs_dirpath), "en-eng", cache_dirpath=cache_dirpath).get("key") == "old"
+    filepath.write_text("language.metadata.title=\"Newer\"\nkey=\"newer\"\n", encoding="utf-8")
+    loader = LanguageLoader(str(langs_dirpath), "en-eng", cache_dirpath=cache_dirpath)
+    assert loader.main_lang.title == "Newer"
+    assert loader.get("key") == "newer"
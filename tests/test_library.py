@@ -0,0 +1,55 @@
+import os
+from seaplayer.types import LibraryIndex
+
+# ! Classes
+class FakeSound:
+    codec_name = "WAVE"
+    duration, channels, samplerate, bitrate = 1.5, 2, 44100, 1411
+    title, artist, album = "Title", None, None
+    
+    def __init__(self, path: str) -> None:
+        self.name = path
+        self.hashed = 0
+    
+    def __sha1__(self, buffer_size: int) -> str:
+        self.hashed += 1
+        return "a" * 40
+
+# ! Functions
+def make_sound(tmp_path, data: bytes=b"RIFF....WAVE") -> FakeSound:
+    path = tmp_path / "sound.wav"
+    path.write_bytes(data)
+    return FakeSound(str(path))
+
+# ! Tests
+def test_library_round_trip(tmp_path):
+    library = LibraryIndex(str(tmp_path / "library.sqlite"))
+    sound = make_sound(tmp_path)
+    assert library.get(sound.name) is None
+    assert library.sha1(sound) == "a" * 40
+    record = library.get(sound.name)
+    assert (record.sha1, record.codec_name, record.duration, record.title) == ("a" * 40, "WAVE", 1.5, "Title")
+    # * The indexed hash is not calculated again
+    assert library.sha1(sound) == "a" * 40
+    assert sound.hashed == 1
+
+def test_library_invalidated_by_size_and_mtime(tmp_path):
+    library = LibraryIndex(str(tmp_path / "library.sqlite"))
+    sound = make_sound(tmp_path)
+    library.put(sound, "a" * 40)
+    with open(sound.name, "ab") as file:
+        file.write(b"more")
+    assert library.get(sound.name) is None
+    library.put(sound, "b" * 40)
+    stat = os.stat(sound.name)
+    os.utime(sound.name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert library.get(sound.name) is None
+
+def test_library_persists(tmp_path):
+    library = LibraryIndex(str(tmp_path / "library.sqlite"))
+    sound = make_sound(tmp_path)
+    library.put(sound, "a" * 40)
+    library.close()
+    library = LibraryIndex(str(tmp_path / "library.sqlite"))
+    assert library.get(sound.name).sha1 == "a" * 40
+    library.close()
@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+import asyncio
+import threading
+import pytest
+import importlib
+from seaplayer.codecs.AnySound import AnySound, render_scheduler
+
+# ! Vars
+module = importlib.import_module("seaplayer.codecs.AnySound")
+"""The module (the package of the codecs exports the class under the same name)."""
+
+# ! Fixtures
+@pytest.fixture
+def slow_synth(tmp_path, monkeypatch):
+    """A synthesizer that writes a part of the WAV and renders until it is killed, and the list of the WAV paths."""
+    synth = tmp_path / "synth"
+    synth.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, time\n"
+        "open(sys.argv[sys.argv.index('-F') + 1], 'wb').write(b'RIFF' + bytes(100))\n"
+        "time.sleep(30)\n"
+    )
+    synth.chmod(0o755)
+    midi = tmp_path / "sound.mid"
+    midi.write_bytes(b"MThd")
+    paths = []
+    mkstemp = module.mkstemp
+    def recording_mkstemp(*args, **kwargs):
+        fd, path = mkstemp(*args, **kwargs)
+        paths.append(path)
+        return fd, path
+    monkeypatch.setattr(module, "FLUID_SYNTH_PATH", str(synth))
+    monkeypatch.setattr(module, "mkstemp", recording_mkstemp)
+    monkeypatch.setattr(module, "getfp", lambda fp, filetype=None: (fp, False))
+    monkeypatch.setattr(AnySound, "midi_cache", None)
+    monkeypatch.setattr(AnySound, "midi_streaming", False)
+    return str(midi), paths
+
+def wait_running(path: str) -> None:
+    deadline = time.monotonic() + 5
+    while not any(t.name == path for t in render_scheduler.running):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    # * The synthesizer has been started and has written a part of the WAV
+    time.sleep(0.3)
+
+# ! Tests
+def test_from_midi_stopped_render(slow_synth):
+    midi, paths = slow_synth
+    errors = []
+    def render() -> None:
+        try:
+            AnySound.from_midi(midi, "sound_font.sf2")
+        except OSError as e:
+            errors.append(e)
+    thread = threading.Thread(target=render)
+    thread.start()
+    wait_running(midi)
+    render_scheduler.cancel(midi)
+    thread.join(10)
+    assert len(errors) == 1
+    assert (len(paths) == 1) and not os.path.exists(paths[0])
+
+def test_aio_from_midi_stopped_render(slow_synth):
+    midi, paths = slow_synth
+    async def run() -> None:
+        task = asyncio.create_task(AnySound.aio_from_midi(midi, "sound_font.sf2"))
+        await asyncio.to_thread(wait_running, midi)
+        render_scheduler.cancel(midi)
+        with pytest.raises(OSError):
+            await asyncio.wait_for(task, 10)
+    asyncio.run(run())
+    assert (len(paths) == 1) and not os.path.exists(paths[0])
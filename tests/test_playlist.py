@@ -0,0 +1,65 @@
+import asyncio
+from textual.app import App, ComposeResult
+from seaplayer.objects.PlayList import PlayListView
+
+# ! Classes
+class FakeSound:
+    codec_name = "WAVE"
+    duration, channels, samplerate, bitrate = 1.0, 2, 44100, 1411000
+    artist = None
+    
+    def __init__(self, index: int) -> None:
+        self.name = f"/music/sound-{index}.wav"
+        self.title = f"sound-{index}"
+        self.discarded = False
+    
+    def __namerepr__(self) -> str:
+        return self.name
+    
+    def discard(self) -> None:
+        self.discarded = True
+
+class PlayListApp(App):
+    def compose(self) -> ComposeResult:
+        yield PlayListView()
+
+# ! Functions
+def row_text(view: PlayListView, index: int) -> str:
+    """The title line of the row, if it is in the viewport."""
+    return view.render_line(index * view.ITEM_HEIGHT - view.scroll_offset.y).text
+
+# ! Tests
+def test_playlist_virtualized():
+    async def run() -> None:
+        app = PlayListApp()
+        async with app.run_test(size=(60, 20)) as pilot:
+            view = app.query_one(PlayListView)
+            sounds = [FakeSound(i) for i in range(30)]
+            await view.aio_add_sounds([(sound, f"sha1-{i}") for i, sound in enumerate(sounds)])
+            await pilot.pause()
+            # * Only the visible rows are rendered
+            assert view.virtual_size.height == 30 * view.ITEM_HEIGHT
+            assert row_text(view, 0).startswith("sound-0")
+            assert len(view.rendered_rows) <= (20 // view.ITEM_HEIGHT) + view.OVERSCAN + 1
+            # * The cursor moves below the viewport and the view follows it
+            view.focus()
+            for _ in range(10):
+                await pilot.press("down")
+            await pilot.pause()
+            assert view.index == 9
+            assert view.scroll_offset.y > 0
+            assert row_text(view, 9).startswith("sound-9")
+            assert max(view.rendered_rows) >= 9 and min(view.rendered_rows) > 0
+            await pilot.press("up")
+            await pilot.pause()
+            assert view.index == 8
+            # * The lookup by sha1 follows the removal
+            view.remove_sound("sha1-3")
+            await pilot.pause()
+            assert sounds[3].discarded and not view.exist_sha1("sha1-3")
+            assert view.index == 7
+            assert view.get_index_by_sha1("sha1-12") == 11
+            assert view.get_child_by_sha1("sha1-12").sound is sounds[12]
+            assert view.currect_sound is sounds[8]
+            assert row_text(view, 7).startswith("sound-8")
+    asyncio.run(run())
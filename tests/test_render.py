@@ -0,0 +1,75 @@
+import asyncio
+import time
+import pytest
+import threading
+from seaplayer.types.Render import RenderScheduler
+
+# ! Tests
+def test_render_scheduler_limits_workers():
+    scheduler = RenderScheduler(2)
+    tickets = [scheduler.submit(str(i)) for i in range(3)]
+    assert [t.done() for t in tickets] == [True, True, False]
+    scheduler.done(tickets[0])
+    assert tickets[2].done()
+
+def test_render_scheduler_prioritizes():
+    scheduler = RenderScheduler(1)
+    first = scheduler.submit("a")
+    second, third = scheduler.submit("b"), scheduler.submit("c")
+    scheduler.prioritize("c")
+    scheduler.done(first)
+    assert third.done() and not second.done()
+
+def test_render_scheduler_cancels():
+    scheduler = RenderScheduler(1)
+    first = scheduler.submit("a")
+    stopped = []
+    first.add_stop_callback(lambda: stopped.append("a"))
+    second = scheduler.submit("b")
+    scheduler.cancel("b")
+    scheduler.cancel("a")
+    assert second.cancelled() and (stopped == ["a"])
+
+def test_render_scheduler_slot_cancelled():
+    scheduler = RenderScheduler(1)
+    first = scheduler.submit("a")
+    errors = []
+    
+    def render() -> None:
+        try:
+            with scheduler.slot("b"): ...
+        except OSError as e:
+            errors.append(e)
+    
+    thread = threading.Thread(target=render)
+    thread.start()
+    while len(scheduler.waiting) == 0: time.sleep(0.01)
+    scheduler.cancel("b")
+    thread.join(5)
+    scheduler.done(first)
+    assert (len(errors) == 1) and (len(scheduler.running) == 0)
+
+def test_render_scheduler_aio_slot_cancellation():
+    scheduler = RenderScheduler(1)
+    first = scheduler.submit("a")
+    
+    async def render() -> None:
+        async with scheduler.aio_slot("b"): ...
+    
+    async def run() -> None:
+        # * The cancellation of the waiting task stays a cancellation
+        task = asyncio.create_task(render())
+        while len(scheduler.waiting) == 0: await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # * The cancellation by the scheduler is an error of the render
+        task = asyncio.create_task(render())
+        while len(scheduler.waiting) == 0: await asyncio.sleep(0.01)
+        scheduler.cancel("b")
+        with pytest.raises(OSError):
+            await task
+    
+    asyncio.run(run())
+    scheduler.done(first)
+    assert (len(scheduler.waiting) == 0) and (len(scheduler.running) == 0)
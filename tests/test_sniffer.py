@@ -0,0 +1,50 @@
+import wave
+from seaplayer.codecs import SignatureTable, codecs
+from seaplayer.codecs import MP3Codec, WAVECodec, FLACCodec, MIDICodec, URLSoundCodec, AnyCodec
+
+# ! Vars
+st = SignatureTable(codecs)
+
+# ! Functions
+def make_wave(path, seconds: float=0.5, samplerate: int=8000) -> str:
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(2)
+        file.setsampwidth(2)
+        file.setframerate(samplerate)
+        file.writeframes(b"\x00\x00" * 2 * int(seconds * samplerate))
+    return str(path)
+
+# ! Tests
+def test_sniffer_match():
+    assert st.match(b"ID3\x04\x00") == {MP3Codec}
+    assert st.match(b"RIFF\x24\x00\x00\x00WAVE") == {WAVECodec}
+    assert st.match(b"fLaC\x00") == {FLACCodec}
+    assert st.match(b"MThd\x00\x00\x00\x06") == {MIDICodec}
+
+def test_sniffer_not_match():
+    assert st.match(b"") == set()
+    assert st.match(None) == set()
+    assert st.match(b"IDX") == set()
+
+def test_sniffer_unsigned_codecs():
+    assert not st.is_signed(URLSoundCodec)
+    assert not st.is_signed(AnyCodec)
+
+def test_probe_does_not_open_sound(tmp_path, monkeypatch):
+    path = make_wave(tmp_path / "sound.wav")
+    def load_sound(self):
+        raise AssertionError("the sound is decoded")
+    monkeypatch.setattr(WAVECodec, "load_sound", load_sound)
+    codec = WAVECodec.from_probe(path)
+    assert isinstance(codec, WAVECodec)
+    assert not codec.prepared
+    assert abs(codec.duration - 0.5) < 0.01
+    assert (codec.channels, codec.samplerate) == (2, 8000)
+    assert codec.title is None
+
+def test_probe_unreadable(tmp_path):
+    path = tmp_path / "sound.wav"
+    path.write_bytes(b"RIFF....WAVE")
+    assert WAVECodec.from_probe(str(path)) is None
+    assert not URLSoundCodec.sound_probed
+    assert not MIDICodec.sound_probed
@@ -0,0 +1,39 @@
+import os
+import sys
+import subprocess
+from seaplayer.modules.startup import StartupProfiler, lazy, startup
+
+# ! Tests
+def test_lazy_attribute_created_once():
+    calls = []
+    class Holder:
+        @lazy
+        def value(cls) -> list:
+            calls.append(cls)
+            return [1]
+    assert calls == []
+    assert Holder.value is Holder().value
+    assert calls == [Holder]
+
+def test_startup_profiler_timeline():
+    profiler = StartupProfiler()
+    profiler.enable()
+    try:
+        with profiler.span("outer"):
+            with profiler.span("inner"):
+                import seaplayer.modules.colorizer
+        profiler.finish("first frame")
+    finally:
+        profiler.disable()
+    names = [(depth, kind, name) for _, _, depth, kind, name in profiler.events]
+    assert (0, "init", "outer") in names
+    assert (1, "init", "inner") in names
+    assert names[-1] == (0, "mark", "first frame")
+    assert not profiler.enabled
+    assert not startup.enabled
+
+def test_import_does_not_load_audio_stack():
+    code = "import sys, seaplayer.seaplayer; print(','.join(m for m in ('seaplayer.codecs', 'playsoundsimple', 'sounddevice', 'soundfile') if m in sys.modules))"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    assert result.stdout.strip() == ""
@@ -0,0 +1,75 @@
+import io
+import time
+import threading
+import importlib.metadata
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# * The streaming is checked against the real playsoundsimple (the pinned version) only
+try:
+    importlib.metadata.version("playsoundsimple-py")
+except importlib.metadata.PackageNotFoundError:
+    pytest.skip("playsoundsimple-py is not installed", allow_module_level=True)
+
+soundfile = pytest.importorskip("soundfile")
+np = pytest.importorskip("numpy")
+from seaplayer.codecs.AnySound import AnySound
+
+# ! Vars
+SAMPLERATE = 22050
+DURATION = 2.0
+CHUNK_SIZE = 4096
+
+def make_wav() -> bytes:
+    buffer = io.BytesIO()
+    soundfile.write(buffer, np.zeros(int(SAMPLERATE * DURATION), dtype=np.int16), SAMPLERATE, format="WAV")
+    return buffer.getvalue()
+
+DATA = make_wav()
+
+# ! Server
+class SlowHandler(BaseHTTPRequestHandler):
+    """Sends the sound slowly, so that it is still downloading while it starts playing."""
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, *args) -> None: ...
+    
+    def do_GET(self) -> None:
+        start = 0
+        if (value:=self.headers.get("Range")) is not None:
+            start = int(value.split("=")[1].split("-")[0])
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(DATA)-1}/{len(DATA)}")
+        else:
+            self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(DATA)-start))
+        self.end_headers()
+        try:
+            for offset in range(start, len(DATA), CHUNK_SIZE):
+                self.wfile.write(DATA[offset:offset+CHUNK_SIZE])
+                time.sleep(0.02)
+        except OSError:
+            pass
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    def handle_error(self, *args) -> None: ...
+
+@pytest.fixture(scope="module")
+def url():
+    server = Server(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/sound.wav"
+    server.shutdown()
+
+# ! Tests
+def test_sound_streamed_from_url(url, monkeypatch):
+    monkeypatch.setattr(AnySound, "url_prebuffer_size", 2 * CHUNK_SIZE)
+    monkeypatch.setattr(AnySound, "files_cache", None)
+    sound = AnySound.from_url(url)
+    # * The sound is opened from the download, not from a full copy of it
+    assert not sound.download.finished
+    assert sound.duration == pytest.approx(DURATION, abs=0.05)
+    sound.download.wait()
+    assert sound.download.finished
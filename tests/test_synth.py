@@ -0,0 +1,103 @@
+import io
+import os
+import sys
+import wave
+import shutil
+import importlib.metadata
+import struct
+import pytest
+from seaplayer.types.Render import RenderScheduler
+from seaplayer.types.Synth import SynthStream, midi_duration, wav_header
+
+# ! Functions
+def varlen(value: int) -> bytes:
+    data = bytes([value & 0x7F])
+    while (value:=value >> 7) > 0:
+        data = bytes([(value & 0x7F) | 0x80]) + data
+    return data
+
+def make_midi(tmp_path, events: bytes, division: int=480) -> str:
+    track = events + b"\x00\xFF\x2F\x00"
+    path = str(tmp_path / "sound.mid")
+    with open(path, "wb") as file:
+        file.write(b"MThd" + struct.pack(">IHHH", 6, 0, 1, division))
+        file.write(b"MTrk" + struct.pack(">I", len(track)) + track)
+    return path
+
+# ! Tests
+def test_midi_duration_default_tempo(tmp_path):
+    # * Two quarter notes at 120 BPM, the second one uses the running status
+    events = b"\x00\x90\x3C\x40" + varlen(480) + b"\x3C\x00" + varlen(480) + b"\x80\x3C\x00"
+    assert midi_duration(make_midi(tmp_path, events)) == pytest.approx(1.0)
+
+def test_midi_duration_tempo_change(tmp_path):
+    tempo = b"\xFF\x51\x03" + (1000000).to_bytes(3, "big")
+    events = b"\x00\x90\x3C\x40" + varlen(480) + tempo + varlen(960) + b"\x80\x3C\x00"
+    assert midi_duration(make_midi(tmp_path, events)) == pytest.approx(0.5 + 2.0)
+
+def test_midi_duration_not_midi(tmp_path):
+    path = tmp_path / "sound.bin"
+    path.write_bytes(b"RIFF" + bytes(32))
+    with pytest.raises(ValueError):
+        midi_duration(str(path))
+
+def test_wav_header(tmp_path):
+    path = tmp_path / "sound.wav"
+    path.write_bytes(wav_header(100, 44100) + bytes(400))
+    with wave.open(str(path), "rb") as file:
+        assert (file.getnframes(), file.getframerate(), file.getnchannels(), file.getsampwidth()) == (100, 44100, 2, 2)
+
+def test_synth_stream_pads_output(tmp_path):
+    synth = tmp_path / "synth"
+    synth.write_text(f"#!{sys.executable}\nimport sys\nsys.stdout.buffer.write(bytes([1]) * 1000)\n")
+    synth.chmod(0o755)
+    events = b"\x00\x90\x3C\x40" + varlen(480) + b"\x80\x3C\x00"
+    scheduler = RenderScheduler(1)
+    with SynthStream(make_midi(tmp_path, events), "", str(synth), samplerate=8000, scheduler=scheduler) as stream:
+        data = stream.read()
+        assert len(data) == stream.length == 44 + round(stream.duration * 8000) * 4
+        assert data[44:1044] == bytes([1]) * 1000
+        assert data[1044:] == bytes(len(data) - 1044)
+        stream.thread.join(5)
+    assert len(scheduler.running) == 0
+
+# ! Integration Tests (a real synthesizer and sound font)
+def real_sound_font() -> str:
+    if shutil.which("fluidsynth") is None:
+        pytest.skip("fluidsynth is not installed")
+    path = os.environ.get("SEAPLAYER_TEST_SOUND_FONT")
+    if path is None:
+        try:
+            importlib.metadata.version("playsoundsimple-py")
+        except importlib.metadata.PackageNotFoundError:
+            pytest.skip("no sound font: set SEAPLAYER_TEST_SOUND_FONT or install playsoundsimple-py")
+        from playsoundsimple.units import DEFAULT_SOUND_FONTS_PATH
+        path = DEFAULT_SOUND_FONTS_PATH
+    if not os.path.isfile(path):
+        pytest.skip(f"the sound font does not exist: {path}")
+    return path
+
+def test_synth_stream_real_fluidsynth(tmp_path):
+    soundfile = pytest.importorskip("soundfile")
+    sound_font = real_sound_font()
+    events = b"\x00\x90\x3C\x64" + varlen(960) + b"\x80\x3C\x00"
+    with SynthStream(make_midi(tmp_path, events), sound_font) as stream:
+        data, samplerate = soundfile.read(io.BytesIO(stream.read()), dtype="int16")
+    assert samplerate == 44100
+    assert data.shape == (stream.frames, 2)
+    # * The synthesizer has actually played the note
+    assert abs(data).max() > 0
+
+def test_sound_streamed_from_midi(tmp_path):
+    sound_font = real_sound_font()
+    try:
+        importlib.metadata.version("playsoundsimple-py")
+    except importlib.metadata.PackageNotFoundError:
+        pytest.skip("playsoundsimple-py is not installed")
+    from seaplayer.codecs.AnySound import AnySound
+    events = b"\x00\x90\x3C\x64" + varlen(960) + b"\x80\x3C\x00"
+    sound = AnySound.stream_midi(make_midi(tmp_path, events), sound_font)
+    # * The sound is opened from the stream, while the synthesizer renders it
+    assert sound.duration == pytest.approx(sound.synth.duration, abs=0.05)
+    sound.synth.thread.join(30)
+    assert sound.synth.finished
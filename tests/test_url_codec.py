@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+from seaplayer.codecs.URLS import URLSoundCodec
+
+# ! Classes
+class TrackCodec(URLSoundCodec):
+    """A codec like the VK one: the URL of the sound is temporary, so `name` is empty and the sound is identified by the track."""
+    def __init__(self, track_id: int) -> None:
+        self.track_id = track_id
+        super().__init__(f"https://cdn.example/{track_id}.mp3?token=temporary", aio_init=True)
+        self.name = ""
+    
+    @property
+    def identity_key(self) -> str:
+        return f"track://{self.track_id}"
+
+# ! Tests
+def test_url_codec_identity_is_stable():
+    codec = URLSoundCodec("https://example.com/sound.mp3", aio_init=True)
+    sha1 = codec.__sha1__(65536)
+    # * Downloading, downloaded and cached sounds keep the same identity
+    for sound in (
+        SimpleNamespace(download=SimpleNamespace(finished=False, path="/nonexistent"), cache_entry=None),
+        SimpleNamespace(download=SimpleNamespace(finished=True, path="/nonexistent"), cache_entry=None),
+        SimpleNamespace(download=None, cache_entry=SimpleNamespace(sha1="0" * 40)),
+    ):
+        codec._sound = sound
+        assert codec.__sha1__(65536) == sha1
+    assert URLSoundCodec("https://example.com/other.mp3", aio_init=True).__sha1__(65536) != sha1
+
+def test_url_codec_identity_without_name():
+    first, second = TrackCodec(1), TrackCodec(2)
+    assert first.name == second.name == ""
+    assert first.__sha1__(65536) != second.__sha1__(65536)
+    assert first.__sha1__(65536) == TrackCodec(1).__sha1__(65536)
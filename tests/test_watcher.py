@@ -0,0 +1,70 @@
+import time
+from seaplayer.types import PlaybackWatcher
+
+# ! Classes
+class FakePlayback:
+    """The playback of a sound of `duration` seconds on the real clock."""
+    def __init__(self, duration: float) -> None:
+        self.end = time.monotonic() + duration
+        self.paused_remaining = None
+        self.calls = []
+        self.watcher = PlaybackWatcher(self.get_remaining, self.is_playing)
+        self.watcher.add_callback(lambda: self.calls.append("end"))
+    
+    def get_remaining(self) -> float:
+        if self.paused_remaining is not None:
+            return self.paused_remaining
+        return max(0.0, self.end - time.monotonic())
+    
+    def is_playing(self) -> bool:
+        return (self.paused_remaining is None) and (self.get_remaining() > 0)
+    
+    def pause(self) -> None:
+        self.paused_remaining = self.get_remaining()
+        self.watcher.stop()
+    
+    def unpause(self) -> None:
+        self.end, self.paused_remaining = time.monotonic() + self.paused_remaining, None
+        self.watcher.start()
+    
+    def seek(self, remaining: float) -> None:
+        self.end = time.monotonic() + remaining
+        self.watcher.start()
+
+# ! Tests
+def test_watcher_fires_once_at_end():
+    playback = FakePlayback(0.05)
+    near_end = []
+    playback.watcher.add_callback(lambda: near_end.append(time.monotonic()), before=0.03)
+    playback.watcher.start()
+    time.sleep(0.3)
+    assert playback.calls == ["end"]
+    assert len(near_end) == 1
+
+def test_watcher_does_not_fire_after_stop():
+    playback = FakePlayback(0.05)
+    playback.watcher.start()
+    playback.watcher.stop()
+    time.sleep(0.2)
+    assert playback.calls == []
+
+def test_watcher_does_not_fire_while_paused():
+    playback = FakePlayback(0.1)
+    playback.watcher.start()
+    playback.pause()
+    time.sleep(0.25)
+    assert playback.calls == []
+    playback.unpause()
+    time.sleep(0.3)
+    assert playback.calls == ["end"]
+
+def test_watcher_rearmed_after_seek():
+    playback = FakePlayback(0.1)
+    playback.watcher.start()
+    time.sleep(0.03)
+    playback.seek(0.3)
+    time.sleep(0.15)
+    # * The end has moved, the old timer does not fire
+    assert playback.calls == []
+    time.sleep(0.35)
+    assert playback.calls == ["end"]